@@ -0,0 +1,193 @@
+"""외부 서비스 호출용 차단기(CircuitBreaker)와 재시도 예산(RetryBudget)."""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 호출하지 않고 실패함"""
+
+    def __init__(self, retry_after_seconds: float):
+        super().__init__("circuit is open")
+        self.retry_after_seconds = retry_after_seconds
+
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold에 도달하면 open 되어 recovery_seconds 동안 호출 없이 즉시 실패합니다.
+
+    이후 half-open 상태에서 half_open_max_calls개의 시험 호출만 보내고, 성공하면 closed, 실패하면 다시 open 합니다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        recovery_seconds: float,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """생성자
+
+        Args:
+            failure_threshold: open 전환까지 허용하는 연속 실패 수
+            recovery_seconds: open 후 시험 호출을 보내기까지 기다리는 시간(초)
+            half_open_max_calls: half-open 상태에서 동시에 보낼 수 있는 시험 호출 수
+            clock: 시간 함수 (테스트용)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._rejected = 0
+        self._opened_count = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def before_call(self) -> None:
+        """호출 전에 확인합니다. 보낼 수 없으면 CircuitOpenError"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._half_open_in_flight < self.half_open_max_calls:
+                self._state = HALF_OPEN
+                self._half_open_in_flight += 1
+                return
+            self._rejected += 1
+            raise CircuitOpenError(self._retry_after())
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state != CLOSED:
+                self._state = CLOSED
+                self._half_open_in_flight = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self._opened_count += 1
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._half_open_in_flight = 0
+
+    def release(self) -> None:
+        """성공/실패를 판정하지 못하고 끝난 호출(예: 요청을 만들다 난 예외)의 half-open 시험 슬롯을 반환합니다."""
+        with self._lock:
+            if self._state == HALF_OPEN and self._half_open_in_flight > 0:
+                self._half_open_in_flight -= 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._consecutive_failures = 0
+            self._half_open_in_flight = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            state = self._current_state()
+            return {
+                "state": state,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "recovery_seconds": self.recovery_seconds,
+                "retry_after_seconds": round(self._retry_after(), 3) if state == OPEN else 0.0,
+                "opened_count": self._opened_count,
+                "rejected": self._rejected,
+            }
+
+    def _current_state(self) -> str:
+        # open 후 recovery_seconds가 지나면 half-open (첫 시험 호출이 before_call에서 상태를 확정)
+        if self._state == OPEN and self._clock() - self._opened_at >= self.recovery_seconds:
+            return HALF_OPEN
+        return self._state
+
+    def _retry_after(self) -> float:
+        if self._state != OPEN:
+            # half-open 시험 호출이 진행 중이면 곧 결과가 나오므로 짧게 안내
+            return min(1.0, self.recovery_seconds)
+        return max(self.recovery_seconds - (self._clock() - self._opened_at), 0.0)
+
+
+class RetryBudget:
+    """요청 1건마다 ratio만큼 재시도 토큰이 쌓이고 재시도 1회마다 1개를 씁니다. (초당 min_per_second는 기본 보장)
+
+    장애 중에도 재시도가 전체 요청의 ratio 비율을 넘지 않습니다.
+    """
+
+    def __init__(
+        self,
+        ratio: float,
+        min_per_second: float,
+        max_tokens: float = 100.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """생성자
+
+        Args:
+            ratio: 요청 1건당 적립되는 재시도 수 (0.2면 재시도는 요청의 20% 이내)
+            min_per_second: 요청이 적을 때도 허용하는 초당 재시도 수
+            max_tokens: 적립 상한
+            clock: 시간 함수 (테스트용)
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = min_per_second
+        self._updated_at = clock()
+        self._retries = 0
+        self._exhausted = 0
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens + self.ratio, self.max_tokens)
+
+    def try_spend(self) -> bool:
+        """재시도 1회를 쓸 수 있으면 True"""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                self._exhausted += 1
+                return False
+            self._tokens -= 1
+            self._retries += 1
+            return True
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            self._refill()
+            return {
+                "tokens": round(self._tokens, 2),
+                "ratio": self.ratio,
+                "retries": self._retries,
+                "exhausted": self._exhausted,
+            }
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._tokens + (now - self._updated_at) * self.min_per_second, self.max_tokens)
+        self._updated_at = now
+
+
+def jittered_backoff(attempt: int, base_seconds: float, max_seconds: float) -> float:
+    """attempt번째 재시도 전 대기 시간: 0 ~ min(max, base * 2^(attempt-1)) 사이 임의 값"""
+    return random.uniform(0, min(base_seconds * (2 ** max(attempt - 1, 0)), max_seconds))
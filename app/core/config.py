@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import Literal
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, ConfigDict, Field
@@ -26,6 +27,12 @@ def _parse_origins(raw_value: str | None, default: list[str]) -> list[str]:
     return origins or default
 
 
+def _parse_names(raw_value: str | None) -> list[str]:
+    if not raw_value:
+        return []
+    return [name.strip() for name in raw_value.split(",") if name.strip()]
+
+
 class Config(BaseModel):
     """환경 변수를 관리하는 설정 모델."""
 
@@ -39,9 +46,49 @@ class Config(BaseModel):
     ENV: str = Field(default="development")
     DEBUG: bool = Field(default=True)
     DATABASE_URL: str
+    DATABASE_ASYNC_ENABLED: bool = Field(default=True)
+    DATABASE_ASYNC_URL: str | None = Field(default=None)
+    DATABASE_READ_URL: str | None = Field(default=None)
+    DATABASE_ASYNC_READ_URL: str | None = Field(default=None)
+    DATABASE_POOL_SIZE: int = Field(default=5, ge=1)
+    DATABASE_MAX_OVERFLOW: int = Field(default=10, ge=0)
+    DATABASE_POOL_TIMEOUT_SECONDS: float = Field(default=30.0, gt=0)
+    DATABASE_POOL_RECYCLE_SECONDS: int = Field(default=1800)  # -1이면 재활용 안 함
+    DATABASE_POOL_PRE_PING: bool = Field(default=True)
+    SQLITE_PROFILE_ENABLED: bool = Field(default=True)
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(default="NORMAL")
+    SQLITE_MMAP_SIZE: int = Field(default=256 * 1024 * 1024, ge=0)
+    SQLITE_CACHE_SIZE: int = Field(default=-20000)  # 음수면 KiB 단위
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(default=5000, ge=0)
+    SQLITE_READ_POOL_SIZE: int = Field(default=4, ge=1)
+    SQLITE_WRITE_TIMEOUT_SECONDS: float = Field(default=30.0, gt=0)
     SECRET_KEY: str = Field(default="mysecretkey")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30)
+    AUTH_IDENTITY_CACHE_SIZE: int = Field(default=10000)
+    AUTH_IDENTITY_CACHE_TTL_SECONDS: int = Field(default=60)
+    PASSWORD_HASH_ROUNDS: int = Field(default=12, ge=4, le=31)
+    PASSWORD_HASH_WORKERS: int = Field(default=4, ge=1)
+    PASSWORD_HASH_QUEUE_LIMIT: int = Field(default=64, ge=1)
     CORS_ALLOWED_ORIGINS: list[str] = Field(default_factory=lambda: ["http://localhost:3000"])
+    CSV_DIRECTORY: str = Field(default="csv_files")
+    CSV_PARSE_WORKERS: int = Field(default=4, ge=1)
+    CSV_SYNC_DELETE_MISSING: bool = Field(default=False)
+    CSV_SYNC_BATCH_SIZE: int = Field(default=500, ge=1)
+    CSV_IMPORT_CHUNK_SIZE: int = Field(default=5000, ge=1)
+    CSV_IMPORT_MAX_ERRORS: int = Field(default=100, ge=0)
+    CSV_RELOAD_DEBOUNCE_SECONDS: float = Field(default=1.0, ge=0)
+    CSV_LEADER_ELECTION_ENABLED: bool = Field(default=True)
+    CSV_LEADER_LOCK_PATH: str
+    CATALOG_VERSION_POLL_SECONDS: float = Field(default=2.0, gt=0)
+    CATALOG_SNAPSHOT_ENABLED: bool = Field(default=True)
+    CATALOG_SNAPSHOT_PATH: str
+    GRADING_SIMILARITY_MODE: Literal["levenshtein", "compat"] = Field(default="compat")
+    GRADING_VERDICT_CACHE_SIZE: int = Field(default=10000)
+    GRADING_VERDICT_CACHE_TTL_SECONDS: int = Field(default=3600)
+    RANKING_CONSISTENCY_CHECK_ENABLED: bool = Field(default=True)
+    RANKING_CONSISTENCY_CHECK_ALLOWED_USERS: list[str] = Field(default_factory=list)
+    RANKING_LEADERBOARD_REFRESH_SECONDS: float = Field(default=30.0, ge=0)
+    METRICS_ALLOWED_USERS: list[str] = Field(default_factory=list)
     FCM_TEST_PROXY_ENABLED: bool = Field(default=True)
     TVCF_NOTIFICATION_BASE_URL: str = Field(default="http://127.0.0.1:8001")
     TVCF_NOTIFICATION_DEVICE_PATH: str = Field(default="/v1/devices")
@@ -50,9 +97,33 @@ class Config(BaseModel):
     TVCF_NOTIFICATION_SEND_DEFINITION_PATH: str = Field(default="/v1/messages:sendDefinition")
     TVCF_NOTIFICATION_AUTH_TOKEN: str | None = Field(default=None)
     TVCF_NOTIFICATION_USER_AGENT: str = Field(default="CodingQuiz-FCM-Test/1.0")
-    TVCF_NOTIFICATION_TIMEOUT_SECONDS: int = Field(default=10)
+    TVCF_NOTIFICATION_TIMEOUT_SECONDS: int = Field(default=10)  # 응답 대기(read) 제한
+    TVCF_NOTIFICATION_CONNECT_TIMEOUT_SECONDS: float = Field(default=3.0, gt=0)
+    TVCF_NOTIFICATION_POOL_SIZE: int = Field(default=10, ge=1)  # 호스트별 keep-alive 연결 수
+    TVCF_NOTIFICATION_MAX_CONCURRENCY: int = Field(default=8, ge=1)  # 동시에 나가는 호출 수 (전용 스레드 수)
+    TVCF_NOTIFICATION_QUEUE_LIMIT: int = Field(default=32, ge=1)  # 초과 시 503으로 즉시 거절
+    TVCF_NOTIFICATION_BREAKER_FAILURE_THRESHOLD: int = Field(default=5, ge=1)  # 연속 실패 시 차단(open)
+    TVCF_NOTIFICATION_BREAKER_RECOVERY_SECONDS: float = Field(default=30.0, gt=0)  # open 후 시험 호출까지 대기
+    TVCF_NOTIFICATION_BREAKER_HALF_OPEN_MAX_CALLS: int = Field(default=1, ge=1)  # half-open 시험 호출 수
+    TVCF_NOTIFICATION_MAX_RETRIES: int = Field(default=2, ge=0)  # 요청당 최대 재시도 횟수
+    TVCF_NOTIFICATION_RETRY_BACKOFF_BASE_SECONDS: float = Field(default=0.1, ge=0)
+    TVCF_NOTIFICATION_RETRY_BACKOFF_MAX_SECONDS: float = Field(default=1.0, ge=0)
+    TVCF_NOTIFICATION_RETRY_BUDGET_RATIO: float = Field(default=0.2, ge=0)  # 재시도는 요청 수의 20% 이내
+    TVCF_NOTIFICATION_RETRY_BUDGET_MIN_PER_SECOND: float = Field(default=1.0, ge=0)
+    TVCF_NOTIFICATION_BULK_CONCURRENCY: int = Field(default=4, ge=1)  # 일괄 발송 기본 동시 호출 수
+    TVCF_NOTIFICATION_BULK_MAX_RECIPIENTS: int = Field(default=1000, ge=1)  # 요청당 최대 수신자 수
+    TVCF_NOTIFICATION_BULK_DEDUP_WINDOW_SECONDS: float = Field(default=300.0, ge=0)  # 같은 (user, template) 재발송 차단
+    TVCF_NOTIFICATION_BULK_DEDUP_MAX_SIZE: int = Field(default=100_000, ge=0)
+    NOTIFICATION_OUTBOX_DISPATCHER_ENABLED: bool = Field(default=True)  # 이 프로세스에서 outbox 발송 여부
+    NOTIFICATION_OUTBOX_BATCH_SIZE: int = Field(default=50, ge=1)  # 한 번에 꺼내는 행 수
+    NOTIFICATION_OUTBOX_POLL_SECONDS: float = Field(default=1.0, gt=0)  # 대기열 확인 주기
+    NOTIFICATION_OUTBOX_MAX_ATTEMPTS: int = Field(default=6, ge=1)  # 초과 시 dead 처리
+    NOTIFICATION_OUTBOX_BACKOFF_BASE_SECONDS: float = Field(default=2.0, gt=0)  # 재시도 간격 = base * 2^(시도-1)
+    NOTIFICATION_OUTBOX_BACKOFF_MAX_SECONDS: float = Field(default=300.0, gt=0)  # 재시도 간격 상한
+    NOTIFICATION_OUTBOX_LEASE_SECONDS: float = Field(default=60.0, gt=0)  # 발송 중 점유 시간 (프로세스 중단 시 재시도)
     FCM_TEST_TEMPLATE_CODE: str | None = Field(default=None)
     FCM_TEST_DEFINITION_CODE: str | None = Field(default=None)
+    FCM_TEST_BULK_ALLOWED_USERS: list[str] = Field(default_factory=list)
 
 
 def load_config() -> Config:
@@ -67,19 +138,63 @@ def load_config() -> Config:
     default_origins = [] if is_production else ["http://localhost:3000"]
     cors_allowed_origins = _parse_origins(os.getenv("CORS_ALLOWED_ORIGINS"), default_origins)
     fcm_test_proxy_enabled = _parse_bool(os.getenv("FCM_TEST_PROXY_ENABLED"), default=not is_production)
+    ranking_consistency_check_enabled = _parse_bool(
+        os.getenv("RANKING_CONSISTENCY_CHECK_ENABLED"),
+        default=not is_production,
+    )
 
     return Config(
         BACKEND_HOST=os.getenv("BACKEND_HOST", "0.0.0.0"),
-        BACKEND_PORT=os.getenv("BACKEND_PORT", 8000),
+        BACKEND_PORT=os.getenv("BACKEND_PORT", "8000"),
         DATABASE_PATH=database_path,
         DATABASE_URL_DEV=database_url_dev,
         DATABASE_URL_PROD=database_url_prod,
         ENV=env,
         DEBUG=debug,
         DATABASE_URL=database_url,
+        DATABASE_ASYNC_ENABLED=_parse_bool(os.getenv("DATABASE_ASYNC_ENABLED"), default=True),
+        DATABASE_ASYNC_URL=os.getenv("DATABASE_ASYNC_URL") or None,
+        DATABASE_READ_URL=os.getenv("DATABASE_READ_URL") or None,
+        DATABASE_ASYNC_READ_URL=os.getenv("DATABASE_ASYNC_READ_URL") or None,
+        DATABASE_POOL_SIZE=int(os.getenv("DATABASE_POOL_SIZE", "5")),
+        DATABASE_MAX_OVERFLOW=int(os.getenv("DATABASE_MAX_OVERFLOW", "10")),
+        DATABASE_POOL_TIMEOUT_SECONDS=float(os.getenv("DATABASE_POOL_TIMEOUT_SECONDS", "30.0")),
+        DATABASE_POOL_RECYCLE_SECONDS=int(os.getenv("DATABASE_POOL_RECYCLE_SECONDS", "1800")),
+        DATABASE_POOL_PRE_PING=_parse_bool(os.getenv("DATABASE_POOL_PRE_PING"), default=True),
+        SQLITE_PROFILE_ENABLED=_parse_bool(os.getenv("SQLITE_PROFILE_ENABLED"), default=True),
+        SQLITE_SYNCHRONOUS=os.getenv("SQLITE_SYNCHRONOUS", "NORMAL").strip().upper(),
+        SQLITE_MMAP_SIZE=int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+        SQLITE_CACHE_SIZE=int(os.getenv("SQLITE_CACHE_SIZE", "-20000")),
+        SQLITE_BUSY_TIMEOUT_MS=int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        SQLITE_READ_POOL_SIZE=int(os.getenv("SQLITE_READ_POOL_SIZE", "4")),
+        SQLITE_WRITE_TIMEOUT_SECONDS=float(os.getenv("SQLITE_WRITE_TIMEOUT_SECONDS", "30.0")),
         SECRET_KEY=os.getenv("SECRET_KEY", "mysecretkey"),
-        ACCESS_TOKEN_EXPIRE_MINUTES=os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30),
+        ACCESS_TOKEN_EXPIRE_MINUTES=os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"),
+        AUTH_IDENTITY_CACHE_SIZE=int(os.getenv("AUTH_IDENTITY_CACHE_SIZE", "10000")),
+        AUTH_IDENTITY_CACHE_TTL_SECONDS=int(os.getenv("AUTH_IDENTITY_CACHE_TTL_SECONDS", "60")),
+        PASSWORD_HASH_ROUNDS=int(os.getenv("PASSWORD_HASH_ROUNDS", "12")),
+        PASSWORD_HASH_WORKERS=int(os.getenv("PASSWORD_HASH_WORKERS", "4")),
+        PASSWORD_HASH_QUEUE_LIMIT=int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "64")),
         CORS_ALLOWED_ORIGINS=cors_allowed_origins,
+        CSV_DIRECTORY=os.getenv("CSV_DIRECTORY", "csv_files"),
+        CSV_PARSE_WORKERS=int(os.getenv("CSV_PARSE_WORKERS", str(min(4, os.cpu_count() or 1)))),
+        CSV_SYNC_DELETE_MISSING=_parse_bool(os.getenv("CSV_SYNC_DELETE_MISSING"), default=False),
+        CSV_SYNC_BATCH_SIZE=int(os.getenv("CSV_SYNC_BATCH_SIZE", "500")),
+        CSV_IMPORT_CHUNK_SIZE=int(os.getenv("CSV_IMPORT_CHUNK_SIZE", "5000")),
+        CSV_IMPORT_MAX_ERRORS=int(os.getenv("CSV_IMPORT_MAX_ERRORS", "100")),
+        CSV_RELOAD_DEBOUNCE_SECONDS=float(os.getenv("CSV_RELOAD_DEBOUNCE_SECONDS", "1.0")),
+        CSV_LEADER_ELECTION_ENABLED=_parse_bool(os.getenv("CSV_LEADER_ELECTION_ENABLED"), default=True),
+        CSV_LEADER_LOCK_PATH=os.getenv("CSV_LEADER_LOCK_PATH", str(BASE_DIR / "csv_listener.lock")),
+        CATALOG_VERSION_POLL_SECONDS=float(os.getenv("CATALOG_VERSION_POLL_SECONDS", "2.0")),
+        CATALOG_SNAPSHOT_ENABLED=_parse_bool(os.getenv("CATALOG_SNAPSHOT_ENABLED"), default=True),
+        CATALOG_SNAPSHOT_PATH=os.getenv("CATALOG_SNAPSHOT_PATH", str(BASE_DIR / "catalog.snapshot")),
+        GRADING_SIMILARITY_MODE=os.getenv("GRADING_SIMILARITY_MODE", "compat").strip().lower(),
+        GRADING_VERDICT_CACHE_SIZE=int(os.getenv("GRADING_VERDICT_CACHE_SIZE", "10000")),
+        GRADING_VERDICT_CACHE_TTL_SECONDS=int(os.getenv("GRADING_VERDICT_CACHE_TTL_SECONDS", "3600")),
+        RANKING_CONSISTENCY_CHECK_ENABLED=ranking_consistency_check_enabled,
+        RANKING_CONSISTENCY_CHECK_ALLOWED_USERS=_parse_names(os.getenv("RANKING_CONSISTENCY_CHECK_ALLOWED_USERS")),
+        RANKING_LEADERBOARD_REFRESH_SECONDS=float(os.getenv("RANKING_LEADERBOARD_REFRESH_SECONDS", "30.0")),
+        METRICS_ALLOWED_USERS=_parse_names(os.getenv("METRICS_ALLOWED_USERS")),
         FCM_TEST_PROXY_ENABLED=fcm_test_proxy_enabled,
         TVCF_NOTIFICATION_BASE_URL=os.getenv("TVCF_NOTIFICATION_BASE_URL", "http://127.0.0.1:8001"),
         TVCF_NOTIFICATION_DEVICE_PATH=os.getenv("TVCF_NOTIFICATION_DEVICE_PATH", "/v1/devices"),
@@ -94,9 +209,47 @@ def load_config() -> Config:
         ),
         TVCF_NOTIFICATION_AUTH_TOKEN=os.getenv("TVCF_NOTIFICATION_AUTH_TOKEN"),
         TVCF_NOTIFICATION_USER_AGENT=os.getenv("TVCF_NOTIFICATION_USER_AGENT", "CodingQuiz-FCM-Test/1.0"),
-        TVCF_NOTIFICATION_TIMEOUT_SECONDS=int(os.getenv("TVCF_NOTIFICATION_TIMEOUT_SECONDS", 10)),
+        TVCF_NOTIFICATION_TIMEOUT_SECONDS=int(os.getenv("TVCF_NOTIFICATION_TIMEOUT_SECONDS", "10")),
+        TVCF_NOTIFICATION_CONNECT_TIMEOUT_SECONDS=float(os.getenv("TVCF_NOTIFICATION_CONNECT_TIMEOUT_SECONDS", "3.0")),
+        TVCF_NOTIFICATION_POOL_SIZE=int(os.getenv("TVCF_NOTIFICATION_POOL_SIZE", "10")),
+        TVCF_NOTIFICATION_MAX_CONCURRENCY=int(os.getenv("TVCF_NOTIFICATION_MAX_CONCURRENCY", "8")),
+        TVCF_NOTIFICATION_QUEUE_LIMIT=int(os.getenv("TVCF_NOTIFICATION_QUEUE_LIMIT", "32")),
+        TVCF_NOTIFICATION_BREAKER_FAILURE_THRESHOLD=int(os.getenv("TVCF_NOTIFICATION_BREAKER_FAILURE_THRESHOLD", "5")),
+        TVCF_NOTIFICATION_BREAKER_RECOVERY_SECONDS=float(
+            os.getenv("TVCF_NOTIFICATION_BREAKER_RECOVERY_SECONDS", "30.0")
+        ),
+        TVCF_NOTIFICATION_BREAKER_HALF_OPEN_MAX_CALLS=int(
+            os.getenv("TVCF_NOTIFICATION_BREAKER_HALF_OPEN_MAX_CALLS", "1")
+        ),
+        TVCF_NOTIFICATION_MAX_RETRIES=int(os.getenv("TVCF_NOTIFICATION_MAX_RETRIES", "2")),
+        TVCF_NOTIFICATION_RETRY_BACKOFF_BASE_SECONDS=float(
+            os.getenv("TVCF_NOTIFICATION_RETRY_BACKOFF_BASE_SECONDS", "0.1")
+        ),
+        TVCF_NOTIFICATION_RETRY_BACKOFF_MAX_SECONDS=float(
+            os.getenv("TVCF_NOTIFICATION_RETRY_BACKOFF_MAX_SECONDS", "1.0")
+        ),
+        TVCF_NOTIFICATION_RETRY_BUDGET_RATIO=float(os.getenv("TVCF_NOTIFICATION_RETRY_BUDGET_RATIO", "0.2")),
+        TVCF_NOTIFICATION_RETRY_BUDGET_MIN_PER_SECOND=float(
+            os.getenv("TVCF_NOTIFICATION_RETRY_BUDGET_MIN_PER_SECOND", "1.0")
+        ),
+        TVCF_NOTIFICATION_BULK_CONCURRENCY=int(os.getenv("TVCF_NOTIFICATION_BULK_CONCURRENCY", "4")),
+        TVCF_NOTIFICATION_BULK_MAX_RECIPIENTS=int(os.getenv("TVCF_NOTIFICATION_BULK_MAX_RECIPIENTS", "1000")),
+        TVCF_NOTIFICATION_BULK_DEDUP_WINDOW_SECONDS=float(
+            os.getenv("TVCF_NOTIFICATION_BULK_DEDUP_WINDOW_SECONDS", "300.0")
+        ),
+        TVCF_NOTIFICATION_BULK_DEDUP_MAX_SIZE=int(os.getenv("TVCF_NOTIFICATION_BULK_DEDUP_MAX_SIZE", "100000")),
+        NOTIFICATION_OUTBOX_DISPATCHER_ENABLED=_parse_bool(
+            os.getenv("NOTIFICATION_OUTBOX_DISPATCHER_ENABLED"), default=True
+        ),
+        NOTIFICATION_OUTBOX_BATCH_SIZE=int(os.getenv("NOTIFICATION_OUTBOX_BATCH_SIZE", "50")),
+        NOTIFICATION_OUTBOX_POLL_SECONDS=float(os.getenv("NOTIFICATION_OUTBOX_POLL_SECONDS", "1.0")),
+        NOTIFICATION_OUTBOX_MAX_ATTEMPTS=int(os.getenv("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", "6")),
+        NOTIFICATION_OUTBOX_BACKOFF_BASE_SECONDS=float(os.getenv("NOTIFICATION_OUTBOX_BACKOFF_BASE_SECONDS", "2.0")),
+        NOTIFICATION_OUTBOX_BACKOFF_MAX_SECONDS=float(os.getenv("NOTIFICATION_OUTBOX_BACKOFF_MAX_SECONDS", "300.0")),
+        NOTIFICATION_OUTBOX_LEASE_SECONDS=float(os.getenv("NOTIFICATION_OUTBOX_LEASE_SECONDS", "60.0")),
         FCM_TEST_TEMPLATE_CODE=os.getenv("FCM_TEST_TEMPLATE_CODE"),
         FCM_TEST_DEFINITION_CODE=os.getenv("FCM_TEST_DEFINITION_CODE"),
+        FCM_TEST_BULK_ALLOWED_USERS=_parse_names(os.getenv("FCM_TEST_BULK_ALLOWED_USERS")),
     )
 
 
@@ -0,0 +1,131 @@
+"""CSV 행 스트림을 chunk_size 행마다 커밋하며 반영하는 도구. (`ShardedCatalogSync`가 사용)"""
+
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from .csv_sync import QuizRecord, RowError, SyncResult, sync_quizzes
+
+
+@dataclass
+class ImportReport:
+    source: str
+    status: str = "running"  # running | completed | failed
+    started_at: datetime = field(default_factory=datetime.now)
+    finished_at: datetime | None = None
+    rows_read: int = 0  # 유효한 행 수
+    chunks_committed: int = 0
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    error_count: int = 0
+    errors: list[RowError] = field(default_factory=list)
+    failure: str | None = None
+    max_errors: int = 100
+    _started_clock: float = field(default_factory=time.monotonic, repr=False)
+    _finished_clock: float | None = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+    def add_error(self, error: RowError) -> None:
+        with self._lock:
+            self.error_count += 1
+            if len(self.errors) < self.max_errors:
+                self.errors.append(error)
+
+    def add_errors(self, errors: Iterable[RowError], error_count: int) -> None:
+        """다른 곳(워커 프로세스)에서 모은 오류를 합칩니다. error_count는 모으지 않고 센 오류까지 포함한 개수"""
+        with self._lock:
+            self.error_count += error_count
+            self.errors.extend(islice(errors, max(self.max_errors - len(self.errors), 0)))
+
+    def add_chunk(self, rows: int, result: SyncResult) -> None:
+        with self._lock:
+            self.rows_read += rows
+            self.chunks_committed += 1
+            self.inserted += result.inserted
+            self.updated += result.updated
+            self.unchanged += result.unchanged
+
+    def finish(self, failure: str | None = None) -> None:
+        with self._lock:
+            self.status = "failed" if failure else "completed"
+            self.failure = failure
+            self.finished_at = datetime.now()
+            self._finished_clock = time.monotonic()
+
+    def snapshot(self) -> dict[str, Any]:
+        """진행 상황을 dict로 반환합니다. (API 응답용)"""
+        with self._lock:
+            elapsed = (self._finished_clock or time.monotonic()) - self._started_clock
+            return {
+                "source": self.source,
+                "status": self.status,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "elapsed_seconds": round(elapsed, 3),
+                "rows_read": self.rows_read,
+                "rows_per_second": round(self.rows_read / elapsed, 1) if elapsed > 0 else 0.0,
+                "chunks_committed": self.chunks_committed,
+                "inserted": self.inserted,
+                "updated": self.updated,
+                "deleted": self.deleted,
+                "unchanged": self.unchanged,
+                "error_count": self.error_count,
+                "errors": [
+                    {"source": e.source, "row": e.row, "reason": e.reason, "value": e.value} for e in self.errors
+                ],
+                "failure": self.failure,
+            }
+
+
+_current_report: ImportReport | None = None
+
+
+def get_import_status() -> dict[str, Any] | None:
+    """진행 중이거나 마지막으로 끝난 임포트의 진행 상황 (이 프로세스에서 실행한 적이 없으면 None)"""
+    report = _current_report
+    return report.snapshot() if report is not None else None
+
+
+def start_import_report(source: str, max_errors: int = 100) -> ImportReport:
+    """새 임포트 보고서를 만들고 상태 조회 대상으로 등록합니다."""
+    global _current_report
+    report = ImportReport(source=source, max_errors=max_errors)
+    _current_report = report
+    return report
+
+
+def sync_in_chunks(
+    session: Session,
+    records: Iterable[QuizRecord],
+    report: ImportReport,
+    chunk_size: int = 5000,
+    batch_size: int = 500,
+    seen_ids: set[str] | None = None,
+) -> None:
+    """records를 chunk_size 행씩 동기화하고 청크마다 커밋합니다. seen_ids를 주면 처리한 id를 모읍니다."""
+    for chunk in _chunked(iter(records), chunk_size):
+        result = sync_quizzes(session, chunk, batch_size=batch_size)
+        session.commit()
+        report.add_chunk(len(chunk), result)
+        if seen_ids is not None:
+            seen_ids.update(record.id for record in chunk)
+
+
+def _chunked(records: Iterator[QuizRecord], chunk_size: int) -> Iterator[list[QuizRecord]]:
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
@@ -1,18 +1,30 @@
-import csv
 import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Optional
 
 from sqlalchemy import func, select
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+from ..core.config import config
+from ..core.csv_import import ImportReport
+from ..core.csv_shards import ShardedCatalogSync, directory_content_hash
+from ..core.csv_sync import read_catalog_version
 from ..core.database import SessionLocal
-from ..core.ulid import is_valid_ulid
+from ..core.leader_lock import LeaderLock
 from ..models.quiz import Quiz
+from ..modules.quiz.catalog import get_quiz_catalog, load_quiz_catalog, load_quiz_catalog_from_snapshot
+from ..modules.quiz.snapshot import QuizSnapshot, SnapshotShard, write_snapshot
 
-# 감시할 CSV 파일 경로
-CSV_FILE_PATH = "csv_files/quiz_data.csv"
+# 감시할 CSV 디렉터리 (카테고리별 CSV 파일을 샤드로 사용)
+CSV_DIRECTORY = config.CSV_DIRECTORY
 
 observer = None  # 감시 객체 전역 변수
+reload_worker: Optional["CsvReloadWorker"] = None  # 동기화 전용 백그라운드 워커
+leader_lock: LeaderLock | None = None  # CSV 감시 리더 잠금
+version_poller: Optional["CatalogVersionPoller"] = None  # 팔로워 프로세스의 카탈로그 버전 확인
 
 
 # 데이터베이스가 비어 있는지 확인하는 함수
@@ -27,104 +39,313 @@ def is_db_empty():
             return True  # 오류 발생 시 데이터를 저장하도록 처리
 
 
-# CSV 파일을 읽어 데이터베이스에 저장하는 함수
-def store_csv_to_db(csv_file_path: str):
-    if not os.path.exists(csv_file_path):
-        print(f"CSV 파일을 찾을 수 없음: {csv_file_path}")
+# CSV 디렉터리(샤드별) 동기화 엔진
+catalog_sync = ShardedCatalogSync(
+    CSV_DIRECTORY,
+    SessionLocal,
+    parse_workers=config.CSV_PARSE_WORKERS,
+    chunk_size=config.CSV_IMPORT_CHUNK_SIZE,
+    batch_size=config.CSV_SYNC_BATCH_SIZE,
+    max_errors=config.CSV_IMPORT_MAX_ERRORS,
+)
+
+
+def sync_csv_directory() -> ImportReport | None:
+    """CSV 디렉터리에서 내용이 바뀐 샤드만 DB와 동기화합니다. (바뀐 샤드가 없으면 None)"""
+    report = catalog_sync.sync(delete_missing=config.CSV_SYNC_DELETE_MISSING)
+    if report is None:
+        print(f"변경된 CSV 파일이 없어 동기화를 건너뜁니다: {catalog_sync.directory}")
+        return None
+
+    if report.status == "failed":
+        print(f"CSV 처리 중 오류 발생: {report.failure}")
+    else:
+        print(
+            f"CSV 데이터 저장 완료! [{report.source}] "
+            f"(추가 {report.inserted}, 수정 {report.updated}, 삭제 {report.deleted}, "
+            f"변경 없음 {report.unchanged}, 오류 행 {report.error_count})"
+        )
+
+    catalog = load_quiz_catalog() if report.changed else get_quiz_catalog()
+    if report.status == "completed":
+        save_catalog_snapshot(catalog)
+    return report
+
+
+def save_catalog_snapshot(catalog=None) -> None:
+    """현재 카탈로그를 CSV 샤드 해시/DB 카탈로그 버전과 함께 스냅샷 파일로 저장합니다."""
+    if not config.CATALOG_SNAPSHOT_ENABLED:
         return
 
+    catalog = catalog or get_quiz_catalog()
+    state = catalog_sync.state
     try:
         with SessionLocal() as session:
-            # Accept UTF-8 with/without BOM to avoid breaking on Windows-saved CSVs.
-            with open(csv_file_path, "r", encoding="utf-8-sig", newline="") as file:
-                csv_reader = csv.reader(file)
-                headers = next(csv_reader, None)
-
-                if not headers or len(headers) < 5:
-                    print(f"CSV 형식이 잘못됨: {csv_file_path}")
-                    return
-
-                for row_number, row in enumerate(csv_reader, start=2):
-                    if not any(row):
-                        print(f"[행 {row_number}] 빈 행 건너뜀")
-                        continue
-
-                    if len(row) < 5:
-                        print(f"[행 {row_number}] 잘못된 데이터 행 건너뜀: {row}")
-                        continue
-
-                    try:
-                        quiz_id = (row[0] or "").strip()
-                        if not is_valid_ulid(quiz_id):
-                            print(f"[행 {row_number}] 잘못된 ULID 건너뜀: {quiz_id!r}")
-                            continue
-                        question = row[1]
-                        explanation = row[2]
-                        answer = str(row[3])
-                        category = row[4]  # 카테고리 추가
-
-                        # PK(id) 기준으로 insert/update를 처리 (DB 종류 무관)
-                        session.merge(
-                            Quiz(
-                                id=quiz_id,
-                                question=question,
-                                explanation=explanation,
-                                answer=answer,
-                                category=category,
-                            )
-                        )
-
-                    except Exception as e:
-                        print(f"[행 {row_number}] 데이터 변환 오류: {row}, 오류: {str(e)}")
-                        continue
-
-            session.commit()
-        print("CSV 데이터 저장 완료!")
+            db_version = read_catalog_version(session)
+        write_snapshot(
+            config.CATALOG_SNAPSHOT_PATH,
+            directory_content_hash(state.hashes),
+            db_version,
+            catalog.quizzes,
+            catalog.category_index(),
+            [
+                SnapshotShard(os.path.basename(path), file_hash, sorted(state.ids.get(path, ())))
+                for path, file_hash in state.hashes.items()
+            ],
+        )
     except Exception as e:
-        print(f"CSV 처리 중 오류 발생: {str(e)}")
+        print(f"카탈로그 스냅샷 저장 중 오류 발생: {str(e)}")
+
+
+def restore_catalog_snapshot() -> bool:
+    """CSV 샤드 해시와 DB 카탈로그 버전이 스냅샷과 같으면 스냅샷으로 카탈로그를 올립니다.
+
+    성공하면 샤드 상태도 복원하므로 CSV를 다시 파싱하지 않습니다. 다르면 False (CSV 동기화로 진행)
+    """
+    if not config.CATALOG_SNAPSHOT_ENABLED:
+        return False
+
+    snapshot = QuizSnapshot.open(config.CATALOG_SNAPSHOT_PATH)
+    if snapshot is None:
+        return False
+
+    try:
+        if snapshot.source_hash != directory_content_hash(catalog_sync.current_hashes()):
+            print("CSV 파일이 스냅샷과 다릅니다. CSV를 다시 동기화합니다.")
+            return False
+
+        with SessionLocal() as session:
+            db_version = read_catalog_version(session)
+        if snapshot.db_version != db_version:
+            print(f"DB 카탈로그 버전이 스냅샷과 다릅니다 (db={db_version}, snapshot={snapshot.db_version}).")
+            return False
+
+        shards = snapshot.shards()
+        load_quiz_catalog_from_snapshot(snapshot)
+        catalog_sync.restore_state(
+            {shard.name: shard.content_hash for shard in shards},
+            {shard.name: set(shard.quiz_ids) for shard in shards},
+        )
+        return True
+    except Exception as e:
+        print(f"카탈로그 스냅샷 적재 중 오류 발생: {str(e)}")
+        return False
+    finally:
+        snapshot.close()
+
+
+class CsvReloadWorker:
+    """파일 이벤트를 debounce해서 하나의 백그라운드 스레드에서 순서대로 동기화합니다.
+
+    같은 대상(디렉터리)에 이벤트가 연달아 오면 마지막 이벤트 후 debounce_seconds 동안 조용해질 때까지 기다립니다.
+    동기화는 항상 이 스레드 하나에서만 실행되므로 서로 겹치지 않습니다.
+    """
+
+    def __init__(
+        self,
+        debounce_seconds: float,
+        reload: Callable[[], ImportReport | None] = sync_csv_directory,
+    ):
+        """생성자"""
+        self.debounce_seconds = debounce_seconds
+        self._reload = reload
+        self._condition = threading.Condition()
+        self._pending: dict[str, float] = {}  # 경로 -> 동기화 예정 시각(monotonic)
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="csv-reload-worker", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def schedule(self, target: str) -> None:
+        """동기화를 예약합니다. 이미 예약된 대상이면 예정 시각을 뒤로 미룹니다."""
+        with self._condition:
+            self._pending[target] = time.monotonic() + self.debounce_seconds
+            self._condition.notify()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _next_due_path(self) -> str | None:
+        """예정 시각이 된 대상을 꺼냅니다. 중지되면 None"""
+        with self._condition:
+            while not self._stopped:
+                if not self._pending:
+                    self._condition.wait()
+                    continue
+
+                path, due_at = min(self._pending.items(), key=lambda item: item[1])
+                delay = due_at - time.monotonic()
+                if delay <= 0:
+                    del self._pending[path]
+                    return path
+                self._condition.wait(delay)
+        return None
+
+    def _run(self) -> None:
+        while True:
+            path = self._next_due_path()
+            if path is None:
+                return
+            try:
+                self._reload()
+            except Exception as e:
+                print(f"CSV 재적재 중 오류 발생: {str(e)}")
+
+
+class CatalogVersionPoller:
+    """CSV를 감시하지 않는(팔로워) 프로세스에서 catalog_state 버전을 주기적으로 확인합니다.
+
+    - 버전이 바뀌면 DB에서 카탈로그를 다시 적재합니다.
+    - 리더 잠금을 얻으면(리더 프로세스 종료) on_leader를 호출하고 리더 역할을 이어받습니다.
+    """
+
+    def __init__(self, interval_seconds: float, lock: LeaderLock, on_leader: Callable[[], None]):
+        """생성자"""
+        self.interval_seconds = interval_seconds
+        self._lock = lock
+        self._on_leader = on_leader
+        self._seen_version: int | None = None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="catalog-version-poller", daemon=True)
+
+    def start(self) -> None:
+        self._seen_version = self._read_version()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def poll_once(self) -> bool:
+        """버전을 한 번 확인합니다. 카탈로그를 다시 적재했으면 True"""
+        version = self._read_version()
+        if version is None or version == self._seen_version:
+            return False
+
+        self._seen_version = version
+        print(f"카탈로그 버전 변경 감지 (version={version}). 카탈로그를 다시 적재합니다.")
+        load_quiz_catalog()
+        return True
+
+    def _read_version(self) -> int | None:
+        try:
+            with SessionLocal() as session:
+                return read_catalog_version(session)
+        except Exception as e:
+            print(f"카탈로그 버전 확인 중 오류 발생: {str(e)}")
+            return None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            if self._lock.acquire():
+                print("CSV 감시 리더 역할을 이어받습니다.")
+                self._on_leader()
+                return
+            self.poll_once()
 
 
 # 리스너 클래스 정의
 class CsvFileListener(FileSystemEventHandler):
-    def __init__(self, csv_file_path: str):
-        self.CSV_FILE_PATH = os.path.abspath(csv_file_path)
+    """CSV 디렉터리의 *.csv 변경을 감지해서 디렉터리 동기화를 예약합니다."""
+
+    def __init__(self, csv_directory: str, worker: CsvReloadWorker):
+        self.CSV_DIRECTORY = os.path.abspath(csv_directory)
+        self.worker = worker
 
     def on_modified(self, event):
-        if event.is_directory:
-            return
-        if event.src_path == self.CSV_FILE_PATH:
-            print(f"CSV 파일 {event.src_path} 가 수정되었습니다.")
-            print("DB에 저장을 시작합니다.")
-            store_csv_to_db(event.src_path)
+        if not event.is_directory:
+            self._schedule_if_target(event.src_path, "수정")
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._schedule_if_target(event.src_path, "생성")
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._schedule_if_target(event.src_path, "삭제")
+
+    def on_moved(self, event):
+        # 에디터/스크립트의 원자적 저장(임시 파일 -> rename)은 dest_path로 들어옴
+        if not event.is_directory:
+            self._schedule_if_target(event.dest_path, "교체")
+            self._schedule_if_target(event.src_path, "이동")
+
+    def _schedule_if_target(self, path: str, action: str) -> None:
+        path = os.path.abspath(path)
+        if os.path.dirname(path) == self.CSV_DIRECTORY and path.lower().endswith(".csv"):
+            print(f"CSV 파일 {path} 가 {action}되었습니다. DB 동기화를 예약합니다.")
+            self.worker.schedule(self.CSV_DIRECTORY)
 
 
 # CSV 감시 시작 함수
 def start_csv_listener():
-    global observer
-    if observer is None or not observer.is_alive():
-        watch_folder = os.path.dirname(CSV_FILE_PATH)
-        os.makedirs(watch_folder, exist_ok=True)
-
-        # 데이터베이스 상태와 무관하게 CSV를 동기화(merge)합니다.
-        # - DB가 비어있으면: 초기 로드
-        # - DB가 이미 있으면: 기존 PK는 업데이트, 신규 PK는 삽입
+    """CSV 감시를 시작합니다.
+
+    여러 프로세스(uvicorn --workers N 등)가 동시에 호출해도 잠금을 얻은 리더 하나만
+    CSV를 감시/동기화하고, 나머지는 catalog_state 버전만 확인합니다.
+    """
+    global leader_lock, version_poller
+    if observer is not None and observer.is_alive():
+        return
+
+    if config.CSV_LEADER_ELECTION_ENABLED:
+        if leader_lock is None:
+            leader_lock = LeaderLock(config.CSV_LEADER_LOCK_PATH)
+        if not leader_lock.acquire():
+            print("다른 프로세스가 CSV 감시를 맡고 있습니다. 카탈로그 버전 변경만 확인합니다.")
+            version_poller = CatalogVersionPoller(config.CATALOG_VERSION_POLL_SECONDS, leader_lock, _start_watching)
+            version_poller.start()
+            return
+
+    _start_watching()
+
+
+def _start_watching():
+    global observer, reload_worker
+    os.makedirs(CSV_DIRECTORY, exist_ok=True)
+
+    # CSV/DB가 마지막 스냅샷 그대로면 스냅샷으로 바로 서비스하고,
+    # 아니면 DB 상태와 무관하게 CSV를 동기화(merge)합니다.
+    # - DB가 비어있으면: 초기 로드
+    # - DB가 이미 있으면: 기존 PK는 업데이트, 신규 PK는 삽입
+    if restore_catalog_snapshot():
+        print("CSV가 바뀌지 않아 카탈로그 스냅샷으로 시작합니다.")
+    else:
         if is_db_empty():
             print("데이터베이스가 비어 있습니다. CSV 데이터를 불러옵니다...")
         else:
             print("데이터베이스에 기존 데이터가 존재합니다. CSV와 동기화합니다...")
-        store_csv_to_db(CSV_FILE_PATH)
+        sync_csv_directory()
+
+    reload_worker = CsvReloadWorker(config.CSV_RELOAD_DEBOUNCE_SECONDS)
+    reload_worker.start()
 
-        observer = Observer()
-        event_handler = CsvFileListener(CSV_FILE_PATH)
-        observer.schedule(event_handler, path=watch_folder, recursive=False)
-        observer.start()
-        print(f"CSV 감시 시작됨... ({CSV_FILE_PATH})")
+    observer = Observer()
+    event_handler = CsvFileListener(CSV_DIRECTORY, reload_worker)
+    observer.schedule(event_handler, path=CSV_DIRECTORY, recursive=False)
+    observer.start()
+    print(f"CSV 감시 시작됨... ({CSV_DIRECTORY})")
 
 
 # CSV 감시 중지 함수
 def stop_csv_listener():
-    global observer
+    global observer, reload_worker, version_poller
+    if version_poller:
+        version_poller.stop()
+        version_poller = None
     if observer:
         observer.stop()
         observer.join()
+        observer = None
         print("CSV 감시가 중지되었습니다.")
+    if reload_worker:
+        reload_worker.stop()
+        reload_worker = None
+    if leader_lock:
+        leader_lock.release()
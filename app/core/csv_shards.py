@@ -0,0 +1,239 @@
+"""csv_files/의 CSV 샤드를 파일 해시로 추적해 바뀐 샤드만 동기화합니다."""
+
+import hashlib
+import multiprocessing
+import os
+import pickle
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice, repeat
+
+from sqlalchemy.orm import Session
+
+from .csv_import import ImportReport, start_import_report, sync_in_chunks
+from .csv_sync import QuizRecord, RowError, bump_catalog_version, delete_quizzes, delete_quizzes_not_in, iter_quiz_csv
+
+
+@dataclass
+class ShardParseResult:
+    path: str
+    chunk_path: str  # 파싱한 행이 청크(List[QuizRecord])별로 pickle된 파일
+    errors: list[RowError]  # 최대 max_errors건
+    error_count: int
+
+
+@dataclass
+class ShardState:
+    """샤드별로 마지막으로 반영한 파일 해시와 id 집합"""
+
+    hashes: dict[str, str] = field(default_factory=dict)
+    ids: dict[str, set[str]] = field(default_factory=dict)
+
+
+def file_content_hash(csv_file_path: str) -> str | None:
+    """파일 내용의 SHA-256 해시. 파일을 읽을 수 없으면 None"""
+    digest = hashlib.sha256()
+    try:
+        with open(csv_file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def directory_content_hash(hashes: dict[str, str]) -> str:
+    """샤드 (파일명, 내용 해시) 목록 전체의 SHA-256 해시. 카탈로그 스냅샷의 키로 사용합니다."""
+    digest = hashlib.sha256()
+    for name, file_hash in sorted((os.path.basename(path), file_hash) for path, file_hash in hashes.items()):
+        digest.update(f"{name}\0{file_hash}\n".encode())
+    return digest.hexdigest()
+
+
+def list_csv_shards(directory: str) -> list[str]:
+    """디렉터리 안의 CSV 파일 절대 경로 목록 (이름순)"""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        os.path.join(os.path.abspath(directory), name)
+        for name in os.listdir(directory)
+        if name.lower().endswith(".csv") and not name.startswith(".")
+    )
+
+
+def parse_shard(path: str, chunk_path: str, chunk_size: int, max_errors: int) -> ShardParseResult:
+    """샤드 하나를 파싱해 chunk_size 행씩 chunk_path에 씁니다. (워커 프로세스에서 실행되므로 최상위 함수로 둠)"""
+    result = ShardParseResult(path, chunk_path, [], 0)
+    source = os.path.basename(path)
+
+    def on_error(error) -> None:
+        result.error_count += 1
+        if len(result.errors) < max_errors:
+            result.errors.append(RowError(error.row, error.reason, error.value, source))
+
+    records = iter_quiz_csv(path, on_error=on_error)
+    with open(chunk_path, "wb") as file:
+        while chunk := list(islice(records, chunk_size)):
+            pickle.dump(chunk, file, protocol=pickle.HIGHEST_PROTOCOL)
+    return result
+
+
+def read_shard_chunks(chunk_path: str) -> Iterator[QuizRecord]:
+    """`parse_shard`가 쓴 청크 파일을 청크 하나씩 읽어 행을 내보냅니다."""
+    with open(chunk_path, "rb") as file:
+        while True:
+            try:
+                chunk = pickle.load(file)
+            except EOFError:
+                return
+            yield from chunk
+
+
+class ShardedCatalogSync:
+    """파일 내용 해시가 바뀐 샤드만 다시 읽어 DB에 반영합니다.
+
+    바뀐 샤드가 여러 개면 워커 프로세스가 청크 파일로 파싱하고, DB 반영은 현재 프로세스에서 청크 단위로 합니다.
+    delete_missing은 어느 샤드에도 남아 있지 않은 id만 지웁니다.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        session_factory: Callable[[], Session],
+        parse_workers: int = 4,
+        chunk_size: int = 5000,
+        batch_size: int = 500,
+        max_errors: int = 100,
+    ):
+        """생성자"""
+        self.directory = directory
+        self.session_factory = session_factory
+        self.parse_workers = parse_workers
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.state = ShardState()
+
+    def changed_shards(self) -> dict[str, str]:
+        """마지막 반영 이후 내용이 바뀐 샤드 (경로 -> 새 해시)"""
+        return {path: digest for path, digest in self.current_hashes().items() if self.state.hashes.get(path) != digest}
+
+    def current_hashes(self) -> dict[str, str]:
+        """디스크에 있는 샤드의 현재 내용 해시 (경로 -> 해시)"""
+        hashes: dict[str, str] = {}
+        for path in list_csv_shards(self.directory):
+            digest = file_content_hash(path)
+            if digest is not None:
+                hashes[path] = digest
+        return hashes
+
+    def restore_state(self, hashes: dict[str, str], ids: dict[str, set[str]]) -> None:
+        """이미 DB에 반영된 샤드 상태를 복원합니다. (스냅샷으로 부팅한 경우, 다음 sync는 바뀐 샤드만 읽음)
+
+        hashes/ids의 키는 파일명 또는 경로이며, 이 디렉터리 안의 절대 경로로 바꿔 저장합니다.
+        """
+        directory = os.path.abspath(self.directory)
+        self.state = ShardState(
+            hashes={os.path.join(directory, os.path.basename(path)): digest for path, digest in hashes.items()},
+            ids={os.path.join(directory, os.path.basename(path)): set(members) for path, members in ids.items()},
+        )
+
+    def sync(self, delete_missing: bool = False) -> ImportReport | None:
+        """바뀐 샤드만 DB에 반영합니다. 바뀐 샤드가 없으면 None"""
+        changed = self.changed_shards()
+        current_paths = set(list_csv_shards(self.directory))
+        removed = [path for path in self.state.hashes if path not in current_paths]
+        if not changed and not removed:
+            return None
+
+        report = start_import_report(f"{self.directory} ({len(changed)}개 샤드 변경)", self.max_errors)
+        first_sync = not self.state.hashes
+        new_ids: dict[str, set[str]] = {}
+        try:
+            with self.session_factory() as session:
+                for path, records in self._iter_changed_records(list(changed), report):
+                    seen: set[str] = set()
+                    sync_in_chunks(session, records, report, self.chunk_size, self.batch_size, seen)
+                    new_ids[path] = seen
+
+                if delete_missing:
+                    report.deleted = self._delete_missing(session, new_ids, removed, first_sync)
+
+                if report.changed:
+                    bump_catalog_version(session)  # 다른 프로세스에 변경 알림
+                session.commit()
+        except Exception as e:
+            if report.changed:
+                # 실패 전에 커밋된 청크가 있으면 다른 프로세스도 그 내용을 다시 읽도록 알림
+                self._bump_catalog_version()
+            report.finish(failure=str(e))
+            return report
+
+        for path, ids in new_ids.items():
+            self.state.hashes[path] = changed[path]
+            self.state.ids[path] = ids
+        for path in removed:
+            self.state.hashes.pop(path, None)
+            self.state.ids.pop(path, None)
+
+        report.finish()
+        return report
+
+    def _bump_catalog_version(self) -> None:
+        try:
+            with self.session_factory() as session:
+                bump_catalog_version(session)
+                session.commit()
+        except Exception as e:
+            print(f"카탈로그 버전 갱신 중 오류 발생: {str(e)}")
+
+    def _iter_changed_records(self, paths: list[str], report: ImportReport) -> Iterable[tuple]:
+        if len(paths) <= 1 or self.parse_workers <= 1:
+            for path in paths:
+                source = os.path.basename(path)
+                yield (
+                    path,
+                    iter_quiz_csv(
+                        path,
+                        on_error=lambda e, source=source: report.add_error(RowError(e.row, e.reason, e.value, source)),
+                    ),
+                )
+            return
+
+        # fork는 스레드(watchdog, 워커)가 도는 프로세스에서 교착 위험이 있어 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        with (
+            tempfile.TemporaryDirectory(prefix="csv-shards-") as chunk_directory,
+            ProcessPoolExecutor(max_workers=min(self.parse_workers, len(paths)), mp_context=context) as executor,
+        ):
+            chunk_paths = [os.path.join(chunk_directory, f"{index}.chunks") for index in range(len(paths))]
+            results = executor.map(parse_shard, paths, chunk_paths, repeat(self.chunk_size), repeat(self.max_errors))
+            for parsed in results:
+                report.add_errors(parsed.errors, parsed.error_count)
+                yield parsed.path, read_shard_chunks(parsed.chunk_path)
+                os.remove(parsed.chunk_path)  # 반영을 마친 샤드의 청크 파일은 바로 정리
+
+    def _delete_missing(
+        self,
+        session: Session,
+        new_ids: dict[str, set[str]],
+        removed: list[str],
+        first_sync: bool,
+    ) -> int:
+        all_ids: set[str] = set()
+        for path in set(self.state.ids) | set(new_ids):
+            if path not in removed:
+                all_ids |= new_ids.get(path, self.state.ids.get(path, set()))
+
+        if first_sync:
+            # 처음에는 모든 샤드를 읽었으므로 DB 전체와 비교
+            return delete_quizzes_not_in(session, all_ids, self.batch_size)
+
+        candidates: set[str] = set()
+        for path, ids in new_ids.items():
+            candidates |= self.state.ids.get(path, set()) - ids
+        for path in removed:
+            candidates |= self.state.ids.get(path, set())
+        return delete_quizzes(session, sorted(candidates - all_ids), self.batch_size)
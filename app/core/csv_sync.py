@@ -0,0 +1,177 @@
+"""CSV 퀴즈 목록과 quizzes 테이블을 비교해 바뀐 행만 반영하는 동기화 엔진."""
+
+import csv
+import hashlib
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass
+from typing import NamedTuple
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from ..models.catalog_state import CatalogState
+from ..models.quiz import Quiz
+from .ulid import is_valid_ulid
+
+# IN 절 한 번에 넣을 id 수 (SQLite 바인드 변수 제한 고려)
+_ID_LOOKUP_BATCH = 500
+
+
+class QuizRecord(NamedTuple):
+    id: str
+    question: str
+    explanation: str
+    answer: str
+    category: str
+
+
+@dataclass
+class RowError:
+    row: int  # CSV 행 번호 (헤더 = 1)
+    reason: str
+    value: str
+    source: str = ""  # CSV 파일명 (디렉터리 동기화 시)
+
+
+@dataclass
+class SyncResult:
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+
+def content_hash(question: str, explanation: str, answer: str, category: str) -> str:
+    """행 내용(id 제외)의 해시. 구분자(\\x1f)로 필드 경계를 구분합니다."""
+    joined = "\x1f".join((question or "", explanation or "", answer or "", category or ""))
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()
+
+
+def iter_quiz_csv(
+    csv_file_path: str,
+    on_error: Callable[[RowError], None] | None = None,
+) -> Iterator[QuizRecord]:
+    """CSV 파일을 한 행씩 읽어 유효한 퀴즈 행을 내보냅니다. (헤더 형식이 잘못되면 ValueError)
+
+    잘못된 행은 건너뛰고 on_error로 전달합니다.
+    """
+    # Accept UTF-8 with/without BOM to avoid breaking on Windows-saved CSVs.
+    with open(csv_file_path, "r", encoding="utf-8-sig", newline="") as file:
+        csv_reader = csv.reader(file)
+        headers = next(csv_reader, None)
+
+        if not headers or len(headers) < 5:
+            raise ValueError(f"CSV 형식이 잘못됨: {csv_file_path}")
+
+        for row_number, row in enumerate(csv_reader, start=2):
+            if not any(row):
+                continue  # 빈 행
+
+            if len(row) < 5:
+                if on_error:
+                    on_error(RowError(row_number, "컬럼 수 부족", ",".join(row)[:200]))
+                continue
+
+            quiz_id = (row[0] or "").strip()
+            if not is_valid_ulid(quiz_id):
+                if on_error:
+                    on_error(RowError(row_number, "잘못된 ULID", quiz_id[:200]))
+                continue
+
+            yield QuizRecord(
+                id=quiz_id,
+                question=row[1],
+                explanation=row[2],
+                answer=str(row[3]),
+                category=row[4],
+            )
+
+
+def load_existing_hashes(session: Session, ids: Sequence[str] | None = None) -> dict[str, str]:
+    """quizzes 테이블의 (id -> 내용 해시)를 읽습니다. ids를 주면 해당 행만 읽습니다."""
+    stmt = select(Quiz.id, Quiz.question, Quiz.explanation, Quiz.answer, Quiz.category)
+    if ids is None:
+        rows = session.execute(stmt)
+    else:
+        rows = (
+            row for batch in _batched(ids, _ID_LOOKUP_BATCH) for row in session.execute(stmt.where(Quiz.id.in_(batch)))
+        )
+
+    return {row.id: content_hash(row.question, row.explanation, row.answer, row.category) for row in rows}
+
+
+def sync_quizzes(
+    session: Session,
+    records: Iterable[QuizRecord],
+    delete_missing: bool = False,
+    batch_size: int = 500,
+) -> SyncResult:
+    """CSV 행과 DB를 비교해 바뀐 행만 반영합니다. (커밋은 호출한 쪽에서 수행)
+
+    같은 id가 여러 번 나오면 마지막 행을 사용합니다.
+    delete_missing=True이면 records가 전체 목록이어야 하므로 DB 전체 해시를 읽고,
+    아니면 records에 있는 id만 조회합니다. (청크 단위 스트리밍 동기화용)
+    """
+    latest: dict[str, QuizRecord] = {record.id: record for record in records}
+    existing = load_existing_hashes(session, None if delete_missing else list(latest))
+
+    inserts: list[dict[str, str]] = []
+    updates: list[dict[str, str]] = []
+    result = SyncResult()
+    for quiz_id, record in latest.items():
+        current_hash = existing.get(quiz_id)
+        if current_hash is None:
+            inserts.append(record._asdict())
+        elif current_hash != content_hash(record.question, record.explanation, record.answer, record.category):
+            updates.append(record._asdict())
+        else:
+            result.unchanged += 1
+
+    deletes = [quiz_id for quiz_id in existing if quiz_id not in latest] if delete_missing else []
+
+    for batch in _batched(inserts, batch_size):
+        session.execute(insert(Quiz), batch)
+    for batch in _batched(updates, batch_size):
+        session.execute(update(Quiz), batch)  # PK 기준 bulk UPDATE (executemany)
+    result.deleted = delete_quizzes(session, deletes, batch_size)
+
+    result.inserted = len(inserts)
+    result.updated = len(updates)
+    return result
+
+
+def delete_quizzes_not_in(session: Session, keep_ids: set[str], batch_size: int = 500) -> int:
+    """keep_ids에 없는 퀴즈를 삭제하고 삭제 건수를 반환합니다."""
+    missing = [quiz_id for quiz_id in session.scalars(select(Quiz.id)) if quiz_id not in keep_ids]
+    return delete_quizzes(session, missing, batch_size)
+
+
+def delete_quizzes(session: Session, quiz_ids: Sequence[str], batch_size: int = 500) -> int:
+    for batch in _batched(quiz_ids, batch_size):
+        session.execute(delete(Quiz).where(Quiz.id.in_(batch)))
+    return len(quiz_ids)
+
+
+def read_catalog_version(session: Session) -> int:
+    """catalog_state의 현재 카탈로그 버전 (행이 없으면 0)"""
+    version = session.scalar(select(CatalogState.version).where(CatalogState.id == 1))
+    return version or 0
+
+
+def bump_catalog_version(session: Session) -> None:
+    """카탈로그 버전을 1 올립니다. (동기화와 같은 트랜잭션에서 호출)"""
+    bumped = session.execute(update(CatalogState).where(CatalogState.id == 1).values(version=CatalogState.version + 1))
+    if bumped.rowcount == 0:
+        session.execute(insert(CatalogState).values(id=1, version=1))
+
+
+def _batched(items: Sequence, batch_size: int) -> Iterable[Sequence]:
+    for start in range(0, len(items), batch_size):
+        yield items[start : start + batch_size]
@@ -1,17 +1,160 @@
-from sqlalchemy import create_engine
+import inspect
+import os
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql import Select
 
 from ..core.config import config
+from .pool_metrics import MeteredAsyncAdaptedQueuePool, MeteredQueuePool, pool_stats
+from .sqlite_profile import (
+    READER,
+    WRITER,
+    SharedWriteSlot,
+    apply_sqlite_profile,
+    is_file_sqlite,
+    sqlite_engine_options,
+)
+
+# 복제본(DATABASE_READ_URL)으로 보내도 되는 조회임을 표시하는 execution option
+READ_REPLICA_OPTION = "read_replica"
+
+# 파일 SQLite면 WAL/PRAGMA + 단일 쓰기 연결 + 읽기 전용 풀 (SQLITE_PROFILE_ENABLED)
+sqlite_profile_enabled = config.SQLITE_PROFILE_ENABLED and is_file_sqlite(config.DATABASE_URL)
+
+# 이름 -> 생성된 엔진 (풀 지표 노출용)
+_engines: dict[str, Engine | AsyncEngine] = {}
+
+# SQLite 파일 경로 -> 그 파일의 동기/비동기 쓰기 엔진이 함께 쓰는 쓰기 슬롯 (프로세스 전체에서 쓰기 연결은 하나)
+_sqlite_write_slots: dict[str, SharedWriteSlot] = {}
+
+
+class RoutingSession(Session):
+    """조회를 읽기용 엔진으로 보내는 세션.
+
+    - `READ_REPLICA_OPTION`이 붙은 SELECT는 복제본(info["replica_bind"])으로
+    - 나머지 SELECT는 SQLite 읽기 전용 풀(info["read_bind"])로
+    - flush/INSERT/UPDATE/DELETE와 그 외는 기본 bind(primary)로 보냅니다.
+
+    방금 쓴(커밋 전) 행은 읽기 엔진에서 보이지 않으므로, 트랜잭션에서 한 번이라도 쓰면(flush 또는
+    SELECT가 아닌 문) 그 트랜잭션이 끝날 때까지 조회도 primary로 보냅니다. (read-your-writes)
+    """
+
+    _wrote_in_transaction = False
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or (clause is not None and not isinstance(clause, Select)):
+            self._wrote_in_transaction = True
+        elif isinstance(clause, Select) and not self._wrote_in_transaction:
+            replica_bind = self.info.get("replica_bind")
+            if replica_bind is not None and clause.get_execution_options().get(READ_REPLICA_OPTION):
+                return replica_bind
+            read_bind = self.info.get("read_bind")
+            if read_bind is not None:
+                return read_bind
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _reset_write_routing(session: RoutingSession, transaction) -> None:
+    # 최상위 트랜잭션이 끝나면(commit/rollback/close) 다시 읽기 엔진을 사용
+    if transaction.parent is None:
+        session._wrote_in_transaction = False
+
+
+def prefer_replica(stmt: Select) -> Select:
+    """복제 지연을 허용하는 조회로 표시합니다. (DATABASE_READ_URL이 없으면 영향 없음)"""
+    return stmt.execution_options(**{READ_REPLICA_OPTION: True})
+
+
+def _engine_options(database_url: str, role: str, is_async: bool) -> dict:
+    options: dict = {}
+    url = make_url(database_url)
+    # 방언 기본 풀이 QueuePool 계열일 때만 지표용 풀로 바꿉니다.
+    # (메모리 SQLite의 StaticPool/SingletonThreadPool은 그대로 둬야 연결마다 빈 DB가 생기지 않음)
+    if issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+        options["poolclass"] = MeteredAsyncAdaptedQueuePool if is_async else MeteredQueuePool
+        if config.SQLITE_PROFILE_ENABLED and is_file_sqlite(database_url):
+            options.update(sqlite_engine_options(role, config))
+        else:
+            options.update(
+                pool_size=config.DATABASE_POOL_SIZE,
+                max_overflow=config.DATABASE_MAX_OVERFLOW,
+                pool_timeout=config.DATABASE_POOL_TIMEOUT_SECONDS,
+                pool_recycle=config.DATABASE_POOL_RECYCLE_SECONDS,
+                pool_pre_ping=config.DATABASE_POOL_PRE_PING,
+            )
+    # PostgreSQL 사용 시 connect_args 필요 없음
+    if not is_async and url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}  # SQLite 전용 옵션
+    return options
+
+
+def _sqlite_write_slot(database_url: str) -> SharedWriteSlot:
+    """같은 SQLite 파일을 쓰는 엔진(동기/비동기 URL 모두)이 공유하는 쓰기 슬롯"""
+    path = os.path.abspath(make_url(database_url).database)
+    slot = _sqlite_write_slots.get(path)
+    if slot is None:
+        slot = _sqlite_write_slots[path] = SharedWriteSlot(config.SQLITE_WRITE_TIMEOUT_SECONDS)
+    return slot
+
+
+def build_engine(name: str, database_url: str, role: str = WRITER) -> Engine:
+    """설정(풀/SQLite 프로필)을 적용한 동기 엔진을 만들고 풀 지표에 등록합니다."""
+    created = create_engine(database_url, **_engine_options(database_url, role, is_async=False))
+    if config.SQLITE_PROFILE_ENABLED and is_file_sqlite(database_url):
+        apply_sqlite_profile(created, role, config, _sqlite_write_slot(database_url))
+    _engines[name] = created
+    return created
+
+
+def build_async_engine(name: str, database_url: str, role: str = WRITER) -> AsyncEngine:
+    """`build_engine`의 비동기 엔진 버전"""
+    created = create_async_engine(database_url, **_engine_options(database_url, role, is_async=True))
+    if config.SQLITE_PROFILE_ENABLED and is_file_sqlite(database_url):
+        apply_sqlite_profile(created.sync_engine, role, config, _sqlite_write_slot(database_url), is_async=True)
+    _engines[name] = created
+    return created
+
+
+def _session_info(read_bind, replica_bind) -> dict:
+    info = {}
+    if read_bind is not None:
+        info["read_bind"] = read_bind
+    if replica_bind is not None:
+        info["replica_bind"] = replica_bind
+    return info
 
-# PostgreSQL 사용 시 connect_args 필요 없음
-connect_args = {}
-if "sqlite" in config.DATABASE_URL:
-    connect_args = {"check_same_thread": False}  # SQLite 전용 옵션
 
 # 데이터베이스 엔진 생성
-engine = create_engine(config.DATABASE_URL, connect_args=connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# - engine: primary (쓰기 및 기본 조회)
+# - read_engine: 같은 SQLite 파일의 읽기 전용 풀 (프로필 미적용 시 engine과 같음)
+# - replica_engine: DATABASE_READ_URL 복제본 (prefer_replica로 표시한 조회만 사용)
+engine = build_engine("primary", config.DATABASE_URL, WRITER)
+read_engine = build_engine("primary_read", config.DATABASE_URL, READER) if sqlite_profile_enabled else engine
+replica_engine = build_engine("replica", config.DATABASE_READ_URL, READER) if config.DATABASE_READ_URL else None
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    class_=RoutingSession,
+    info=_session_info(read_engine if read_engine is not engine else None, replica_engine),
+)
+
+# 비동기 엔진은 실제로 사용할 때 생성 (드라이버가 없는 환경에서도 동기 경로는 동작하도록)
+_async_engine: AsyncEngine | None = None
+_AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+# 동기 드라이버 -> 비동기 드라이버 매핑
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
 
 # 기본 모델 클래스
 Base = declarative_base()
@@ -21,7 +164,7 @@ Base = declarative_base()
 def init_db():
     """데이터베이스 테이블 생성"""
     # Ensure all models are imported so Base.metadata is fully populated.
-    from ..models import quiz, score, user  # noqa: F401
+    from ..models import catalog_state, notification_outbox, quiz, score, user  # noqa: F401
 
     # 테이블 중복 생성 방지
     Base.metadata.create_all(bind=engine)
@@ -34,3 +177,81 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def to_async_database_url(database_url: str) -> str:
+    """동기 DATABASE_URL을 같은 DB를 가리키는 비동기 드라이버 URL로 바꿉니다."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"비동기 드라이버를 지원하지 않는 DB입니다: {backend}")
+
+    if url.drivername in {"sqlite+aiosqlite", "postgresql+asyncpg"}:
+        return database_url
+    return url.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        async_url = config.DATABASE_ASYNC_URL or to_async_database_url(config.DATABASE_URL)
+        _async_engine = build_async_engine("async_primary", async_url, WRITER)
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        async_url = config.DATABASE_ASYNC_URL or to_async_database_url(config.DATABASE_URL)
+        read_bind = None
+        if sqlite_profile_enabled:
+            read_bind = build_async_engine("async_primary_read", async_url, READER).sync_engine
+
+        replica_bind = None
+        if config.DATABASE_READ_URL:
+            async_read_url = config.DATABASE_ASYNC_READ_URL or to_async_database_url(config.DATABASE_READ_URL)
+            replica_bind = build_async_engine("async_replica", async_read_url, READER).sync_engine
+
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+            sync_session_class=RoutingSession,
+            info=_session_info(read_bind, replica_bind),
+        )
+    return _AsyncSessionLocal
+
+
+def get_pool_metrics() -> dict[str, Any]:
+    """생성된 엔진별 연결 풀 지표 (이름 -> 지표)"""
+    return {
+        name: pool_stats(created.sync_engine.pool if isinstance(created, AsyncEngine) else created.pool)
+        for name, created in _engines.items()
+    }
+
+
+async def get_async_db():
+    """비동기 세션을 제공하는 함수 (FastAPI Depends 용)"""
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def get_db_session():
+    """설정(DATABASE_ASYNC_ENABLED)에 따라 비동기 또는 동기 세션을 제공합니다."""
+    if config.DATABASE_ASYNC_ENABLED:
+        async with get_async_sessionmaker()() as db:
+            yield db
+        return
+
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def maybe_await(value: Any) -> Any:
+    """비동기 레포지토리의 코루틴과 동기 레포지토리의 반환값을 같은 방식으로 다룹니다."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
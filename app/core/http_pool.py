@@ -0,0 +1,223 @@
+"""호스트별로 연결을 재사용하는 keep-alive HTTP/1.1 클라이언트. (http.client 기반)"""
+
+import http.client
+import select
+import socket
+import ssl
+import threading
+from collections import deque
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+_Key = tuple[str, str, int]
+
+# 재사용한 연결이 서버 쪽에서 끊긴 경우 (http.client.RemoteDisconnected는 ConnectionResetError의 하위 클래스)
+_STALE_CONNECTION_ERRORS = (ConnectionResetError, BrokenPipeError)
+
+# 응답을 받기 전에 연결이 끊겨도 다시 보낼 수 있는 메서드
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class HttpResponse(NamedTuple):
+    status: int
+    body: bytes
+
+
+class HttpTransportError(Exception):
+    """연결 실패/타임아웃 등 응답을 받지 못한 경우"""
+
+
+class HttpConnectError(HttpTransportError):
+    """연결 수립에 실패한 경우 (요청이 서버에 전달되지 않았으므로 다시 보내도 안전함)"""
+
+
+class HttpConnectionLostError(HttpTransportError):
+    """요청을 다 보낸 뒤 응답을 받기 전에 연결이 끊긴 경우 (서버가 요청을 처리했을 수 있음)"""
+
+
+class _HostPool:
+    def __init__(self, size: int):
+        self.idle: deque[http.client.HTTPConnection] = deque()
+        self.slots = threading.BoundedSemaphore(size)
+
+
+class KeepAliveHttpClient:
+    """(scheme, host, port)마다 최대 pool_size개의 연결을 만들어 다시 쓰는 HTTP 클라이언트.
+
+    - 유휴 연결은 꺼낼 때 서버가 이미 닫았는지 확인하고, 닫혔으면 새 연결을 씁니다.
+    - 재사용한 연결이 요청을 다 쓰기 전에 끊기면 새 연결로 한 번만 다시 보냅니다. 요청을 다 쓴 뒤 끊기면
+      멱등 메서드만 다시 보내고, POST 등은 `HttpConnectionLostError`로 호출자에게 맡깁니다.
+    - 풀이 가득 차면 connect_timeout 동안 빈 연결을 기다린 뒤 실패합니다.
+    """
+
+    def __init__(self, pool_size: int = 10, connect_timeout: float = 3.0, read_timeout: float = 10.0):
+        """생성자
+
+        Args:
+            pool_size: 호스트별 최대 동시 연결 수
+            connect_timeout: 연결 수립(및 풀 대기) 제한 시간(초)
+            read_timeout: 요청 전송 후 응답 대기 제한 시간(초)
+        """
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._lock = threading.Lock()
+        self._pools: dict[_Key, _HostPool] = {}
+        self._ssl_context: ssl.SSLContext | None = None
+        self._connections_created = 0
+        self._requests = 0
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict | None = None,
+        timeout: float | None = None,
+    ) -> HttpResponse:
+        """요청을 보내고 응답 본문까지 읽어서 반환합니다. 상태 코드와 관계없이 응답을 받으면 반환합니다.
+
+        timeout을 주면 이 요청의 응답 대기 제한 시간(초)으로 read_timeout 대신 사용합니다.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise HttpTransportError(f"지원하지 않는 URL입니다: {url}")
+
+        key = (scheme, parts.hostname, parts.port or (443 if scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        pool = self._get_pool(key)
+        if not pool.slots.acquire(timeout=self.connect_timeout):
+            raise HttpTransportError(f"연결 풀 대기 시간 초과: {key[1]}:{key[2]}")
+        try:
+            read_timeout = self.read_timeout if timeout is None else timeout
+            return self._send(pool, key, method, path, body, headers or {}, read_timeout)
+        finally:
+            pool.slots.release()
+
+    def close(self) -> None:
+        """유휴 연결을 모두 닫습니다."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            while pool.idle:
+                pool.idle.popleft().close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hosts": len(self._pools),
+                "idle_connections": sum(len(pool.idle) for pool in self._pools.values()),
+                "connections_created": self._connections_created,
+                "requests": self._requests,
+            }
+
+    def _get_pool(self, key: _Key) -> _HostPool:
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = _HostPool(self.pool_size)
+            return pool
+
+    def _send(
+        self,
+        pool: _HostPool,
+        key: _Key,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict,
+        read_timeout: float,
+    ) -> HttpResponse:
+        connection, reused = self._checkout(pool, key, read_timeout)
+        try:
+            try:
+                connection.request(method, path, body=body, headers=headers)
+            except _STALE_CONNECTION_ERRORS:
+                # 요청을 다 쓰기 전에 끊김: 서버가 처리할 수 없는 요청이므로 새 연결로 다시 보내도 안전함
+                connection.close()
+                if not reused:
+                    raise
+                connection, reused = self._connect(key, read_timeout), False
+                connection.request(method, path, body=body, headers=headers)
+
+            try:
+                response = self._read_response(connection)
+            except _STALE_CONNECTION_ERRORS as exc:
+                connection.close()
+                if not reused:
+                    raise
+                if method.upper() not in _IDEMPOTENT_METHODS:
+                    raise HttpConnectionLostError(f"connection lost before response: {exc!r}") from exc
+                connection = self._connect(key, read_timeout)
+                connection.request(method, path, body=body, headers=headers)
+                response = self._read_response(connection)
+        except (OSError, http.client.HTTPException) as exc:
+            connection.close()
+            if isinstance(exc, (socket.timeout, TimeoutError)):
+                raise HttpTransportError(f"timed out: {exc}") from exc
+            raise HttpTransportError(str(exc) or type(exc).__name__) from exc
+
+        status, data, will_close = response
+        if will_close:
+            connection.close()
+        else:
+            pool.idle.append(connection)
+        with self._lock:
+            self._requests += 1
+        return HttpResponse(status, data)
+
+    def _checkout(self, pool: _HostPool, key: _Key, read_timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        while True:
+            try:
+                connection = pool.idle.pop()
+            except IndexError:
+                return self._connect(key, read_timeout), False
+            if not self._is_dropped(connection):
+                connection.sock.settimeout(read_timeout)
+                return connection, True
+            connection.close()
+
+    @staticmethod
+    def _is_dropped(connection: http.client.HTTPConnection) -> bool:
+        """유휴 연결이 읽을 수 있는 상태면 서버가 닫은 것(EOF)으로 봅니다. (응답을 기다리는 요청이 없으므로)"""
+        if connection.sock is None:
+            return True
+        try:
+            readable, _, _ = select.select([connection.sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def _connect(self, key: _Key, read_timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            connection = http.client.HTTPSConnection(
+                host, port, timeout=self.connect_timeout, context=self._ssl_context
+            )
+        else:
+            connection = http.client.HTTPConnection(host, port, timeout=self.connect_timeout)
+
+        try:
+            connection.connect()
+        except OSError as exc:
+            connection.close()
+            raise HttpConnectError(f"connect failed: {exc}") from exc
+        connection.sock.settimeout(read_timeout)
+        # 재사용 연결에서 작은 요청이 Nagle 알고리즘과 delayed ACK에 묶여 지연되지 않도록 함
+        connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self._lock:
+            self._connections_created += 1
+        return connection
+
+    @staticmethod
+    def _read_response(connection: http.client.HTTPConnection) -> tuple[int, bytes, bool]:
+        response = connection.getresponse()
+        data = response.read()
+        return response.status, data, response.will_close
@@ -0,0 +1,62 @@
+"""여러 프로세스 중 하나만 리더가 되도록 잠금 파일에 flock을 거는 잠금."""
+
+import os
+from typing import IO
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class LeaderLock:
+    """잠금 파일에 논블로킹 배타적 잠금을 겁니다. 프로세스가 종료되면 OS가 풀어 주므로 다른 프로세스가 이어받습니다."""
+
+    def __init__(self, lock_path: str):
+        """생성자"""
+        self.lock_path = lock_path
+        self._file: IO[str] | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._file is not None
+
+    def acquire(self) -> bool:
+        """잠금을 시도합니다. 이미 가지고 있거나 새로 얻으면 True"""
+        if self._file is not None:
+            return True
+
+        directory = os.path.dirname(os.path.abspath(self.lock_path))
+        os.makedirs(directory, exist_ok=True)
+        # 잠금을 가진 동안 파일을 열어 둬야 하므로 with를 쓰지 않음
+        lock_file = open(self.lock_path, "a+")  # noqa: SIM115
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            return False
+
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._file = lock_file
+        return True
+
+    def release(self) -> None:
+        lock_file, self._file = self._file, None
+        if lock_file is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            lock_file.close()
@@ -0,0 +1,104 @@
+"""bcrypt 해싱/검증을 이벤트 루프 밖의 전용 스레드 풀에서 실행합니다."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .config import config
+from .security import get_password_hash, verify_password
+
+
+class PasswordHasherBusyError(Exception):
+    """해싱 대기열이 가득 차서 요청을 받을 수 없음"""
+
+
+class PasswordHasher:
+    def __init__(self, max_workers: int, queue_limit: int):
+        """생성자
+
+        Args:
+            max_workers: 해싱 스레드 수
+            queue_limit: 스레드를 기다릴 수 있는 최대 작업 수
+        """
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+        self._run_seconds_total = 0.0
+
+    async def hash(self, password: str) -> str:
+        """비밀번호를 해싱합니다. (72바이트 초과 시 ValueError)"""
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호가 해시와 일치하는지 확인합니다."""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queue_limit": self.queue_limit,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "wait_ms_avg": round(self._wait_seconds_total / self._completed * 1000, 2) if self._completed else 0.0,
+                "wait_ms_max": round(self._wait_seconds_max * 1000, 2),
+                "run_ms_avg": round(self._run_seconds_total / self._completed * 1000, 2) if self._completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._queued >= self.queue_limit:
+                self._rejected += 1
+                raise PasswordHasherBusyError("비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도해 주세요.")
+            self._queued += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hash")
+            executor = self._executor
+
+        future = executor.submit(self._execute, time.perf_counter(), func, args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # 아직 시작하지 않은 작업이면 대기열에서 빼고 종료
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def _execute(self, submitted_at: float, func: Callable[..., Any], args: tuple) -> Any:
+        started_at = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            wait_seconds = started_at - submitted_at
+            self._wait_seconds_total += wait_seconds
+            self._wait_seconds_max = max(self._wait_seconds_max, wait_seconds)
+
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._run_seconds_total += time.perf_counter() - started_at
+
+
+password_hasher = PasswordHasher(config.PASSWORD_HASH_WORKERS, config.PASSWORD_HASH_QUEUE_LIMIT)
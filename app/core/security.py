@@ -1,5 +1,4 @@
 from datetime import datetime, timedelta
-from typing import Optional
 
 import bcrypt
 import jwt
@@ -18,20 +17,30 @@ ACCESS_TOKEN_EXPIRE_MINUTES = config.ACCESS_TOKEN_EXPIRE_MINUTES
 class TokenPayload(APIModel):
     id: str
     email: str
+    expires_at: int | None = None  # exp 클레임 (Unix timestamp)
 
 
-def get_password_hash(password: str) -> str:
-    """비밀번호를 해싱하여 반환"""
+def get_password_hash(password: str, rounds: int | None = None) -> str:
+    """비밀번호를 해싱하여 반환 (rounds를 생략하면 PASSWORD_HASH_ROUNDS 사용)"""
     password_bytes = password.encode("utf-8")
 
     # bcrypt backend enforces a 72-byte limit (bytes, not characters).
     if len(password_bytes) > 72:
         raise ValueError("bcrypt passwords are limited to 72 bytes")
 
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds or config.PASSWORD_HASH_ROUNDS)
     return bcrypt.hashpw(password_bytes, salt).decode("utf-8")
 
 
+def password_needs_rehash(hashed_password: str, rounds: int | None = None) -> bool:
+    """저장된 해시의 cost가 현재 설정(PASSWORD_HASH_ROUNDS)과 다른지 확인"""
+    # bcrypt 해시 형식: $2b$<cost>$<salt+hash>
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return False
+    return int(parts[2]) != (rounds or config.PASSWORD_HASH_ROUNDS)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """입력한 비밀번호가 해시된 비밀번호와 일치하는지 확인"""
     try:
@@ -58,7 +67,7 @@ def create_access_token(
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def decode_access_token(token: str) -> Optional[TokenPayload]:
+def decode_access_token(token: str) -> TokenPayload | None:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 
@@ -74,6 +83,7 @@ def decode_access_token(token: str) -> Optional[TokenPayload]:
             return TokenPayload(
                 id=payload.get("id"),
                 email=payload.get("sub"),
+                expires_at=payload.get("exp"),
             )
         except ValidationError:
             print(f"JWT 타입이 올바르지 않음, Payload: {payload}")
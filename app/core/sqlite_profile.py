@@ -0,0 +1,137 @@
+"""SQLite로 동시 요청을 처리하기 위한 엔진 설정. (WAL PRAGMA, 단일 쓰기 연결, 읽기 전용 풀)"""
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.util import await_only
+
+WRITER = "writer"
+READER = "reader"
+
+
+def is_file_sqlite(database_url: str) -> bool:
+    """파일 기반 SQLite URL인지 확인합니다. (메모리 DB는 연결마다 DB가 달라 프로필을 적용하지 않음)"""
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return False
+    database = url.database or ""
+    return database not in ("", ":memory:") and url.query.get("mode") != "memory"
+
+
+class SharedWriteSlot:
+    """여러 쓰기 엔진(동기 + 비동기)이 함께 쓰는 쓰기 연결 슬롯 (한 번에 하나)
+
+    쓰기 풀에서 연결을 꺼낼 때 슬롯을 잡고 반납할 때 놓습니다.
+    비동기 엔진은 이벤트 루프를 막지 않도록 슬롯이 빌 때까지 짧게 양보하며 기다립니다.
+    """
+
+    _ASYNC_POLL_SECONDS = 0.002
+
+    def __init__(self, timeout_seconds: float):
+        """생성자"""
+        self.timeout_seconds = timeout_seconds
+        self._semaphore = threading.Semaphore(1)
+
+    def attach(self, engine: Engine, is_async: bool = False) -> None:
+        """쓰기 엔진(비동기 엔진이면 `.sync_engine`)의 연결 사용을 슬롯으로 묶습니다."""
+
+        @event.listens_for(engine, "checkout")
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+            if is_async:
+                # 비동기 엔진의 풀 체크아웃은 greenlet 안에서 실행되므로 await_only로 기다릴 수 있음
+                await_only(self._acquire_async())
+            elif not self._semaphore.acquire(timeout=self.timeout_seconds):
+                raise sa_exc.TimeoutError(f"SQLite 쓰기 연결 대기 시간 초과 ({self.timeout_seconds}s)")
+            connection_record.info["write_slot"] = True
+
+        @event.listens_for(engine, "checkin")
+        def _on_checkin(dbapi_connection, connection_record):
+            if connection_record is not None and connection_record.info.pop("write_slot", False):
+                self._semaphore.release()
+
+    async def _acquire_async(self) -> None:
+        deadline = time.monotonic() + self.timeout_seconds
+        while not self._semaphore.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                raise sa_exc.TimeoutError(f"SQLite 쓰기 연결 대기 시간 초과 ({self.timeout_seconds}s)")
+            await asyncio.sleep(self._ASYNC_POLL_SECONDS)
+
+
+def sqlite_engine_options(role: str, settings: Any) -> dict[str, Any]:
+    """역할별 풀 설정 (create_engine / create_async_engine 인자)"""
+    if role == WRITER:
+        return {
+            "pool_size": 1,
+            "max_overflow": 0,
+            "pool_timeout": settings.SQLITE_WRITE_TIMEOUT_SECONDS,
+        }
+    return {
+        "pool_size": settings.SQLITE_READ_POOL_SIZE,
+        "max_overflow": 0,
+        "pool_timeout": settings.SQLITE_WRITE_TIMEOUT_SECONDS,
+    }
+
+
+def sqlite_pragmas(settings: Any) -> dict[str, Any]:
+    return {
+        "journal_mode": "WAL",
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+    }
+
+
+def apply_sqlite_profile(
+    engine: Engine,
+    role: str,
+    settings: Any,
+    write_slot: SharedWriteSlot | None = None,
+    is_async: bool = False,
+) -> None:
+    """엔진(비동기 엔진이면 `.sync_engine`)에 PRAGMA와 트랜잭션 시작 방식을 등록합니다.
+
+    write_slot을 주면 쓰기 엔진의 연결 사용을 그 슬롯으로 묶습니다. (다른 쓰기 엔진과 공유)
+    """
+    pragmas = sqlite_pragmas(settings)
+    if role == WRITER and write_slot is not None:
+        write_slot.attach(engine, is_async=is_async)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        # 드라이버의 암묵적 BEGIN을 끄고 아래 begin 이벤트에서 직접 시작
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            if role == READER:
+                cursor.execute("PRAGMA query_only=ON")
+        finally:
+            cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        # 쓰기는 시작할 때 잠금을 잡아서, 읽다가 쓰기로 올라갈 때의 SQLITE_BUSY를 피함
+        conn.exec_driver_sql("BEGIN IMMEDIATE" if role == WRITER else "BEGIN")
+
+
+def create_sqlite_engine(
+    database_url: str,
+    role: str,
+    settings: Any,
+    write_slot: SharedWriteSlot | None = None,
+) -> Engine:
+    """프로필을 적용한 동기 SQLite 엔진을 만듭니다."""
+    created = create_engine(
+        database_url,
+        connect_args={"check_same_thread": False},
+        **sqlite_engine_options(role, settings),
+    )
+    apply_sqlite_profile(created, role, settings, write_slot)
+    return created
@@ -1,29 +1,110 @@
-import secrets
+"""외부 라이브러리 없이 ULID(26자 Crockford base32)를 검증/생성합니다."""
 
-from ulid import ULID
+import os
+import threading
+import time
+
+ENCODING = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+ULID_LENGTH = 26
+MAX_TIMESTAMP_MS = 2**48 - 1
+_RANDOM_BITS = 80
+_MAX_RANDOM = 2**_RANDOM_BITS - 1
+
+_ENCODING_BYTES = ENCODING.encode("ascii")
+# 문자 코드 -> 5비트 값 (허용되지 않는 문자는 0xFF)
+_DECODE_TABLE = bytes(_ENCODING_BYTES.index(code) if code in _ENCODING_BYTES else 0xFF for code in range(256))
+# 10비트 값 -> 문자 2개 (인코딩 시 26자를 13번의 조회로 만듦)
+_PAIR_TABLE = [first + second for first in ENCODING for second in ENCODING]
+_PAIR_SHIFTS = tuple(range(120, -10, -10))
 
 
 def is_valid_ulid(value: str) -> bool:
-    if not isinstance(value, str) or len(value) != 26:
-        return False
-    try:
-        ULID().decode(value)
-    except (TypeError, ValueError):
+    if not isinstance(value, str) or len(value) != ULID_LENGTH or not value.isascii():
         return False
-    return True
+    encoded = value.encode("ascii")
+    # 허용 문자를 모두 지웠을 때 남는 것이 있으면 잘못된 문자 포함 / 첫 글자 '7' 초과는 48비트 초과
+    return not encoded.translate(None, _ENCODING_BYTES) and encoded[0] <= 0x37
+
+
+def decode_ulid(value: str) -> tuple[int, int]:
+    """ULID를 (타임스탬프 ms, 랜덤 80비트)로 분해합니다. 형식이 잘못되면 ValueError"""
+    if not is_valid_ulid(value):
+        raise ValueError(f"잘못된 ULID: {value!r}")
+    number = 0
+    for code in value.encode("ascii"):
+        number = (number << 5) | _DECODE_TABLE[code]
+    return number >> _RANDOM_BITS, number & _MAX_RANDOM
+
+
+def encode_ulid(timestamp_ms: int, randomness: int) -> str:
+    number = (timestamp_ms << _RANDOM_BITS) | randomness
+    return "".join([_PAIR_TABLE[(number >> shift) & 0x3FF] for shift in _PAIR_SHIFTS])
+
+
+def _random80() -> int:
+    return int.from_bytes(os.urandom(10), "big")
+
+
+class MonotonicUlidGenerator:
+    """프로세스 안에서 단조 증가하는 ULID 생성기 (스레드 안전)
+
+    같은 밀리초(또는 시계가 뒤로 간 경우)에는 직전 랜덤 값에 1을 더합니다.
+    랜덤 부분이 넘치면 타임스탬프를 1ms 앞당겨 이어갑니다.
+    """
+
+    def __init__(self):
+        """생성자"""
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def generate(self) -> str:
+        return self.generate_many(1)[0]
+
+    def generate_many(self, count: int) -> list[str]:
+        """ULID count개를 생성 순서(=정렬 순서)대로 반환합니다."""
+        if count <= 0:
+            return []
+
+        now_ms = time.time_ns() // 1_000_000
+        with self._lock:
+            if now_ms > self._last_ms:
+                timestamp_ms, randomness = now_ms, _random80()
+                # 새 밀리초의 첫 값은 여유를 남겨 두어 이어지는 증가분이 넘치지 않게 함
+                randomness &= _MAX_RANDOM >> 1
+            else:
+                timestamp_ms, randomness = self._last_ms, self._last_random + 1
+
+            result: list[str] = []
+            for _ in range(count):
+                if randomness > _MAX_RANDOM:
+                    timestamp_ms, randomness = timestamp_ms + 1, _random80() & (_MAX_RANDOM >> 1)
+                result.append(encode_ulid(timestamp_ms, randomness))
+                randomness += 1
+
+            self._last_ms, self._last_random = timestamp_ms, randomness - 1
+
+        if timestamp_ms > MAX_TIMESTAMP_MS:
+            raise ValueError("ULID 타임스탬프 범위(48비트)를 넘었습니다.")
+        return result
+
+
+_generator = MonotonicUlidGenerator()
 
 
 def generate_ulid(timestamp_ms: int | None = None) -> str:
     """Generate a ULID string."""
 
     if timestamp_ms is None:
-        return ULID().generate()
+        return _generator.generate()
 
     ts_ms = int(timestamp_ms)
-    if ts_ms < 0 or ts_ms >= 2**48:
+    if ts_ms < 0 or ts_ms > MAX_TIMESTAMP_MS:
         raise ValueError("timestamp_ms out of range for ULID (must fit in 48 bits)")
 
-    # Compose a 128-bit ULID value and encode it via py-ulid.
-    rand80 = secrets.randbits(80)
-    value = (ts_ms << 80) | rand80
-    return ULID().encode(value)
+    return encode_ulid(ts_ms, _random80())
+
+
+def generate_many(count: int) -> list[str]:
+    """대량 insert용으로 단조 증가하는 ULID count개를 한 번에 생성합니다."""
+    return _generator.generate_many(count)
@@ -1,5 +1,7 @@
+from .catalog_state import CatalogState
+from .notification_outbox import NotificationOutbox
 from .quiz import Quiz
 from .score import Score
 from .user import User
 
-__all__ = ["Quiz", "User", "Score"]
+__all__ = ["CatalogState", "NotificationOutbox", "Quiz", "Score", "User"]
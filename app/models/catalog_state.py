@@ -0,0 +1,17 @@
+from sqlalchemy import Column, DateTime, Integer, func
+
+from ..core.database import Base
+
+
+class CatalogState(Base):
+    """퀴즈 카탈로그 버전(CatalogState) 테이블 정의
+
+    CSV 동기화로 quizzes가 바뀔 때마다 version이 1씩 올라가며,
+    CSV를 감시하지 않는 다른 프로세스는 이 값만 확인해서 카탈로그를 다시 적재합니다.
+    """
+
+    __tablename__ = "catalog_state"
+
+    id = Column(Integer, primary_key=True)  # 항상 1행만 사용
+    version = Column(Integer, nullable=False, default=0)  # 카탈로그 버전
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())  # 마지막 변경 시간
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, func
+
+from ..core.database import Base
+from ..core.ulid import generate_ulid
+
+
+class NotificationOutbox(Base):
+    """notification-be 발송 대기열(NotificationOutbox) 테이블 정의
+
+    발송 요청은 이 테이블에 커밋만 하고 바로 응답하며, 백그라운드 디스패처가
+    status/next_attempt_at 기준으로 꺼내서 notification-be에 전달합니다.
+    """
+
+    __tablename__ = "notification_outbox"
+    # 디스패처가 발송할 행을 찾는 조건 (status, next_attempt_at)
+    __table_args__ = (Index("ix_notification_outbox_status_next_attempt_at", "status", "next_attempt_at"),)
+
+    id = Column(String(26), primary_key=True, default=generate_ulid)
+    message_type = Column(String(20), nullable=False)  # "user" 또는 "definition"
+    user_id = Column(String(20), nullable=True)  # message_type="user"일 때 수신자
+    definition_code = Column(String(64), nullable=True)  # message_type="definition"일 때 구독 정의
+    requested_by = Column(String(20), nullable=True, index=True)  # 등록한 사용자 (notification-be UserId)
+    template_code = Column(String(64), nullable=False)  # 템플릿 코드
+    status = Column(String(20), nullable=False, default="pending")  # pending/sending/delivered/dead
+    attempts = Column(Integer, nullable=False, default=0)  # 발송 시도 횟수
+    next_attempt_at = Column(DateTime, nullable=False)  # 다음 시도 가능 시간 (sending이면 점유 만료 시간)
+    lease_token = Column(String(26), nullable=True)  # sending 점유마다 새로 발급 (점유한 디스패처만 상태 변경)
+    last_status_code = Column(Integer, nullable=True)  # 마지막 notification-be 응답 코드
+    last_error = Column(Text, nullable=True)  # 마지막 실패 사유
+    created_at = Column(DateTime, default=func.now())  # 등록 시간
+    delivered_at = Column(DateTime, nullable=True)  # 발송 완료 시간
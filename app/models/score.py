@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 
 from ..core.database import Base
@@ -9,6 +9,8 @@ class Score(Base):
     """사용자 점수(Score) 테이블 정의"""
 
     __tablename__ = "scores"
+    # 사용자 + 카테고리당 점수는 1건 (upsert의 ON CONFLICT 대상)
+    __table_args__ = (UniqueConstraint("user_id", "category", name="uq_scores_user_id_category"),)
 
     id = Column(String(26), primary_key=True, index=True, default=generate_ulid)
     user_id = Column(String(26), ForeignKey("users.id"), nullable=False)  # 사용자 ID (외래키)
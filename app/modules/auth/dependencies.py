@@ -0,0 +1,56 @@
+from fastapi import Depends, HTTPException, Security
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db_session, maybe_await
+from app.core.security import decode_access_token
+from app.modules.auth.identity_cache import identity_cache
+from app.modules.auth.repository import AsyncUserRepository, UserRepository
+from app.modules.auth.schemas import AuthenticatedUser
+
+security = HTTPBearer()  # JWT 인증을 위한 Security 객체 생성
+optional_security = HTTPBearer(auto_error=False)  # 토큰이 없어도 통과 (비로그인 허용 API용)
+
+
+async def resolve_user(token: str, db: Session | AsyncSession) -> AuthenticatedUser:
+    """토큰으로 사용자 정보를 찾습니다. 캐시에 있으면 JWT 해독과 DB 조회를 생략합니다."""
+    cached = identity_cache.get(token)
+    if cached is not None:
+        return cached
+
+    user_data = decode_access_token(token)  # JWT 해독
+    if not user_data:
+        raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
+
+    # User 객체 조회
+    user_repo = AsyncUserRepository(db) if isinstance(db, AsyncSession) else UserRepository(db)
+    user = await maybe_await(user_repo.get_by_id(user_data.id))
+    if not user:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+
+    authenticated = AuthenticatedUser(id=user.id, username=user.username, email=user.email)
+    identity_cache.set(token, authenticated, expires_at=user_data.expires_at)
+    return authenticated
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Security(security),
+    db: Session | AsyncSession = Depends(get_db_session),
+) -> AuthenticatedUser:
+    """
+    JWT 토큰을 검증하고, 사용자 정보를 반환
+    """
+    return await resolve_user(credentials.credentials, db)
+
+
+async def get_optional_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Security(optional_security),
+    db: Session | AsyncSession = Depends(get_db_session),
+) -> AuthenticatedUser | None:
+    """
+    토큰이 있으면 검증 후 사용자 정보를, 없으면 None을 반환
+    """
+    if credentials is None:
+        return None
+    return await resolve_user(credentials.credentials, db)
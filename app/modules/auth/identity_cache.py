@@ -0,0 +1,78 @@
+"""토큰 해시 -> `AuthenticatedUser` 캐시. (로그인된 요청마다 users 조회를 하지 않도록)"""
+
+import hashlib
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event
+
+from app.core.cache import LRUCache
+from app.core.config import config
+from app.models.user import User
+from app.modules.auth.schemas import AuthenticatedUser
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class IdentityCache:
+    """토큰 해시(SHA-256)를 키로 `AuthenticatedUser` 스냅샷을 보관합니다.
+
+    - 만료: 토큰의 exp와 AUTH_IDENTITY_CACHE_TTL_SECONDS 중 이른 쪽
+    - 무효화: 이 프로세스에서 User가 ORM으로 수정/삭제되면 그 사용자의 세대(generation)를 올립니다.
+      다른 워커의 변경과 bulk UPDATE/DELETE 문은 TTL이 지나야 반영되므로 TTL은 짧게 유지합니다.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        """생성자"""
+        self._entries = LRUCache(max_size, ttl_seconds)
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> AuthenticatedUser | None:
+        entry = self._entries.get(hash_token(token))
+        if entry is None:
+            return None
+
+        user, generation, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        if generation != self._generation(user.id):
+            return None
+        return user
+
+    def set(self, token: str, user: AuthenticatedUser, expires_at: int | None = None) -> None:
+        ttl_seconds = self._entries.ttl_seconds
+        if expires_at is not None:
+            remaining = expires_at - time.time()
+            if remaining <= 0:
+                return
+            ttl_seconds = remaining if ttl_seconds is None else min(ttl_seconds, remaining)
+
+        entry = (user, self._generation(user.id), expires_at)
+        self._entries.set(hash_token(token), entry, ttl_seconds=ttl_seconds)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """사용자 정보가 바뀌었을 때 해당 사용자의 캐시 항목을 모두 무효화합니다."""
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return self._entries.stats()
+
+    def _generation(self, user_id: str) -> int:
+        return self._generations.get(user_id, 0)
+
+
+identity_cache = IdentityCache(config.AUTH_IDENTITY_CACHE_SIZE, config.AUTH_IDENTITY_CACHE_TTL_SECONDS)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_user(mapper, connection, target: User) -> None:
+    identity_cache.invalidate_user(target.id)
@@ -1,4 +1,5 @@
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models import User
@@ -9,6 +10,10 @@ class UserRepository:
         """생성자"""
         self.db = db
 
+    def get_by_id(self, user_id: str):
+        """ID로 사용자 조회"""
+        return self.db.get(User, user_id)
+
     def get_by_email(self, email: str):
         """이메일로 사용자 조회"""
         stmt = select(User).where(User.email == email)
@@ -30,3 +35,47 @@ class UserRepository:
         self.db.commit()
         self.db.refresh(new_user)
         return new_user
+
+    def update_password_hash(self, user: User, hashed_password: str) -> None:
+        """비밀번호 해시 교체 (cost 변경에 따른 재해싱)"""
+        user.hashed_password = hashed_password
+        self.db.commit()
+
+
+class AsyncUserRepository:
+    """UserRepository의 비동기 세션(AsyncSession) 버전."""
+
+    def __init__(self, db: AsyncSession):
+        """생성자"""
+        self.db = db
+
+    async def get_by_id(self, user_id: str):
+        """ID로 사용자 조회"""
+        return await self.db.get(User, user_id)
+
+    async def get_by_email(self, email: str):
+        """이메일로 사용자 조회"""
+        stmt = select(User).where(User.email == email)
+        return (await self.db.scalars(stmt)).first()
+
+    async def get_by_username(self, username: str):
+        """사용자명으로 사용자 조회"""
+        stmt = select(User).where(User.username == username)
+        return (await self.db.scalars(stmt)).first()
+
+    async def create_user(self, username: str, email: str, hashed_password: str):
+        """새로운 사용자 생성 및 DB 저장"""
+        new_user = User(
+            username=username,
+            email=email,
+            hashed_password=hashed_password,
+        )
+        self.db.add(new_user)
+        await self.db.commit()
+        await self.db.refresh(new_user)
+        return new_user
+
+    async def update_password_hash(self, user: User, hashed_password: str) -> None:
+        """비밀번호 해시 교체 (cost 변경에 따른 재해싱)"""
+        user.hashed_password = hashed_password
+        await self.db.commit()
@@ -2,11 +2,13 @@ import os
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db_session
+from app.core.password_hasher import PasswordHasherBusyError
 from app.core.security import decode_access_token
-from app.modules.auth.repository import UserRepository
+from app.modules.auth.repository import AsyncUserRepository, UserRepository
 from app.modules.auth.schemas import (
     LoginRequest,
     LoginResponse,
@@ -25,11 +27,11 @@ router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 # JWT 만료 시간 설정 (환경 변수에서 가져오기)
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
 
-def _get_auth_service(db: Session = Depends(get_db)) -> AuthService:
-    repo = UserRepository(db)
+def _get_auth_service(db: Session | AsyncSession = Depends(get_db_session)) -> AuthService:
+    repo = AsyncUserRepository(db) if isinstance(db, AsyncSession) else UserRepository(db)
     return AuthService(repo, token_expire_minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
 
@@ -38,11 +40,14 @@ async def signup(
     user: SignupRequest,
     auth_service: AuthService = Depends(_get_auth_service),
 ) -> SignupResponse:
-    new_user, err = await auth_service.signup(
-        user.username,
-        user.email,
-        user.password,
-    )
+    try:
+        new_user, err = await auth_service.signup(
+            user.username,
+            user.email,
+            user.password,
+        )
+    except PasswordHasherBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     if err:
         raise HTTPException(status_code=400, detail=err)
 
@@ -61,7 +66,10 @@ async def login(
     user: LoginRequest,
     auth_service: AuthService = Depends(_get_auth_service),
 ) -> LoginResponse:
-    result, err = await auth_service.login(user.email, user.password)
+    try:
+        result, err = await auth_service.login(user.email, user.password)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     if err:
         raise HTTPException(status_code=401, detail=err)
 
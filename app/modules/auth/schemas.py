@@ -45,3 +45,11 @@ class LogoutResponse(MessageResponse):
 # 기존 코드/임포트와의 호환성 유지
 UserCreate = SignupRequest
 UserLogin = LoginRequest
+
+
+class AuthenticatedUser(APIModel):
+    """인증 의존성이 반환하는 사용자 정보 (세션과 분리된 스냅샷)"""
+
+    id: str
+    username: str
+    email: str
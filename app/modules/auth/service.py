@@ -1,12 +1,13 @@
 from datetime import timedelta
 from typing import Any
 
+from app.core.database import maybe_await
+from app.core.password_hasher import PasswordHasherBusyError, password_hasher
 from app.core.security import (
     create_access_token,
-    get_password_hash,
-    verify_password,
+    password_needs_rehash,
 )
-from app.modules.auth.repository import UserRepository
+from app.modules.auth.repository import AsyncUserRepository, UserRepository
 
 """
 AuthService
@@ -15,7 +16,7 @@ AuthService
 
 주요 책임:
 - 회원가입(중복 검사, 비밀번호 해싱, 사용자 생성)
-- 로그인(이메일/비밀번호 검증, JWT 토큰 발행)
+- 로그인(이메일/비밀번호 검증, JWT 토큰 발행, cost 변경 시 비밀번호 재해싱)
 
 반환 규약:
 - (성공값, None) 또는 (None, 오류메시지) 형태를 사용하여 라우터에서 적절한 HTTP 응답을 구성합니다.
@@ -25,7 +26,7 @@ AuthService
 class AuthService:
     def __init__(
         self,
-        user_repo: UserRepository,
+        user_repo: UserRepository | AsyncUserRepository,
         token_expire_minutes: int = 30,
     ):
         self.user_repo = user_repo
@@ -43,33 +44,38 @@ class AuthService:
             Tuple(User|None, str|None): (생성된 사용자 또는 None, 오류 메시지 또는 None)
         """
         email_lower = email.lower()
-        if self.user_repo.get_by_email(email_lower):
+        if await maybe_await(self.user_repo.get_by_email(email_lower)):
             return None, "이미 존재하는 이메일입니다."
 
-        if self.user_repo.get_by_username(username):
+        if await maybe_await(self.user_repo.get_by_username(username)):
             return None, "이미 존재하는 사용자 이름입니다."
 
         try:
-            hashed_password = get_password_hash(password)
+            hashed_password = await password_hasher.hash(password)
         except ValueError:
             return None, "비밀번호는 72바이트 이하여야 합니다."
-        user = self.user_repo.create_user(
-            username,
-            email_lower,
-            hashed_password,
+        user = await maybe_await(
+            self.user_repo.create_user(
+                username,
+                email_lower,
+                hashed_password,
+            )
         )
         return user, None
 
     async def login(self, email: str, password: str):
         """로그인 처리 및 JWT 토큰 발행"""
         email_lower = email.lower()
-        user = self.user_repo.get_by_email(email_lower)
+        user = await maybe_await(self.user_repo.get_by_email(email_lower))
         if not user:
             return None, "이메일 또는 비밀번호가 잘못되었습니다."
 
-        if not verify_password(password, user.hashed_password):
+        if not await password_hasher.verify(password, user.hashed_password):
             return None, "이메일 또는 비밀번호가 잘못되었습니다."
 
+        if password_needs_rehash(user.hashed_password):
+            await self._rehash_password(user, password)
+
         access_token_expires = timedelta(minutes=self.token_expire_minutes)
         token = create_access_token(
             user_id=user.id,
@@ -83,3 +89,11 @@ class AuthService:
                 "username": user.username,
             },
         }, None
+
+    async def _rehash_password(self, user: Any, password: str) -> None:
+        """현재 PASSWORD_HASH_ROUNDS로 비밀번호를 다시 해싱해 저장합니다."""
+        try:
+            hashed_password = await password_hasher.hash(password)
+        except PasswordHasherBusyError:
+            return  # 혼잡할 때는 건너뛰고 다음 로그인에서 다시 시도
+        await maybe_await(self.user_repo.update_password_hash(user, hashed_password))
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.core.config import config
+from app.modules.auth.dependencies import get_current_user
+from app.modules.auth.schemas import AuthenticatedUser
+from app.modules.metrics.schemas import MetricsResponse
+from app.modules.metrics.service import MetricsService
+
+router = APIRouter()
+
+
+def _get_metrics_service() -> MetricsService:
+    return MetricsService()
+
+
+# 내부 상태(캐시/풀/실행기/outbox/차단기)를 노출하므로 METRICS_ALLOWED_USERS만 호출 가능
+@router.get("/get", response_model=MetricsResponse)
+async def get_metrics(
+    user: AuthenticatedUser = Depends(get_current_user),
+    metrics_service: MetricsService = Depends(_get_metrics_service),
+) -> MetricsResponse:
+    if user.username not in config.METRICS_ALLOWED_USERS:
+        raise HTTPException(
+            status_code=403,
+            detail="운영 지표는 METRICS_ALLOWED_USERS에 등록된 사용자만 조회할 수 있습니다.",
+        )
+
+    metrics = await metrics_service.get_metrics()
+    return MetricsResponse(message="운영 지표 조회 성공", data=metrics)
@@ -0,0 +1,7 @@
+from typing import Any
+
+from app.core.schemas import MessageResponse
+
+
+class MetricsResponse(MessageResponse):
+    data: dict[str, Any]
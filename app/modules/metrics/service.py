@@ -0,0 +1,35 @@
+from typing import Any
+
+from app.core.database import get_pool_metrics
+from app.core.password_hasher import password_hasher
+from app.modules.auth.identity_cache import identity_cache
+from app.modules.notification_test.bulk import recent_sends
+from app.modules.notification_test.executor import notification_executor
+from app.modules.notification_test.outbox import outbox_dispatcher_stats
+from app.modules.notification_test.service import get_resilience_stats
+from app.modules.quiz.catalog import get_quiz_catalog
+from app.modules.quiz.grading import verdict_cache
+
+
+class MetricsService:
+    async def get_metrics(self) -> dict[str, Any]:
+        """서버 내부 캐시/풀 등의 운영 지표를 모아서 반환합니다."""
+        return {
+            "grading": {
+                "catalog_version": get_quiz_catalog().version,
+                "verdict_cache": verdict_cache.stats(),
+            },
+            "auth": {
+                "password_hasher": password_hasher.stats(),
+                "identity_cache": identity_cache.stats(),
+            },
+            "database": {
+                "pools": get_pool_metrics(),
+            },
+            "notification": {
+                "executor": notification_executor.stats(),
+                "outbox_dispatcher": outbox_dispatcher_stats(),
+                **get_resilience_stats(),
+                "bulk_dedup": recent_sends.stats(),
+            },
+        }
@@ -0,0 +1,105 @@
+"""여러 사용자에게 같은 템플릿을 sendUser로 나눠 보내는 bulk 발송."""
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from app.core.cache import LRUCache
+from app.core.config import config
+from app.modules.notification_test.executor import NotificationProxyBusyError
+from app.modules.notification_test.service import AsyncNotificationProxyService, NotificationProxyError
+
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+STATUS_DUPLICATE = "duplicate"
+STATUS_INVALID = "invalid"
+
+# notification-be User_TM.UserId 길이 제한
+MAX_NOTIFICATION_USER_ID_LENGTH = 20
+
+# 최근 발송한 (user_id, template_code) -> True
+recent_sends = LRUCache(
+    max_size=config.TVCF_NOTIFICATION_BULK_DEDUP_MAX_SIZE,
+    ttl_seconds=config.TVCF_NOTIFICATION_BULK_DEDUP_WINDOW_SECONDS,
+)
+
+
+class BulkNotificationSender:
+    """수신자별 결과를 끝나는 순서대로 내보내며, 같은 (user_id, template_code)는 dedup_window 안에서 한 번만 보냅니다.
+
+    호출은 `notification_executor`를 거치므로 전체 notification-be 동시 호출 제한도 그대로 적용됩니다.
+    """
+
+    def __init__(self, proxy_service: AsyncNotificationProxyService, dedup_cache: LRUCache | None = None):
+        """생성자
+
+        Args:
+            proxy_service: notification-be 비동기 프록시
+            dedup_cache: 최근 발송 기록 (생략하면 프로세스 공용 `recent_sends`)
+        """
+        self.proxy_service = proxy_service
+        self.dedup_cache = dedup_cache if dedup_cache is not None else recent_sends
+
+    async def fan_out(
+        self,
+        user_ids: Sequence[str],
+        template_code: str,
+        concurrency: int,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """수신자별 결과를 끝나는 순서대로 내보내고, 마지막에 {"summary": {...}}를 내보냅니다."""
+        pending: asyncio.Queue[str] = asyncio.Queue()
+        for user_id in user_ids:
+            pending.put_nowait(user_id)
+        results: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+
+        async def worker() -> None:
+            while True:
+                try:
+                    user_id = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                await results.put(await self._send_one(user_id, template_code))
+            await results.put(None)
+
+        worker_count = max(1, min(concurrency, len(user_ids)))
+        workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        counts = {STATUS_SENT: 0, STATUS_FAILED: 0, STATUS_DUPLICATE: 0, STATUS_INVALID: 0}
+        finished = 0
+        try:
+            while finished < worker_count:
+                result = await results.get()
+                if result is None:
+                    finished += 1
+                    continue
+                counts[result["status"]] += 1
+                yield result
+        finally:
+            # 클라이언트가 스트림을 끊으면 아직 시작하지 않은 발송은 취소
+            for task in workers:
+                task.cancel()
+
+        yield {"summary": {"template_code": template_code, "total": len(user_ids), **counts}}
+
+    async def _send_one(self, user_id: str, template_code: str) -> dict[str, Any]:
+        result: dict[str, Any] = {"user_id": user_id, "status": STATUS_SENT, "status_code": None, "error": None}
+        if not user_id or len(user_id) > MAX_NOTIFICATION_USER_ID_LENGTH:
+            result.update(status=STATUS_INVALID, error="notification-be UserId는 1~20자여야 합니다.")
+            return result
+
+        dedup_key = (user_id, template_code)
+        if not self.dedup_cache.add(dedup_key, True):
+            result["status"] = STATUS_DUPLICATE
+            return result
+
+        try:
+            response = await self.proxy_service.send_user_message(user_id=user_id, template_code=template_code)
+        except (NotificationProxyError, NotificationProxyBusyError) as exc:
+            self.dedup_cache.pop(dedup_key)
+            result.update(status=STATUS_FAILED, status_code=getattr(exc, "status_code", None), error=str(exc))
+            return result
+        except BaseException:
+            self.dedup_cache.pop(dedup_key)
+            raise
+
+        result["status_code"] = response.status_code
+        return result
@@ -0,0 +1,97 @@
+"""notification-be 호출을 전용 스레드 풀에서 실행하는 실행기."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from app.core.config import config
+
+
+class NotificationProxyBusyError(Exception):
+    """notification-be 호출 대기열이 가득 차서 요청을 받을 수 없음"""
+
+
+class NotificationCallExecutor:
+    def __init__(self, max_concurrency: int, queue_limit: int):
+        """생성자
+
+        Args:
+            max_concurrency: 동시에 실행할 수 있는 notification-be 호출 수
+            queue_limit: 실행을 기다릴 수 있는 최대 호출 수
+        """
+        self.max_concurrency = max_concurrency
+        self.queue_limit = queue_limit
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """func(*args, **kwargs)를 전용 스레드에서 실행하고 결과를 기다립니다."""
+        with self._lock:
+            if self._queued >= self.queue_limit:
+                self._rejected += 1
+                raise NotificationProxyBusyError("notification-be 호출 요청이 많습니다. 잠시 후 다시 시도해 주세요.")
+            self._queued += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="notification-proxy"
+                )
+            executor = self._executor
+
+        future = executor.submit(self._execute, time.perf_counter(), func, args, kwargs)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # 클라이언트가 끊겨 취소된 경우, 아직 시작하지 않은 호출이면 대기열에서 제거
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "queue_limit": self.queue_limit,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "wait_ms_avg": round(self._wait_seconds_total / self._completed * 1000, 2) if self._completed else 0.0,
+                "wait_ms_max": round(self._wait_seconds_max * 1000, 2),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _execute(self, submitted_at: float, func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            wait_seconds = time.perf_counter() - submitted_at
+            self._wait_seconds_total += wait_seconds
+            self._wait_seconds_max = max(self._wait_seconds_max, wait_seconds)
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+
+notification_executor = NotificationCallExecutor(
+    config.TVCF_NOTIFICATION_MAX_CONCURRENCY,
+    config.TVCF_NOTIFICATION_QUEUE_LIMIT,
+)
@@ -0,0 +1,279 @@
+"""notification-be 발송을 요청 처리와 분리하는 outbox와 백그라운드 디스패처."""
+
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.core.config import config
+from app.core.database import SessionLocal
+from app.models import NotificationOutbox
+from app.modules.notification_test.repository import NotificationOutboxRepository
+from app.modules.notification_test.service import (
+    NotificationCircuitOpenError,
+    NotificationProxyError,
+    NotificationProxyService,
+    get_notification_proxy_service,
+)
+
+MESSAGE_TYPE_USER = "user"
+MESSAGE_TYPE_DEFINITION = "definition"
+
+# 4xx 중에서도 잠시 뒤 다시 보내면 성공할 수 있는 응답
+_RETRYABLE_CLIENT_STATUSES = {408, 425, 429}
+
+
+def utcnow() -> datetime:
+    """DB에 저장하는 시간 (UTC, timezone 정보 없음)"""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def backoff_seconds(attempts: int, base_seconds: float, max_seconds: float) -> float:
+    """attempts번째 시도가 실패한 뒤 다음 시도까지 기다릴 시간"""
+    return min(base_seconds * (2 ** max(attempts - 1, 0)), max_seconds)
+
+
+def is_retryable(error: NotificationProxyError) -> bool:
+    """응답을 못 받았거나(연결 실패/타임아웃) 5xx/429 등이면 재시도합니다."""
+    status_code = error.status_code
+    return status_code is None or status_code >= 500 or status_code in _RETRYABLE_CLIENT_STATUSES
+
+
+class NotificationOutboxService:
+    def __init__(self, repo: NotificationOutboxRepository, on_enqueue: Callable[[], None] | None = None):
+        """생성자
+
+        Args:
+            repo: outbox 저장소
+            on_enqueue: 행을 넣은 뒤 호출 (같은 프로세스의 디스패처를 바로 깨움)
+        """
+        self.repo = repo
+        self.on_enqueue = on_enqueue
+
+    def enqueue_user_message(self, user_id: str, template_code: str) -> NotificationOutbox:
+        """user_id 본인에게 보내는 발송을 등록합니다."""
+        return self._enqueue(MESSAGE_TYPE_USER, template_code, user_id=user_id, requested_by=user_id)
+
+    def enqueue_definition_message(
+        self,
+        definition_code: str,
+        template_code: str,
+        requested_by: str,
+    ) -> NotificationOutbox:
+        return self._enqueue(
+            MESSAGE_TYPE_DEFINITION,
+            template_code,
+            definition_code=definition_code,
+            requested_by=requested_by,
+        )
+
+    def get_entry(self, outbox_id: str, requested_by: str) -> NotificationOutbox | None:
+        """requested_by가 등록한 행만 반환합니다. (다른 사용자의 행은 None)"""
+        entry = self.repo.get(outbox_id)
+        if entry is None or entry.requested_by != requested_by:
+            return None
+        return entry
+
+    def list_entries(self, requested_by: str, status: str | None, limit: int) -> list[NotificationOutbox]:
+        return self.repo.list_by_status(requested_by, status, limit)
+
+    def count_by_status(self, requested_by: str) -> dict[str, int]:
+        return self.repo.count_by_status(requested_by)
+
+    def _enqueue(self, message_type: str, template_code: str, **targets: str | None) -> NotificationOutbox:
+        entry = self.repo.enqueue(message_type, template_code, utcnow(), **targets)
+        if self.on_enqueue is not None:
+            self.on_enqueue()
+        return entry
+
+
+class NotificationOutboxDispatcher:
+    """notification_outbox를 주기적으로(또는 enqueue 직후) 비우는 백그라운드 워커
+
+    행을 점유(lease)해 발송하고, 실패하면 지수 백오프 뒤 다시 시도합니다. (max_attempts 초과나 4xx면 dead)
+    상태 변경은 점유 때 받은 lease_token이 그대로일 때만 반영합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        proxy_factory: Callable[[], NotificationProxyService],
+        batch_size: int,
+        poll_seconds: float,
+        max_attempts: int,
+        backoff_base_seconds: float,
+        backoff_max_seconds: float,
+        lease_seconds: float,
+    ):
+        """생성자"""
+        self.session_factory = session_factory
+        self.proxy_factory = proxy_factory
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.lease_seconds = lease_seconds
+        self._stats_lock = threading.Lock()
+        self._delivered = 0
+        self._retried = 0
+        self._dead = 0
+        self._deferred = 0
+        self._lost_leases = 0
+        self._paused_until = datetime.min
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="notification-outbox", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def wake(self) -> None:
+        """다음 확인 주기를 기다리지 않고 바로 대기열을 확인하게 합니다."""
+        self._wake_event.set()
+
+    def run_once(self) -> int:
+        """최대 batch_size개 행을 하나씩 점유해 발송합니다. 처리한 행 수를 반환합니다.
+
+        행은 발송 직전에 하나씩 점유하므로 점유 시간(lease_seconds)은 호출 한 번만 감싸면 됩니다.
+        """
+        if utcnow() < self._paused_until:
+            return 0
+
+        processed = 0
+        with self.session_factory() as session:
+            repo = NotificationOutboxRepository(session)
+            proxy_service = None
+            while processed < self.batch_size:
+                entry = repo.claim_next(utcnow(), self.lease_seconds)
+                if entry is None:
+                    break
+                processed += 1
+                if proxy_service is None:
+                    proxy_service = self.proxy_factory()
+                try:
+                    self._deliver(repo, proxy_service, entry)
+                except NotificationCircuitOpenError as exc:
+                    # 차단 해제 시점까지 남은 행은 꺼내지 않음
+                    self._paused_until = utcnow() + timedelta(seconds=exc.retry_after_seconds)
+                    if repo.defer(entry, str(exc), self._paused_until):
+                        with self._stats_lock:
+                            self._deferred += 1
+                    break
+        return processed
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "running": self._thread.is_alive(),
+                "delivered": self._delivered,
+                "retried": self._retried,
+                "dead": self._dead,
+                "deferred": self._deferred,
+                "lost_leases": self._lost_leases,
+            }
+
+    def _deliver(
+        self,
+        repo: NotificationOutboxRepository,
+        proxy_service: NotificationProxyService,
+        entry: NotificationOutbox,
+    ) -> None:
+        try:
+            if entry.message_type == MESSAGE_TYPE_USER:
+                result = proxy_service.send_user_message(entry.user_id, entry.template_code)
+            else:
+                result = proxy_service.send_definition_message(entry.definition_code, entry.template_code)
+        except NotificationCircuitOpenError:
+            raise
+        except NotificationProxyError as exc:
+            retry_at = None
+            if is_retryable(exc) and entry.attempts < self.max_attempts:
+                delay = backoff_seconds(entry.attempts, self.backoff_base_seconds, self.backoff_max_seconds)
+                retry_at = utcnow() + timedelta(seconds=delay)
+            if not repo.mark_failed(entry, exc.status_code, str(exc), retry_at):
+                self._record_lost_lease(entry)
+                return
+            with self._stats_lock:
+                if retry_at is None:
+                    self._dead += 1
+                else:
+                    self._retried += 1
+            return
+
+        if not repo.mark_delivered(entry, result.status_code, utcnow()):
+            self._record_lost_lease(entry)
+            return
+        with self._stats_lock:
+            self._delivered += 1
+
+    def _record_lost_lease(self, entry: NotificationOutbox) -> None:
+        # 호출이 점유 시간보다 오래 걸려 다른 디스패처가 이미 다시 꺼낸 경우 (결과는 그쪽이 기록)
+        print(f"notification outbox {entry.id} 점유가 만료되어 발송 결과를 기록하지 않았습니다.")
+        with self._stats_lock:
+            self._lost_leases += 1
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                # 배치를 가득 채웠으면 남은 행이 있을 수 있으므로 기다리지 않고 이어서 처리
+                if self.run_once() >= self.batch_size:
+                    continue
+            except Exception as e:
+                print(f"notification outbox 발송 중 오류 발생: {str(e)}")
+            self._wake_event.wait(self.poll_seconds)
+            self._wake_event.clear()
+
+
+dispatcher: NotificationOutboxDispatcher | None = None  # 이 프로세스의 outbox 디스패처
+
+
+def get_outbox_proxy_service() -> NotificationProxyService:
+    """디스패처용 프록시 서비스. 재시도는 outbox 백오프만 하도록 요청 안 재시도는 끕니다.
+
+    (요청 안에서 다시 보내면 시도 횟수가 max_attempts x max_retries로 늘고, 대기하는 동안 디스패처 스레드가 멈춤)
+    """
+    return get_notification_proxy_service(max_retries=0)
+
+
+def start_outbox_dispatcher() -> None:
+    """FCM 테스트 프록시와 디스패처가 켜져 있으면 outbox 발송을 시작합니다."""
+    global dispatcher
+    if dispatcher is not None or not (config.FCM_TEST_PROXY_ENABLED and config.NOTIFICATION_OUTBOX_DISPATCHER_ENABLED):
+        return
+
+    dispatcher = NotificationOutboxDispatcher(
+        SessionLocal,
+        get_outbox_proxy_service,
+        batch_size=config.NOTIFICATION_OUTBOX_BATCH_SIZE,
+        poll_seconds=config.NOTIFICATION_OUTBOX_POLL_SECONDS,
+        max_attempts=config.NOTIFICATION_OUTBOX_MAX_ATTEMPTS,
+        backoff_base_seconds=config.NOTIFICATION_OUTBOX_BACKOFF_BASE_SECONDS,
+        backoff_max_seconds=config.NOTIFICATION_OUTBOX_BACKOFF_MAX_SECONDS,
+        lease_seconds=config.NOTIFICATION_OUTBOX_LEASE_SECONDS,
+    )
+    dispatcher.start()
+
+
+def stop_outbox_dispatcher() -> None:
+    global dispatcher
+    if dispatcher is not None:
+        dispatcher.stop()
+        dispatcher = None
+
+
+def wake_outbox_dispatcher() -> None:
+    if dispatcher is not None:
+        dispatcher.wake()
+
+
+def outbox_dispatcher_stats() -> dict[str, Any]:
+    return dispatcher.stats() if dispatcher is not None else {"running": False}
@@ -0,0 +1,198 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import Select, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import prefer_replica
+from app.core.ulid import generate_ulid
+from app.models import NotificationOutbox, Score, User
+
+OUTBOX_PENDING = "pending"
+OUTBOX_SENDING = "sending"
+OUTBOX_DELIVERED = "delivered"
+OUTBOX_DEAD = "dead"
+OUTBOX_STATUSES = (OUTBOX_PENDING, OUTBOX_SENDING, OUTBOX_DELIVERED, OUTBOX_DEAD)
+
+# 점유를 시도할 후보 수 (다른 프로세스가 먼저 가져간 행은 건너뜀)
+_CLAIM_CANDIDATES = 5
+
+
+def _build_fetch_usernames_by_score_category_stmt(category: str, min_score: int | None) -> Select:
+    stmt = (
+        select(User.username)
+        .select_from(Score)
+        .join(User, Score.user_id == User.id)
+        .where(Score.category == category)
+        .order_by(User.username)
+    )
+    if min_score is not None:
+        stmt = stmt.where(Score.score >= min_score)
+    return prefer_replica(stmt)
+
+
+class NotificationRecipientRepository:
+    """일괄 발송 대상(notification-be UserId = username) 조회"""
+
+    def __init__(self, db: Session):
+        """생성자"""
+        self.db = db
+
+    def fetch_usernames_by_score_category(self, category: str, min_score: int | None = None) -> list[str]:
+        """category에 점수가 있는 사용자의 username 목록 (min_score 이상만)"""
+        return list(self.db.scalars(_build_fetch_usernames_by_score_category_stmt(category, min_score)))
+
+
+class AsyncNotificationRecipientRepository:
+    """NotificationRecipientRepository의 비동기 세션(AsyncSession) 버전."""
+
+    def __init__(self, db: AsyncSession):
+        """생성자"""
+        self.db = db
+
+    async def fetch_usernames_by_score_category(self, category: str, min_score: int | None = None) -> list[str]:
+        """category에 점수가 있는 사용자의 username 목록 (min_score 이상만)"""
+        return list(await self.db.scalars(_build_fetch_usernames_by_score_category_stmt(category, min_score)))
+
+
+class NotificationOutboxRepository:
+    def __init__(self, db: Session):
+        """생성자"""
+        self.db = db
+
+    def enqueue(
+        self,
+        message_type: str,
+        template_code: str,
+        now: datetime,
+        user_id: str | None = None,
+        definition_code: str | None = None,
+        requested_by: str | None = None,
+    ) -> NotificationOutbox:
+        """발송 요청을 대기열에 넣고 즉시 커밋합니다."""
+        entry = NotificationOutbox(
+            message_type=message_type,
+            user_id=user_id,
+            definition_code=definition_code,
+            requested_by=requested_by,
+            template_code=template_code,
+            status=OUTBOX_PENDING,
+            attempts=0,
+            next_attempt_at=now,
+        )
+        self.db.add(entry)
+        self.db.commit()
+        self.db.refresh(entry)
+        return entry
+
+    def get(self, outbox_id: str) -> NotificationOutbox | None:
+        return self.db.get(NotificationOutbox, outbox_id)
+
+    def list_by_status(self, requested_by: str, status: str | None, limit: int) -> list[NotificationOutbox]:
+        """requested_by가 등록한 행을 최근 등록 순으로 조회합니다. (status가 없으면 전체)"""
+        stmt = (
+            select(NotificationOutbox)
+            .where(NotificationOutbox.requested_by == requested_by)
+            .order_by(NotificationOutbox.id.desc())
+            .limit(limit)
+        )
+        if status:
+            stmt = stmt.where(NotificationOutbox.status == status)
+        return list(self.db.scalars(stmt))
+
+    def count_by_status(self, requested_by: str | None = None) -> dict[str, int]:
+        """상태별 건수 (requested_by가 있으면 그 사용자가 등록한 행만)"""
+        stmt = select(NotificationOutbox.status, func.count()).group_by(NotificationOutbox.status)
+        if requested_by is not None:
+            stmt = stmt.where(NotificationOutbox.requested_by == requested_by)
+        rows = self.db.execute(stmt).all()
+        counts = {status: 0 for status in OUTBOX_STATUSES}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def claim_next(self, now: datetime, lease_seconds: float) -> NotificationOutbox | None:
+        """발송할 행 하나를 점유(sending)하고 시도 횟수를 올린 뒤 커밋합니다. 없으면 None
+
+        점유 만료(next_attempt_at)가 지난 sending 행은 발송 도중 프로세스가 중단된 것으로 보고 다시 꺼냅니다.
+        읽은 값 그대로일 때만 갱신하므로 여러 프로세스가 동시에 꺼내도 한 곳에서만 점유하고,
+        점유마다 새 lease_token을 발급해 이후 상태 변경은 그 토큰을 가진 쪽만 할 수 있습니다.
+        """
+        candidates = self.db.execute(
+            select(NotificationOutbox.id, NotificationOutbox.status, NotificationOutbox.next_attempt_at)
+            .where(
+                NotificationOutbox.status.in_((OUTBOX_PENDING, OUTBOX_SENDING)),
+                NotificationOutbox.next_attempt_at <= now,
+            )
+            .order_by(NotificationOutbox.next_attempt_at)
+            .limit(_CLAIM_CANDIDATES)
+        ).all()
+
+        for outbox_id, status, next_attempt_at in candidates:
+            lease_token = generate_ulid()
+            result = self.db.execute(
+                update(NotificationOutbox)
+                .where(
+                    NotificationOutbox.id == outbox_id,
+                    NotificationOutbox.status == status,
+                    NotificationOutbox.next_attempt_at == next_attempt_at,
+                )
+                .values(
+                    status=OUTBOX_SENDING,
+                    attempts=NotificationOutbox.attempts + 1,
+                    next_attempt_at=now + timedelta(seconds=lease_seconds),
+                    lease_token=lease_token,
+                )
+            )
+            self.db.commit()
+            if result.rowcount == 1:
+                return self.db.get(NotificationOutbox, outbox_id, populate_existing=True)
+        return None
+
+    def mark_delivered(self, entry: NotificationOutbox, status_code: int, now: datetime) -> bool:
+        """점유 중인 행을 delivered로 옮깁니다. 점유를 잃었으면(다른 곳에서 다시 꺼냄) False"""
+        return self._release(
+            entry,
+            status=OUTBOX_DELIVERED,
+            last_status_code=status_code,
+            last_error=None,
+            delivered_at=now,
+        )
+
+    def mark_failed(
+        self,
+        entry: NotificationOutbox,
+        status_code: int | None,
+        error: str,
+        retry_at: datetime | None,
+    ) -> bool:
+        """실패를 기록합니다. retry_at이 없으면 더 이상 재시도하지 않고 dead로 옮깁니다."""
+        values = {"last_status_code": status_code, "last_error": error}
+        if retry_at is None:
+            values["status"] = OUTBOX_DEAD
+        else:
+            values.update(status=OUTBOX_PENDING, next_attempt_at=retry_at)
+        return self._release(entry, **values)
+
+    def defer(self, entry: NotificationOutbox, error: str, retry_at: datetime) -> bool:
+        """호출하지 못한 시도(차단기 open 등)를 되돌리고 retry_at에 다시 꺼내도록 합니다. (시도 횟수 미차감)"""
+        return self._release(
+            entry,
+            status=OUTBOX_PENDING,
+            attempts=NotificationOutbox.attempts - 1,
+            next_attempt_at=retry_at,
+            last_error=error,
+        )
+
+    def _release(self, entry: NotificationOutbox, **values) -> bool:
+        # 점유했을 때의 상태(sending + lease_token)가 그대로일 때만 변경
+        result = self.db.execute(
+            update(NotificationOutbox)
+            .where(
+                NotificationOutbox.id == entry.id,
+                NotificationOutbox.status == OUTBOX_SENDING,
+                NotificationOutbox.lease_token == entry.lease_token,
+            )
+            .values(lease_token=None, **values)
+        )
+        self.db.commit()
+        return result.rowcount == 1
@@ -1,12 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, Security
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+import json
+import math
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import config
-from app.core.database import get_db
-from app.core.security import decode_access_token
-from app.models.user import User
+from app.core.database import get_db, get_db_session, maybe_await
+from app.modules.auth.dependencies import get_optional_current_user
+from app.modules.auth.schemas import AuthenticatedUser
+from app.modules.notification_test.bulk import BulkNotificationSender
+from app.modules.notification_test.executor import NotificationProxyBusyError
+from app.modules.notification_test.outbox import NotificationOutboxService, wake_outbox_dispatcher
+from app.modules.notification_test.repository import (
+    AsyncNotificationRecipientRepository,
+    NotificationOutboxRepository,
+    NotificationRecipientRepository,
+)
 from app.modules.notification_test.schemas import (
+    BulkSendNotificationTestRequest,
+    NotificationOutboxEnqueueResponse,
+    NotificationOutboxEntry,
+    NotificationOutboxListResponse,
     NotificationTestConfigResponse,
     RegisterDeviceTestRequest,
     RegisterDeviceTestResponse,
@@ -17,34 +34,16 @@ from app.modules.notification_test.schemas import (
     SubscribeDefinitionTestResponse,
 )
 from app.modules.notification_test.service import (
+    AsyncNotificationProxyService,
+    NotificationCircuitOpenError,
     NotificationProxyError,
-    NotificationProxyService,
-    get_notification_proxy_service,
+    get_async_notification_proxy_service,
 )
 
 router = APIRouter()
-security = HTTPBearer(auto_error=False)
-
-
-def get_optional_current_user(
-    credentials: HTTPAuthorizationCredentials | None = Security(security),
-    db: Session = Depends(get_db),
-) -> User | None:
-    if credentials is None:
-        return None
-
-    payload = decode_access_token(credentials.credentials)
-    if payload is None:
-        raise HTTPException(status_code=401, detail="유효하지 않거나 만료된 토큰입니다.")
-
-    user = db.query(User).filter(User.id == payload.id).first()
-    if user is None:
-        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-    return user
 
-
-def map_notification_user_id(user: User) -> str:
+def map_notification_user_id(user: AuthenticatedUser) -> str:
     notification_user_id = user.username.strip()
     if not notification_user_id:
         raise HTTPException(status_code=400, detail="notification-be UserId로 사용할 username이 없습니다.")
@@ -56,12 +55,53 @@ def map_notification_user_id(user: User) -> str:
     return notification_user_id
 
 
-def require_current_user(current_user: User | None) -> User:
+def require_current_user(current_user: AuthenticatedUser | None) -> AuthenticatedUser:
     if current_user is None:
         raise HTTPException(status_code=401, detail="FCM 테스트는 Coding_Quiz 로그인이 필요합니다.")
     return current_user
 
 
+def to_http_exception(
+    exc: NotificationProxyBusyError | NotificationProxyError,
+    target_url: str,
+    request_body: dict,
+) -> HTTPException:
+    """notification-be 호출 실패를 응답으로 변환합니다.
+
+    대기열 초과/차단기 open은 Retry-After를 붙인 503, 그 밖의 호출 실패는 502입니다.
+    """
+    if isinstance(exc, NotificationProxyBusyError):
+        return HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"})
+    if isinstance(exc, NotificationCircuitOpenError):
+        return HTTPException(
+            status_code=503,
+            detail=str(exc),
+            headers={"Retry-After": str(max(math.ceil(exc.retry_after_seconds), 1))},
+        )
+    return HTTPException(
+        status_code=502,
+        detail={
+            "message": str(exc),
+            "target_url": target_url,
+            "notification_status_code": exc.status_code,
+            "notification_body": exc.body,
+            "request_body": request_body,
+        },
+    )
+
+
+def _get_outbox_service(db: Session = Depends(get_db)) -> NotificationOutboxService:
+    return NotificationOutboxService(NotificationOutboxRepository(db), on_enqueue=wake_outbox_dispatcher)
+
+
+def _get_recipient_repository(
+    db: Session | AsyncSession = Depends(get_db_session),
+) -> NotificationRecipientRepository | AsyncNotificationRecipientRepository:
+    if isinstance(db, AsyncSession):
+        return AsyncNotificationRecipientRepository(db)
+    return NotificationRecipientRepository(db)
+
+
 # 현재 테스트 설정 반환
 @router.get("/config", response_model=NotificationTestConfigResponse)
 def get_notification_test_config() -> NotificationTestConfigResponse:
@@ -79,11 +119,11 @@ def get_notification_test_config() -> NotificationTestConfigResponse:
 
 # Post /v1/devices 로그인 유저 기준으로 FCM token 등록
 @router.post("/register-device", response_model=RegisterDeviceTestResponse)
-def register_test_device(
+async def register_test_device(
     request: Request,
     payload: RegisterDeviceTestRequest,
-    current_user: User | None = Depends(get_optional_current_user),
-    notification_proxy_service: NotificationProxyService = Depends(get_notification_proxy_service),
+    current_user: AuthenticatedUser | None = Depends(get_optional_current_user),
+    notification_proxy_service: AsyncNotificationProxyService = Depends(get_async_notification_proxy_service),
 ) -> RegisterDeviceTestResponse:
     if not config.FCM_TEST_PROXY_ENABLED:
         raise HTTPException(status_code=404, detail="FCM test proxy is disabled.")
@@ -94,22 +134,13 @@ def register_test_device(
     request_body["notification_user_id"] = notification_user_id
 
     try:
-        notification_response = notification_proxy_service.register_device(
+        notification_response = await notification_proxy_service.register_device(
             registration_token=payload.registration_token,
             notification_user_id=notification_user_id,
             user_agent=request.headers.get("User-Agent"),
         )
-    except NotificationProxyError as exc:
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "message": str(exc),
-                "target_url": notification_proxy_service.device_url,
-                "notification_status_code": exc.status_code,
-                "notification_body": exc.body,
-                "request_body": request_body,
-            },
-        ) from exc
+    except (NotificationProxyBusyError, NotificationProxyError) as exc:
+        raise to_http_exception(exc, notification_proxy_service.device_url, request_body) from exc
 
     return RegisterDeviceTestResponse(
         message="notification-be 디바이스 등록 요청을 완료했습니다.",
@@ -122,10 +153,10 @@ def register_test_device(
 
 # Post /v1/subscriptions 로그인 유저 기준으로 구독 등록
 @router.post("/subscribe-definition", response_model=SubscribeDefinitionTestResponse)
-def subscribe_test_definition(
+async def subscribe_test_definition(
     payload: SubscribeDefinitionTestRequest,
-    current_user: User | None = Depends(get_optional_current_user),
-    notification_proxy_service: NotificationProxyService = Depends(get_notification_proxy_service),
+    current_user: AuthenticatedUser | None = Depends(get_optional_current_user),
+    notification_proxy_service: AsyncNotificationProxyService = Depends(get_async_notification_proxy_service),
 ) -> SubscribeDefinitionTestResponse:
     if not config.FCM_TEST_PROXY_ENABLED:
         raise HTTPException(status_code=404, detail="FCM test proxy is disabled.")
@@ -145,21 +176,12 @@ def subscribe_test_definition(
     }
 
     try:
-        notification_response = notification_proxy_service.subscribe_definition(
+        notification_response = await notification_proxy_service.subscribe_definition(
             user_id=user_id,
             definition_code=definition_code,
         )
-    except NotificationProxyError as exc:
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "message": str(exc),
-                "target_url": notification_proxy_service.subscription_url,
-                "notification_status_code": exc.status_code,
-                "notification_body": exc.body,
-                "request_body": request_body,
-            },
-        ) from exc
+    except (NotificationProxyBusyError, NotificationProxyError) as exc:
+        raise to_http_exception(exc, notification_proxy_service.subscription_url, request_body) from exc
 
     return SubscribeDefinitionTestResponse(
         message="notification-be 구독 등록 요청을 완료했습니다.",
@@ -172,10 +194,10 @@ def subscribe_test_definition(
 
 # Post /v1/messages:sendUser 로그인 유저 기준으로 직접 발송
 @router.post("/send", response_model=SendNotificationTestResponse)
-def send_test_notification(
+async def send_test_notification(
     payload: SendNotificationTestRequest,
-    current_user: User | None = Depends(get_optional_current_user),
-    notification_proxy_service: NotificationProxyService = Depends(get_notification_proxy_service),
+    current_user: AuthenticatedUser | None = Depends(get_optional_current_user),
+    notification_proxy_service: AsyncNotificationProxyService = Depends(get_async_notification_proxy_service),
 ) -> SendNotificationTestResponse:
     if not config.FCM_TEST_PROXY_ENABLED:
         raise HTTPException(status_code=404, detail="FCM test proxy is disabled.")
@@ -195,21 +217,12 @@ def send_test_notification(
     }
 
     try:
-        notification_response = notification_proxy_service.send_user_message(
+        notification_response = await notification_proxy_service.send_user_message(
             user_id=user_id,
             template_code=template_code,
         )
-    except NotificationProxyError as exc:
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "message": str(exc),
-                "target_url": notification_proxy_service.send_user_url,
-                "notification_status_code": exc.status_code,
-                "notification_body": exc.body,
-                "request_body": request_body,
-            },
-        ) from exc
+    except (NotificationProxyBusyError, NotificationProxyError) as exc:
+        raise to_http_exception(exc, notification_proxy_service.send_user_url, request_body) from exc
 
     return SendNotificationTestResponse(
         message="notification-be 발송 요청을 완료했습니다.",
@@ -222,10 +235,10 @@ def send_test_notification(
 
 # Post /v1/messages:sendDefinition 로그인 유저 기준으로 구독 기반 발송
 @router.post("/send-definition", response_model=SendNotificationTestResponse)
-def send_test_definition_notification(
+async def send_test_definition_notification(
     payload: SendDefinitionNotificationTestRequest,
-    current_user: User | None = Depends(get_optional_current_user),
-    notification_proxy_service: NotificationProxyService = Depends(get_notification_proxy_service),
+    current_user: AuthenticatedUser | None = Depends(get_optional_current_user),
+    notification_proxy_service: AsyncNotificationProxyService = Depends(get_async_notification_proxy_service),
 ) -> SendNotificationTestResponse:
     if not config.FCM_TEST_PROXY_ENABLED:
         raise HTTPException(status_code=404, detail="FCM test proxy is disabled.")
@@ -251,21 +264,12 @@ def send_test_definition_notification(
     }
 
     try:
-        notification_response = notification_proxy_service.send_definition_message(
+        notification_response = await notification_proxy_service.send_definition_message(
             definition_code=definition_code,
             template_code=template_code,
         )
-    except NotificationProxyError as exc:
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "message": str(exc),
-                "target_url": notification_proxy_service.send_definition_url,
-                "notification_status_code": exc.status_code,
-                "notification_body": exc.body,
-                "request_body": request_body,
-            },
-        ) from exc
+    except (NotificationProxyBusyError, NotificationProxyError) as exc:
+        raise to_http_exception(exc, notification_proxy_service.send_definition_url, request_body) from exc
 
     return SendNotificationTestResponse(
         message="notification-be 구독 기반 발송 요청을 완료했습니다.",
@@ -274,3 +278,153 @@ def send_test_definition_notification(
         notification_response=notification_response,
         notification_user_id=notification_user_id,
     )
+
+
+# 로그인 유저 기준 직접 발송을 outbox에 등록 (notification-be 호출은 백그라운드에서)
+@router.post("/outbox/send", response_model=NotificationOutboxEnqueueResponse, status_code=202)
+def enqueue_test_notification(
+    payload: SendNotificationTestRequest,
+    current_user: AuthenticatedUser | None = Depends(get_optional_current_user),
+    outbox_service: NotificationOutboxService = Depends(_get_outbox_service),
+) -> NotificationOutboxEnqueueResponse:
+    if not config.FCM_TEST_PROXY_ENABLED:
+        raise HTTPException(status_code=404, detail="FCM test proxy is disabled.")
+
+    user_id = map_notification_user_id(require_current_user(current_user))
+    template_code = payload.template_code or config.FCM_TEST_TEMPLATE_CODE
+    if not template_code:
+        raise HTTPException(
+            status_code=400,
+            detail="template_code가 필요합니다. 요청 body나 .env의 FCM_TEST_TEMPLATE_CODE로 설정하세요.",
+        )
+
+    entry = outbox_service.enqueue_user_message(user_id=user_id, template_code=template_code)
+    return NotificationOutboxEnqueueResponse(
+        message="notification-be 발송 요청을 대기열에 등록했습니다.",
+        entry=NotificationOutboxEntry.model_validate(entry),
+    )
+
+
+# 구독 기반 발송을 outbox에 등록
+@router.post("/outbox/send-definition", response_model=NotificationOutboxEnqueueResponse, status_code=202)
+def enqueue_test_definition_notification(
+    payload: SendDefinitionNotificationTestRequest,
+    current_user: AuthenticatedUser | None = Depends(get_optional_current_user),
+    outbox_service: NotificationOutboxService = Depends(_get_outbox_service),
+) -> NotificationOutboxEnqueueResponse:
+    if not config.FCM_TEST_PROXY_ENABLED:
+        raise HTTPException(status_code=404, detail="FCM test proxy is disabled.")
+
+    requested_by = map_notification_user_id(require_current_user(current_user))
+    definition_code = payload.definition_code or config.FCM_TEST_DEFINITION_CODE
+    template_code = payload.template_code or config.FCM_TEST_TEMPLATE_CODE
+    if not definition_code:
+        raise HTTPException(
+            status_code=400,
+            detail="definition_code가 필요합니다. 요청 body나 .env의 FCM_TEST_DEFINITION_CODE로 설정하세요.",
+        )
+    if not template_code:
+        raise HTTPException(
+            status_code=400,
+            detail="template_code가 필요합니다. 요청 body나 .env의 FCM_TEST_TEMPLATE_CODE로 설정하세요.",
+        )
+
+    entry = outbox_service.enqueue_definition_message(
+        definition_code=definition_code,
+        template_code=template_code,
+        requested_by=requested_by,
+    )
+    return NotificationOutboxEnqueueResponse(
+        message="notification-be 구독 기반 발송 요청을 대기열에 등록했습니다.",
+        entry=NotificationOutboxEntry.model_validate(entry),
+    )
+
+
+# 로그인 유저가 등록한 outbox 상태별 건수와 최근 항목 (status=dead 로 실패 항목 확인)
+@router.get("/outbox", response_model=NotificationOutboxListResponse)
+def list_outbox_entries(
+    status: Literal["pending", "sending", "delivered", "dead"] | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=500),
+    current_user: AuthenticatedUser | None = Depends(get_optional_current_user),
+    outbox_service: NotificationOutboxService = Depends(_get_outbox_service),
+) -> NotificationOutboxListResponse:
+    if not config.FCM_TEST_PROXY_ENABLED:
+        raise HTTPException(status_code=404, detail="FCM test proxy is disabled.")
+
+    requested_by = map_notification_user_id(require_current_user(current_user))
+    entries = outbox_service.list_entries(requested_by, status, limit)
+    return NotificationOutboxListResponse(
+        counts=outbox_service.count_by_status(requested_by),
+        entries=[NotificationOutboxEntry.model_validate(entry) for entry in entries],
+    )
+
+
+# 로그인 유저가 등록한 outbox 항목 하나의 발송 상태
+@router.get("/outbox/{outbox_id}", response_model=NotificationOutboxEntry)
+def get_outbox_entry(
+    outbox_id: str,
+    current_user: AuthenticatedUser | None = Depends(get_optional_current_user),
+    outbox_service: NotificationOutboxService = Depends(_get_outbox_service),
+) -> NotificationOutboxEntry:
+    if not config.FCM_TEST_PROXY_ENABLED:
+        raise HTTPException(status_code=404, detail="FCM test proxy is disabled.")
+
+    requested_by = map_notification_user_id(require_current_user(current_user))
+    entry = outbox_service.get_entry(outbox_id, requested_by)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="outbox 항목을 찾을 수 없습니다.")
+    return NotificationOutboxEntry.model_validate(entry)
+
+
+# Post /v1/messages:sendUser 여러 사용자에게 일괄 발송 (수신자별 결과를 NDJSON으로 스트리밍)
+# FCM_TEST_BULK_ALLOWED_USERS에 등록된 사용자만 호출 가능
+@router.post("/send-bulk")
+async def send_bulk_test_notification(
+    payload: BulkSendNotificationTestRequest,
+    current_user: AuthenticatedUser | None = Depends(get_optional_current_user),
+    recipient_repo: NotificationRecipientRepository | AsyncNotificationRecipientRepository = Depends(
+        _get_recipient_repository
+    ),
+    notification_proxy_service: AsyncNotificationProxyService = Depends(get_async_notification_proxy_service),
+) -> StreamingResponse:
+    if not config.FCM_TEST_PROXY_ENABLED:
+        raise HTTPException(status_code=404, detail="FCM test proxy is disabled.")
+
+    if map_notification_user_id(require_current_user(current_user)) not in config.FCM_TEST_BULK_ALLOWED_USERS:
+        raise HTTPException(
+            status_code=403,
+            detail="일괄 발송은 FCM_TEST_BULK_ALLOWED_USERS에 등록된 사용자만 할 수 있습니다.",
+        )
+    if (payload.user_ids is None) == (payload.score_category is None):
+        raise HTTPException(status_code=400, detail="user_ids와 score_category 중 하나만 지정하세요.")
+    template_code = payload.template_code or config.FCM_TEST_TEMPLATE_CODE
+    if not template_code:
+        raise HTTPException(
+            status_code=400,
+            detail="template_code가 필요합니다. 요청 body나 .env의 FCM_TEST_TEMPLATE_CODE로 설정하세요.",
+        )
+
+    if payload.user_ids is not None:
+        user_ids = payload.user_ids
+    else:
+        user_ids = await maybe_await(
+            recipient_repo.fetch_usernames_by_score_category(payload.score_category, payload.min_score)
+        )
+    if len(user_ids) > config.TVCF_NOTIFICATION_BULK_MAX_RECIPIENTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"일괄 발송 대상은 최대 {config.TVCF_NOTIFICATION_BULK_MAX_RECIPIENTS}명입니다. (요청: {len(user_ids)}명)",
+        )
+
+    # 요청별 동시 호출 수는 전체 notification-be 동시 호출 수를 넘지 않음
+    concurrency = min(
+        payload.concurrency or config.TVCF_NOTIFICATION_BULK_CONCURRENCY,
+        config.TVCF_NOTIFICATION_MAX_CONCURRENCY,
+    )
+    sender = BulkNotificationSender(notification_proxy_service)
+
+    async def stream_results():
+        async for result in sender.fan_out(user_ids, template_code, concurrency):
+            yield json.dumps(result, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Any
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from app.core.schemas import APIModel
 
@@ -33,6 +34,14 @@ class SendDefinitionNotificationTestRequest(APIModel):
     template_code: str | None = Field(default=None)
 
 
+class BulkSendNotificationTestRequest(APIModel):
+    user_ids: list[str] | None = Field(default=None, min_length=1)  # 대상 사용자(username) 목록
+    score_category: str | None = Field(default=None, min_length=1)  # 이 카테고리에 점수가 있는 사용자 전체
+    min_score: int | None = Field(default=None, ge=0)  # score_category와 함께 사용
+    template_code: str | None = Field(default=None)
+    concurrency: int | None = Field(default=None, ge=1)
+
+
 class NotificationProxyResult(APIModel):
     status_code: int
     body: dict[str, Any] | str | None
@@ -60,3 +69,30 @@ class SubscribeDefinitionTestResponse(APIModel):
     request_body: dict[str, str]
     notification_response: NotificationProxyResult
     notification_user_id: str
+
+
+class NotificationOutboxEntry(APIModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    message_type: str
+    user_id: str | None
+    definition_code: str | None
+    template_code: str
+    status: str
+    attempts: int
+    next_attempt_at: datetime
+    last_status_code: int | None
+    last_error: str | None
+    created_at: datetime | None
+    delivered_at: datetime | None
+
+
+class NotificationOutboxEnqueueResponse(APIModel):
+    message: str
+    entry: NotificationOutboxEntry
+
+
+class NotificationOutboxListResponse(APIModel):
+    counts: dict[str, int]
+    entries: list[NotificationOutboxEntry]
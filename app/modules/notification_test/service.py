@@ -1,20 +1,100 @@
 import json
+import threading
+import time
 from datetime import UTC, datetime, timedelta
-from socket import timeout as SocketTimeout
 from typing import Any
-from urllib import error, request
 
 import jwt
 
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError, RetryBudget, jittered_backoff
 from app.core.config import config
+from app.core.http_pool import HttpConnectError, HttpConnectionLostError, HttpTransportError, KeepAliveHttpClient
+from app.modules.notification_test.executor import NotificationCallExecutor, notification_executor
 from app.modules.notification_test.schemas import NotificationProxyResult
 
+_http_client: KeepAliveHttpClient | None = None
+_http_client_lock = threading.Lock()
+# notification-be 장애 상태는 프로세스 안의 모든 요청이 공유
+_circuit_breaker: CircuitBreaker | None = None
+_retry_budget: RetryBudget | None = None
+
+# 서버가 처리하지 않고 거절한 응답 (다시 보내도 중복 발송되지 않음)
+_RETRYABLE_STATUS_CODES = {429, 503}
+
+
+def get_http_client() -> KeepAliveHttpClient:
+    """notification-be 호출에 공유하는 keep-alive 클라이언트 (처음 사용할 때 설정값으로 생성)"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = KeepAliveHttpClient(
+                pool_size=config.TVCF_NOTIFICATION_POOL_SIZE,
+                connect_timeout=config.TVCF_NOTIFICATION_CONNECT_TIMEOUT_SECONDS,
+                read_timeout=config.TVCF_NOTIFICATION_TIMEOUT_SECONDS,
+            )
+        return _http_client
+
+
+def close_http_client() -> None:
+    """공유 클라이언트의 연결을 닫습니다. (서버 종료 시)"""
+    global _http_client
+    with _http_client_lock:
+        client, _http_client = _http_client, None
+    if client is not None:
+        client.close()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    global _circuit_breaker
+    with _http_client_lock:
+        if _circuit_breaker is None:
+            _circuit_breaker = CircuitBreaker(
+                failure_threshold=config.TVCF_NOTIFICATION_BREAKER_FAILURE_THRESHOLD,
+                recovery_seconds=config.TVCF_NOTIFICATION_BREAKER_RECOVERY_SECONDS,
+                half_open_max_calls=config.TVCF_NOTIFICATION_BREAKER_HALF_OPEN_MAX_CALLS,
+            )
+        return _circuit_breaker
+
+
+def get_retry_budget() -> RetryBudget:
+    global _retry_budget
+    with _http_client_lock:
+        if _retry_budget is None:
+            _retry_budget = RetryBudget(
+                ratio=config.TVCF_NOTIFICATION_RETRY_BUDGET_RATIO,
+                min_per_second=config.TVCF_NOTIFICATION_RETRY_BUDGET_MIN_PER_SECOND,
+            )
+        return _retry_budget
+
+
+def get_resilience_stats() -> dict[str, Any]:
+    """차단기/재시도 예산 상태 (/metrics/get)"""
+    return {
+        "circuit_breaker": get_circuit_breaker().stats(),
+        "retry_budget": get_retry_budget().stats(),
+    }
+
 
 class NotificationProxyError(Exception):
-    def __init__(self, message: str, status_code: int | None = None, body: Any = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        body: Any = None,
+        retryable: bool = False,
+    ) -> None:
         super().__init__(message)
         self.status_code = status_code
         self.body = body
+        self.retryable = retryable
+
+
+class NotificationCircuitOpenError(NotificationProxyError):
+    """차단기가 열려 있어 notification-be를 호출하지 않고 바로 실패함"""
+
+    def __init__(self, retry_after_seconds: float) -> None:
+        super().__init__("notification-be is unavailable (circuit open); failing fast.")
+        self.retry_after_seconds = retry_after_seconds
 
 
 class NotificationProxyService:
@@ -28,6 +108,10 @@ class NotificationProxyService:
         auth_token: str | None,
         user_agent: str,
         timeout_seconds: int,
+        http_client: KeepAliveHttpClient | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
+        max_retries: int | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.device_path = device_path if device_path.startswith("/") else f"/{device_path}"
@@ -39,6 +123,10 @@ class NotificationProxyService:
         self.auth_token = auth_token
         self.user_agent = user_agent
         self.timeout_seconds = timeout_seconds
+        self.http_client = http_client or get_http_client()
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker()
+        self.retry_budget = retry_budget or get_retry_budget()
+        self.max_retries = config.TVCF_NOTIFICATION_MAX_RETRIES if max_retries is None else max_retries
 
     @property
     def device_url(self) -> str:
@@ -119,31 +207,65 @@ class NotificationProxyService:
         if extra_headers:
             headers.update(extra_headers)
 
-        outbound_request = request.Request(
-            url,
-            data=payload,
-            headers=headers,
-            method="POST",
-        )
+        # 재시도는 요청이 서버에 전달되지 않았거나(연결 실패) 서버가 거절한(429/503) 경우에만,
+        # 재시도 예산이 남아 있을 때 max_retries번까지 지터를 둔 간격으로 합니다.
+        self.retry_budget.record_request()
+        attempt = 0
+        while True:
+            try:
+                return self._send_once(url, payload, headers)
+            except NotificationProxyError as exc:
+                if not exc.retryable or attempt >= self.max_retries or not self.retry_budget.try_spend():
+                    raise
+            attempt += 1
+            time.sleep(
+                jittered_backoff(
+                    attempt,
+                    config.TVCF_NOTIFICATION_RETRY_BACKOFF_BASE_SECONDS,
+                    config.TVCF_NOTIFICATION_RETRY_BACKOFF_MAX_SECONDS,
+                )
+            )
 
+    def _send_once(self, url: str, payload: bytes, headers: dict[str, str]) -> NotificationProxyResult:
         try:
-            with request.urlopen(outbound_request, timeout=self.timeout_seconds) as response:
-                raw_body = response.read().decode("utf-8")
-                return NotificationProxyResult(
-                    status_code=response.status,
-                    body=_parse_response_body(raw_body),
-                )
-        except error.HTTPError as exc:
-            raw_body = exc.read().decode("utf-8", errors="replace")
-            raise NotificationProxyError(
-                "notification-be returned an error response.",
-                status_code=exc.code,
-                body=_parse_response_body(raw_body),
-            ) from exc
-        except (error.URLError, SocketTimeout, TimeoutError) as exc:
+            self.circuit_breaker.before_call()
+        except CircuitOpenError as exc:
+            raise NotificationCircuitOpenError(exc.retry_after_seconds) from exc
+
+        try:
+            response = self.http_client.request(
+                "POST", url, body=payload, headers=headers, timeout=self.timeout_seconds
+            )
+        except HttpTransportError as exc:
+            self.circuit_breaker.record_failure()
             raise NotificationProxyError(
                 f"notification-be request failed: {exc}",
+                # 응답 전에 끊긴 keep-alive 연결은 재시도 예산 안에서만 다시 보냅니다. (타임아웃은 재시도 안 함)
+                retryable=isinstance(exc, (HttpConnectError, HttpConnectionLostError)),
             ) from exc
+        except BaseException:
+            # 전송 오류가 아닌 예외(잘못된 헤더 값 등)도 half-open 시험 슬롯은 돌려줘야 차단기가 멈추지 않음
+            self.circuit_breaker.release()
+            raise
+
+        # 5xx는 notification-be 장애로 보고, 4xx는 정상 동작 중인 서버의 응답으로 봅니다.
+        if response.status >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+        raw_body = response.body.decode("utf-8", errors="replace")
+        if response.status >= 400:
+            raise NotificationProxyError(
+                "notification-be returned an error response.",
+                status_code=response.status,
+                body=_parse_response_body(raw_body),
+                retryable=response.status in _RETRYABLE_STATUS_CODES,
+            )
+        return NotificationProxyResult(
+            status_code=response.status,
+            body=_parse_response_body(raw_body),
+        )
 
     def _build_access_token(self, notification_user_id: str) -> str:
         payload = {
@@ -168,7 +290,56 @@ def _parse_response_body(raw_body: str) -> dict[str, Any] | str | None:
     return {"value": parsed}
 
 
-def get_notification_proxy_service() -> NotificationProxyService:
+class AsyncNotificationProxyService:
+    """NotificationProxyService의 비동기 버전
+
+    블로킹 HTTP 호출은 `notification_executor` 전용 스레드에서 실행되므로 이벤트 루프와
+    기본 스레드 풀을 막지 않습니다. 대기열이 가득 차면 `NotificationProxyBusyError`가 전달됩니다.
+    """
+
+    def __init__(self, proxy_service: NotificationProxyService, executor: NotificationCallExecutor) -> None:
+        """생성자"""
+        self.proxy_service = proxy_service
+        self.executor = executor
+
+    @property
+    def device_url(self) -> str:
+        return self.proxy_service.device_url
+
+    @property
+    def send_user_url(self) -> str:
+        return self.proxy_service.send_user_url
+
+    @property
+    def subscription_url(self) -> str:
+        return self.proxy_service.subscription_url
+
+    @property
+    def send_definition_url(self) -> str:
+        return self.proxy_service.send_definition_url
+
+    async def register_device(
+        self,
+        registration_token: str,
+        notification_user_id: str,
+        user_agent: str | None = None,
+    ) -> NotificationProxyResult:
+        return await self.executor.run(
+            self.proxy_service.register_device, registration_token, notification_user_id, user_agent
+        )
+
+    async def send_user_message(self, user_id: str, template_code: str) -> NotificationProxyResult:
+        return await self.executor.run(self.proxy_service.send_user_message, user_id, template_code)
+
+    async def subscribe_definition(self, user_id: str, definition_code: str) -> NotificationProxyResult:
+        return await self.executor.run(self.proxy_service.subscribe_definition, user_id, definition_code)
+
+    async def send_definition_message(self, definition_code: str, template_code: str) -> NotificationProxyResult:
+        return await self.executor.run(self.proxy_service.send_definition_message, definition_code, template_code)
+
+
+def get_notification_proxy_service(max_retries: int | None = None) -> NotificationProxyService:
+    """설정값으로 프록시 서비스를 만듭니다. (max_retries가 None이면 TVCF_NOTIFICATION_MAX_RETRIES)"""
     return NotificationProxyService(
         base_url=config.TVCF_NOTIFICATION_BASE_URL,
         device_path=config.TVCF_NOTIFICATION_DEVICE_PATH,
@@ -178,4 +349,9 @@ def get_notification_proxy_service() -> NotificationProxyService:
         auth_token=config.TVCF_NOTIFICATION_AUTH_TOKEN,
         user_agent=config.TVCF_NOTIFICATION_USER_AGENT,
         timeout_seconds=config.TVCF_NOTIFICATION_TIMEOUT_SECONDS,
+        max_retries=max_retries,
     )
+
+
+def get_async_notification_proxy_service() -> AsyncNotificationProxyService:
+    return AsyncNotificationProxyService(get_notification_proxy_service(), notification_executor)
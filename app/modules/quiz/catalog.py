@@ -0,0 +1,194 @@
+"""quizzes 테이블 전체를 메모리에 올려 두는 읽기 전용 카탈로그."""
+
+import threading
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+
+from app.core.database import SessionLocal
+from app.modules.quiz.grading import CompiledAnswer
+from app.modules.quiz.repository import QuizRepository
+from app.modules.quiz.sampling import QuizSampler
+
+if TYPE_CHECKING:
+    from app.modules.quiz.snapshot import QuizSnapshot
+
+
+ADMARKET_CATEGORY = "ADmarket"
+ADMARKET_CATEGORY_ALIASES = {"ADmarket", "Corp", "Bidding", "Message"}
+
+
+def canonicalize_category(category: str | None) -> str | None:
+    """ADmarket 계열 카테고리를 하나로 묶은 정규 카테고리명을 반환합니다."""
+    if category is None:
+        return None
+
+    normalized = category.strip()
+    if not normalized:
+        return None
+
+    if normalized in ADMARKET_CATEGORY_ALIASES:
+        return ADMARKET_CATEGORY
+
+    return normalized
+
+
+class QuizCatalog:
+    def __init__(
+        self,
+        version: int,
+        rows: list[dict[str, Any]],
+        compiled_answers: Mapping[str, CompiledAnswer] | None = None,
+        category_index: dict[str, list[int]] | None = None,
+    ):
+        """생성자
+
+        Args:
+            compiled_answers: quiz_id -> 채점기 (스냅샷 적재 시, 없으면 answer에서 계산)
+            category_index: 정규 카테고리명 -> rows 위치 (스냅샷 적재 시, 없으면 category에서 계산)
+        """
+        self.version = version
+        self.quizzes: list[dict[str, Any]] = []
+        self.quizzes_by_id: dict[str, dict[str, Any]] = {}
+        self.quizzes_by_category: dict[str, list[dict[str, Any]]] = {}
+        compiled_by_id: dict[str, CompiledAnswer] = {}
+
+        for row in rows:
+            quiz = {
+                "id": str(row["id"]),
+                "question": str(row["question"]),
+                "explanation": str(row["explanation"]),
+                "answer": str(row["answer"]),
+                "category": str(row.get("category") or ""),
+            }
+            self.quizzes.append(quiz)
+            self.quizzes_by_id[quiz["id"]] = quiz
+            if compiled_answers is None:
+                compiled_by_id[quiz["id"]] = CompiledAnswer(quiz["answer"])
+
+            if category_index is None:
+                canonical = canonicalize_category(quiz["category"])
+                if canonical is not None:
+                    self.quizzes_by_category.setdefault(canonical, []).append(quiz)
+
+        self.compiled_answers: Mapping[str, CompiledAnswer] = (
+            compiled_answers if compiled_answers is not None else compiled_by_id
+        )
+
+        canonical_by_id: dict[str, str | None] = {}
+        if category_index is not None:
+            for canonical, positions in category_index.items():
+                members = [self.quizzes[position] for position in positions]
+                self.quizzes_by_category[canonical] = members
+                canonical_by_id.update((quiz["id"], canonical) for quiz in members)
+        else:
+            for canonical, members in self.quizzes_by_category.items():
+                canonical_by_id.update((quiz["id"], canonical) for quiz in members)
+
+        ordered = sorted(c for c in self.quizzes_by_category if c != ADMARKET_CATEGORY)
+        if ADMARKET_CATEGORY in self.quizzes_by_category:
+            ordered.insert(0, ADMARKET_CATEGORY)
+        self.categories: list[str] = ordered
+        self.sampler = QuizSampler((quiz["id"], canonical_by_id.get(quiz["id"])) for quiz in self.quizzes)
+
+    @classmethod
+    def from_snapshot(cls, version: int, snapshot: "QuizSnapshot") -> "QuizCatalog":
+        """스냅샷에서 카탈로그를 만듭니다. (정답 정규화/카테고리 분류를 다시 하지 않음)
+
+        퀴즈 목록만 바로 디코딩하고, 채점기는 퀴즈별로 처음 채점할 때 스냅샷의 전처리 결과로 만듭니다.
+        스냅샷 내용은 메모리로 복사해 두므로 snapshot을 닫아도 됩니다.
+        """
+        resident = snapshot.in_memory()
+        rows = list(resident.iter_quizzes())
+        position_by_id = {row["id"]: position for position, row in enumerate(rows)}
+        return cls(
+            version,
+            rows,
+            compiled_answers=_SnapshotCompiledAnswers(resident, position_by_id),
+            category_index=resident.categories(),
+        )
+
+    def category_index(self) -> dict[str, list[int]]:
+        """정규 카테고리명 -> quizzes 위치 (스냅샷 저장용)"""
+        position_by_id = {quiz["id"]: position for position, quiz in enumerate(self.quizzes)}
+        return {
+            canonical: [position_by_id[quiz["id"]] for quiz in members]
+            for canonical, members in self.quizzes_by_category.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.quizzes)
+
+    def get_quizzes(self, category: str | None = None) -> list[dict[str, Any]]:
+        """정규 카테고리 기준 퀴즈 목록을 반환합니다. (category가 없으면 전체)"""
+        if category is None:
+            return list(self.quizzes)
+        return list(self.quizzes_by_category.get(category, []))
+
+    def get_quiz(self, quiz_id: str) -> dict[str, Any] | None:
+        return self.quizzes_by_id.get(quiz_id)
+
+
+class _SnapshotCompiledAnswers(Mapping):
+    """quiz_id -> CompiledAnswer. 처음 조회할 때 스냅샷에 저장된 전처리 결과로 만들어 둡니다."""
+
+    def __init__(self, snapshot: "QuizSnapshot", position_by_id: dict[str, int]):
+        """생성자"""
+        self._snapshot = snapshot
+        self._position_by_id = position_by_id
+        self._compiled: dict[str, CompiledAnswer] = {}
+
+    def __getitem__(self, quiz_id: str) -> CompiledAnswer:
+        compiled = self._compiled.get(quiz_id)
+        if compiled is None:
+            # 동시에 만들어도 결과가 같으므로 락 없이 마지막 값으로 덮어씀
+            compiled = self._snapshot.compiled_answer(self._position_by_id[quiz_id])
+            self._compiled[quiz_id] = compiled
+        return compiled
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._position_by_id)
+
+    def __len__(self) -> int:
+        return len(self._position_by_id)
+
+
+_catalog: QuizCatalog | None = None
+_catalog_version = 0
+_catalog_lock = threading.Lock()
+
+
+def load_quiz_catalog() -> QuizCatalog:
+    """DB에서 퀴즈 전체를 읽어 새 카탈로그로 교체합니다."""
+    global _catalog, _catalog_version
+
+    with _catalog_lock:
+        with SessionLocal() as session:
+            rows = QuizRepository(session).fetch_all_quizzes()
+
+        _catalog_version += 1
+        catalog = QuizCatalog(_catalog_version, rows)
+        _catalog = catalog  # 참조 교체는 원자적으로 이뤄짐
+
+    print(f"퀴즈 카탈로그 적재 완료 (version={catalog.version}, quizzes={len(catalog)})")
+    return catalog
+
+
+def load_quiz_catalog_from_snapshot(snapshot: "QuizSnapshot") -> QuizCatalog:
+    """DB 대신 스냅샷으로 카탈로그를 교체합니다."""
+    global _catalog, _catalog_version
+
+    with _catalog_lock:
+        _catalog_version += 1
+        catalog = QuizCatalog.from_snapshot(_catalog_version, snapshot)
+        _catalog = catalog
+
+    print(f"퀴즈 카탈로그를 스냅샷에서 적재 완료 (version={catalog.version}, quizzes={len(catalog)})")
+    return catalog
+
+
+def get_quiz_catalog() -> QuizCatalog:
+    """현재 카탈로그를 반환합니다. 아직 적재 전이면 DB에서 한 번 읽어 옵니다."""
+    catalog = _catalog
+    if catalog is None:
+        catalog = load_quiz_catalog()
+    return catalog
@@ -1,14 +1,22 @@
 import re
 import unicodedata
-from difflib import SequenceMatcher
-from typing import List
 
+from app.core.cache import LRUCache
+from app.core.config import config
+from app.modules.quiz.similarity import is_similar
 
 _WHITESPACE_RE = re.compile(r"\s+")
 _TOKEN_SPLIT_RE = re.compile(r"[^0-9a-zA-Z가-힣]+")
 _COMPACT_RE = re.compile(r"[^0-9a-zA-Z가-힣]+")
 _NUMBER_RE = re.compile(r"[-+]?\d+(?:\.\d+)?")
 
+# (quiz_id, 카탈로그 버전, 정규화된 사용자 답) -> 정답 여부
+# 카탈로그 버전이 키에 들어가므로 CSV 재적재 후에는 이전 판정이 재사용되지 않습니다.
+verdict_cache = LRUCache(
+    max_size=config.GRADING_VERDICT_CACHE_SIZE,
+    ttl_seconds=config.GRADING_VERDICT_CACHE_TTL_SECONDS,
+)
+
 
 def normalize_text(value: str) -> str:
     """사용자 입력/정답 텍스트를 비교 가능한 형태로 정규화합니다."""
@@ -18,13 +26,13 @@ def normalize_text(value: str) -> str:
     return _WHITESPACE_RE.sub(" ", normalized)
 
 
-def split_answer_candidates(answer_field: str) -> List[str]:
+def split_answer_candidates(answer_field: str) -> list[str]:
     """DB answer 컬럼(`/` 구분)을 개별 정답 후보로 분리합니다."""
     normalized = normalize_text(answer_field)
     if not normalized:
         return []
 
-    candidates: List[str] = []
+    candidates: list[str] = []
     for part in normalized.split("/"):
         candidate = normalize_text(part)
         if candidate and candidate not in candidates:
@@ -32,24 +40,102 @@ def split_answer_candidates(answer_field: str) -> List[str]:
     return candidates
 
 
-def is_answer_accepted(user_answer: str, answer_field: str) -> bool:
-    """허용 오차를 반영한 정답 판정."""
+class CompiledCandidate:
+    """정답 후보 하나의 비교용 전처리 결과."""
+
+    __slots__ = ("compact", "is_ascii_word", "number", "text", "tokens")
+
+    def __init__(self, candidate: str):
+        self.text = candidate
+        self.compact = _compact(candidate)
+        self.number = _extract_single_number(self.compact) if self.compact else None
+        self.tokens = _tokenize(candidate)
+        self.is_ascii_word = _is_ascii_word(self.compact)
+
+    @classmethod
+    def restore(
+        cls,
+        text: str,
+        compact: str,
+        number: float | None,
+        tokens: list[str],
+        is_ascii_word: bool,
+    ) -> "CompiledCandidate":
+        """저장해 둔 전처리 결과로 다시 만듭니다. (카탈로그 스냅샷 적재용)"""
+        candidate = cls.__new__(cls)
+        candidate.text = text
+        candidate.compact = compact
+        candidate.number = number
+        candidate.tokens = tokens
+        candidate.is_ascii_word = is_ascii_word
+        return candidate
+
+
+class CompiledAnswer:
+    """DB answer 컬럼을 미리 정규화/분해해 둔 채점기.
+
+    카탈로그 적재 시 퀴즈마다 한 번만 만들고, 제출 시에는 사용자 입력 쪽만 가공합니다.
+    """
+
+    __slots__ = ("answer_field", "candidates")
+
+    def __init__(self, answer_field: str):
+        self.answer_field = answer_field
+        self.candidates = [CompiledCandidate(candidate) for candidate in split_answer_candidates(answer_field)]
+
+    @classmethod
+    def from_candidates(cls, answer_field: str, candidates: list[CompiledCandidate]) -> "CompiledAnswer":
+        """이미 전처리된 정답 후보로 만듭니다. (카탈로그 스냅샷 적재용)"""
+        compiled = cls.__new__(cls)
+        compiled.answer_field = answer_field
+        compiled.candidates = candidates
+        return compiled
+
+    def accepts(self, user_answer: str) -> bool:
+        """허용 오차를 반영한 정답 판정."""
+        return self.accepts_normalized(normalize_text(user_answer))
+
+    def accepts_normalized(self, user: str) -> bool:
+        """`normalize_text`를 이미 거친 사용자 답으로 판정합니다."""
+        if not user or not self.candidates:
+            return False
+
+        prepared = CompiledCandidate(user)
+        for candidate in self.candidates:
+            if _is_single_answer_match(prepared, candidate):
+                return True
+        return False
+
+
+def compile_answer(answer_field: str) -> CompiledAnswer:
+    return CompiledAnswer(answer_field)
+
+
+def grade_answer(quiz_id: str, catalog_version: int, compiled: CompiledAnswer, user_answer: str) -> bool:
+    """verdict_cache를 거쳐 정답 여부를 판정합니다."""
     user = normalize_text(user_answer)
     if not user:
         return False
 
-    for candidate in split_answer_candidates(answer_field):
-        if _is_single_answer_match(user, candidate):
-            return True
-    return False
+    key = (quiz_id, catalog_version, user)
+    verdict = verdict_cache.get(key)
+    if verdict is None:
+        verdict = compiled.accepts_normalized(user)
+        verdict_cache.set(key, verdict)
+    return verdict
+
+
+def is_answer_accepted(user_answer: str, answer_field: str) -> bool:
+    """허용 오차를 반영한 정답 판정. (매번 정답을 새로 전처리하는 호환용 래퍼)"""
+    return CompiledAnswer(answer_field).accepts(user_answer)
 
 
-def _is_single_answer_match(user: str, candidate: str) -> bool:
-    if user == candidate:
+def _is_single_answer_match(user: CompiledCandidate, candidate: CompiledCandidate) -> bool:
+    if user.text == candidate.text:
         return True
 
-    user_compact = _compact(user)
-    candidate_compact = _compact(candidate)
+    user_compact = user.compact
+    candidate_compact = candidate.compact
     if not user_compact or not candidate_compact:
         return False
 
@@ -57,23 +143,18 @@ def _is_single_answer_match(user: str, candidate: str) -> bool:
         return True
 
     # 숫자형 답변은 엄격하게 비교하되, 소수 오차는 소폭 허용
-    user_number = _extract_single_number(user_compact)
-    candidate_number = _extract_single_number(candidate_compact)
-    if user_number is not None and candidate_number is not None:
-        return abs(user_number - candidate_number) <= 0.01
-
-    user_tokens = _tokenize(user)
-    candidate_tokens = _tokenize(candidate)
-    if user_tokens and candidate_tokens and user_tokens == candidate_tokens:
+    if user.number is not None and candidate.number is not None:
+        return abs(user.number - candidate.number) <= 0.01
+
+    if user.tokens and candidate.tokens and user.tokens == candidate.tokens:
         return True
 
-    similarity = SequenceMatcher(None, user_compact, candidate_compact).ratio()
     threshold = _similarity_threshold(max(len(user_compact), len(candidate_compact)))
-    if similarity < threshold:
+    if not is_similar(user_compact, candidate_compact, threshold, mode=config.GRADING_SIMILARITY_MODE):
         return False
 
     # 짧은 영문 단어는 양 끝 문자가 같은 경우만 오타 허용
-    if _is_ascii_word(user_compact) and _is_ascii_word(candidate_compact):
+    if user.is_ascii_word and candidate.is_ascii_word:
         if len(candidate_compact) <= 3:
             return False
         return user_compact[0] == candidate_compact[0] and user_compact[-1] == candidate_compact[-1]
@@ -85,7 +166,7 @@ def _compact(value: str) -> str:
     return _COMPACT_RE.sub("", value)
 
 
-def _tokenize(value: str) -> List[str]:
+def _tokenize(value: str) -> list[str]:
     return [token for token in _TOKEN_SPLIT_RE.split(value) if token]
 
 
@@ -1,11 +1,99 @@
-from typing import Any, Dict, List, Optional, Sequence
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, NamedTuple
 
-from sqlalchemy import func, select
+from sqlalchemy import Insert, Select, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.database import prefer_replica
+from app.core.ulid import generate_ulid
 from app.models import Quiz, Score
 
 
+class ScoreUpsertResult(NamedTuple):
+    action: str  # "insert" 또는 "update"
+    created_at: datetime | None
+
+
+# ON CONFLICT 구문을 지원하는 방언별 insert 생성자
+_DIALECT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def _build_fetch_quizzes_stmt(
+    category: str | None = None,
+    categories: Sequence[str] | None = None,
+    limit: int | None = None,
+    random_order: bool = False,
+) -> Select:
+    stmt = select(
+        Quiz.id.label("id"),
+        Quiz.question.label("question"),
+        Quiz.explanation.label("explanation"),
+        Quiz.answer.label("answer"),
+    )
+
+    if categories:
+        stmt = stmt.where(Quiz.category.in_(categories))
+    elif category:
+        stmt = stmt.where(Quiz.category == category)
+
+    if random_order:
+        stmt = stmt.order_by(func.random())
+
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    return prefer_replica(stmt)
+
+
+def _build_fetch_all_quizzes_stmt() -> Select:
+    # 카탈로그 재적재는 방금 커밋한 CSV 동기화 결과를 읽어야 하므로 복제본이 아닌 primary에서 조회
+    return select(
+        Quiz.id.label("id"),
+        Quiz.question.label("question"),
+        Quiz.explanation.label("explanation"),
+        Quiz.answer.label("answer"),
+        Quiz.category.label("category"),
+    ).order_by(Quiz.id)
+
+
+def _build_fetch_categories_stmt() -> Select:
+    return prefer_replica(select(Quiz.category).distinct().where(Quiz.category.isnot(None), Quiz.category != ""))
+
+
+def _build_fetch_quizzes_by_ids_stmt(quiz_ids: Sequence[str]) -> Select:
+    stmt = select(
+        Quiz.id.label("id"),
+        Quiz.question.label("question"),
+        Quiz.answer.label("answer"),
+    ).where(Quiz.id.in_(quiz_ids))
+    return prefer_replica(stmt)
+
+
+def _build_upsert_score_stmt(dialect_name: str, score_id: str, user_id: str, category: str, score: int) -> Insert:
+    """(user_id, category) 유니크 제약을 이용한 단일 INSERT ... ON CONFLICT DO UPDATE 구문."""
+    dialect_insert = _DIALECT_INSERTS.get(dialect_name)
+    if dialect_insert is None:
+        raise ValueError(f"점수 upsert를 지원하지 않는 DB입니다: {dialect_name}")
+
+    stmt = dialect_insert(Score).values(
+        id=score_id,
+        user_id=user_id,
+        category=category,
+        score=score,
+    )
+    # 충돌 시 기존 행의 id가 그대로 반환되므로, 새로 만든 id와 비교해 insert/update를 구분
+    return stmt.on_conflict_do_update(
+        index_elements=[Score.user_id, Score.category],
+        set_={"score": stmt.excluded.score},
+    ).returning(Score.id, Score.created_at)
+
+
 class QuizRepository:
     def __init__(self, db: Session):
         """생성자"""
@@ -13,77 +101,108 @@ class QuizRepository:
 
     def fetch_quizzes(
         self,
-        category: Optional[str] = None,
-        categories: Optional[Sequence[str]] = None,
-        limit: Optional[int] = None,
+        category: str | None = None,
+        categories: Sequence[str] | None = None,
+        limit: int | None = None,
         random_order: bool = False,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         """퀴즈 목록을 조회합니다."""
-        stmt = select(
-            Quiz.id.label("id"),
-            Quiz.question.label("question"),
-            Quiz.explanation.label("explanation"),
-            Quiz.answer.label("answer"),
+        stmt = _build_fetch_quizzes_stmt(category, categories, limit, random_order)
+        rows = self.db.execute(stmt).mappings().all()
+        return [dict(r) for r in rows]
+
+    def fetch_all_quizzes(self) -> list[dict[str, Any]]:
+        """카탈로그 적재용으로 퀴즈 전체(카테고리 포함)를 조회합니다."""
+        rows = self.db.execute(_build_fetch_all_quizzes_stmt()).mappings().all()
+        return [dict(r) for r in rows]
+
+    def fetch_categories(self) -> list[str]:
+        """퀴즈 테이블에서 사용 가능한 카테고리 목록을 조회합니다."""
+        categories = self.db.execute(_build_fetch_categories_stmt()).scalars().all()
+        return list(categories)
+
+    def fetch_quizzes_by_ids(self, quiz_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """quiz id 목록으로 채점용 최소 정보를 조회합니다."""
+        normalized_ids = [quiz_id for quiz_id in quiz_ids if quiz_id]
+        if not normalized_ids:
+            return {}
+
+        rows = self.db.execute(_build_fetch_quizzes_by_ids_stmt(normalized_ids)).mappings().all()
+        return {str(row["id"]): dict(row) for row in rows}
+
+    def upsert_score(
+        self,
+        user_id: str,
+        category: str,
+        score_percentage: float,
+    ) -> ScoreUpsertResult:
+        """사용자 점수를 삽입하거나(INSERT), 기존 점수가 있으면 업데이트(UPDATE)합니다."""
+        score_id = generate_ulid()
+        stmt = _build_upsert_score_stmt(
+            self.db.get_bind().dialect.name,
+            score_id,
+            user_id,
+            category,
+            int(score_percentage),
         )
+        saved = self.db.execute(stmt).one()
+        self.db.commit()  # 즉시 커밋
+        return ScoreUpsertResult("insert" if saved.id == score_id else "update", saved.created_at)
 
-        if categories:
-            stmt = stmt.where(Quiz.category.in_(categories))
-        elif category:
-            stmt = stmt.where(Quiz.category == category)
 
-        if random_order:
-            stmt = stmt.order_by(func.random())
+class AsyncQuizRepository:
+    """QuizRepository의 비동기 세션(AsyncSession) 버전."""
 
-        if limit is not None:
-            stmt = stmt.limit(limit)
+    def __init__(self, db: AsyncSession):
+        """생성자"""
+        self.db = db
 
-        rows = self.db.execute(stmt).mappings().all()
+    async def fetch_quizzes(
+        self,
+        category: str | None = None,
+        categories: Sequence[str] | None = None,
+        limit: int | None = None,
+        random_order: bool = False,
+    ) -> list[dict[str, Any]]:
+        """퀴즈 목록을 조회합니다."""
+        stmt = _build_fetch_quizzes_stmt(category, categories, limit, random_order)
+        rows = (await self.db.execute(stmt)).mappings().all()
         return [dict(r) for r in rows]
 
-    def fetch_categories(self) -> List[str]:
+    async def fetch_all_quizzes(self) -> list[dict[str, Any]]:
+        """카탈로그 적재용으로 퀴즈 전체(카테고리 포함)를 조회합니다."""
+        rows = (await self.db.execute(_build_fetch_all_quizzes_stmt())).mappings().all()
+        return [dict(r) for r in rows]
+
+    async def fetch_categories(self) -> list[str]:
         """퀴즈 테이블에서 사용 가능한 카테고리 목록을 조회합니다."""
-        stmt = select(Quiz.category).distinct().where(Quiz.category.isnot(None), Quiz.category != "")
-        categories = self.db.execute(stmt).scalars().all()
+        categories = (await self.db.execute(_build_fetch_categories_stmt())).scalars().all()
         return list(categories)
 
-    def fetch_quizzes_by_ids(self, quiz_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    async def fetch_quizzes_by_ids(self, quiz_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
         """quiz id 목록으로 채점용 최소 정보를 조회합니다."""
         normalized_ids = [quiz_id for quiz_id in quiz_ids if quiz_id]
         if not normalized_ids:
             return {}
 
-        stmt = (
-            select(
-                Quiz.id.label("id"),
-                Quiz.question.label("question"),
-                Quiz.answer.label("answer"),
-            )
-            .where(Quiz.id.in_(normalized_ids))
-        )
-        rows = self.db.execute(stmt).mappings().all()
+        rows = (await self.db.execute(_build_fetch_quizzes_by_ids_stmt(normalized_ids))).mappings().all()
         return {str(row["id"]): dict(row) for row in rows}
 
-    def upsert_score(
+    async def upsert_score(
         self,
         user_id: str,
         category: str,
         score_percentage: float,
-    ):
+    ) -> ScoreUpsertResult:
         """사용자 점수를 삽입하거나(INSERT), 기존 점수가 있으면 업데이트(UPDATE)합니다."""
-        existing = self.db.query(Score).filter(Score.user_id == user_id, Score.category == category).first()
-
-        if existing:
-            # 기존 레코드가 있으면 score만 변경
-            existing.score = int(score_percentage)
-            self.db.commit()  # 즉시 커밋
-            return "update"
-        else:
-            # 없으면 새 레코드를 추가
-            new = Score(
-                user_id=user_id,
-                category=category,
-                score=int(score_percentage),
-            )
-            self.db.add(new)
-            self.db.commit()  # 즉시 커밋
-            return "insert"
+        score_id = generate_ulid()
+        stmt = _build_upsert_score_stmt(
+            self.db.get_bind().dialect.name,
+            score_id,
+            user_id,
+            category,
+            int(score_percentage),
+        )
+        saved = (await self.db.execute(stmt)).one()
+        await self.db.commit()
+        return ScoreUpsertResult("insert" if saved.id == score_id else "update", saved.created_at)
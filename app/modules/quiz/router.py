@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Security
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
-from app.core.security import decode_access_token
-from app.models.user import User
-from app.modules.quiz.repository import QuizRepository
+from app.core.csv_import import get_import_status
+from app.core.database import get_db_session
+from app.modules.auth.dependencies import get_current_user
+from app.modules.auth.schemas import AuthenticatedUser
+from app.modules.quiz.repository import AsyncQuizRepository, QuizRepository
 from app.modules.quiz.schemas import (
+    CatalogImportStatusResponse,
     CategoryListResponse,
     QuizListQuery,
     QuizListResponse,
@@ -16,39 +18,17 @@ from app.modules.quiz.schemas import (
 from app.modules.quiz.service import QuizService
 
 router = APIRouter()
-security = HTTPBearer()  # JWT 인증을 위한 Security 객체 생성
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Security(security),
-    db: Session = Depends(get_db),
-) -> User:
-    """
-    JWT 토큰을 검증하고, User 객체를 반환
-    """
-    token = credentials.credentials  # Bearer 토큰 추출
-    user_data = decode_access_token(token)  # JWT 해독
-
-    if not user_data:
-        raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
-
-    # User 객체 조회
-    user = db.query(User).filter(User.id == user_data.id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-
-    return user  # User 객체 반환
-
-
-def _get_quiz_service(db: Session = Depends(get_db)) -> QuizService:
-    repo = QuizRepository(db)
+def _get_quiz_service(db: Session | AsyncSession = Depends(get_db_session)) -> QuizService:
+    repo = AsyncQuizRepository(db) if isinstance(db, AsyncSession) else QuizRepository(db)
     return QuizService(repo)
 
 
 @router.get("/get", response_model=QuizListResponse)
 async def get_quiz_data(
     query: QuizListQuery = Depends(),
-    user: User = Depends(get_current_user),
+    user: AuthenticatedUser = Depends(get_current_user),
     quiz_service: QuizService = Depends(_get_quiz_service),
 ) -> QuizListResponse:
     """
@@ -61,7 +41,7 @@ async def get_quiz_data(
         )
 
     try:
-        quiz_list = await quiz_service.get_quizzes(query.category)
+        quiz_list = await quiz_service.get_quizzes(query.category, seed=query.seed)
         return QuizListResponse(message="퀴즈 데이터 조회 성공", data=quiz_list)
 
     except Exception as e:
@@ -92,7 +72,7 @@ async def get_categories(
 @router.post("/submit", response_model=ScoreSubmitResponse)
 async def submit_quiz_score(
     score_data: ScoreSubmitRequest,
-    user: User = Depends(get_current_user),
+    user: AuthenticatedUser = Depends(get_current_user),
     quiz_service: QuizService = Depends(_get_quiz_service),
 ) -> ScoreSubmitResponse:
     """
@@ -100,7 +80,7 @@ async def submit_quiz_score(
     존재하면 UPDATE)
     """
     try:
-        result = await quiz_service.submit_score(user.id, score_data)
+        result = await quiz_service.submit_score(user.id, score_data, username=user.username)
         return result
 
     except Exception as e:
@@ -108,3 +88,14 @@ async def submit_quiz_score(
             status_code=500,
             detail=f"점수 저장 오류: {str(e)}",
         )
+
+
+@router.get("/import-status", response_model=CatalogImportStatusResponse)
+async def get_catalog_import_status() -> CatalogImportStatusResponse:
+    """
+    CSV 카탈로그 임포트 진행 상황(처리 행 수, 속도, 오류 행)을 가져옴.
+    """
+    status = get_import_status()
+    if status is None:
+        return CatalogImportStatusResponse(message="실행된 임포트가 없습니다.")
+    return CatalogImportStatusResponse(message="임포트 상태 조회 성공", data=status)
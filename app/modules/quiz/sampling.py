@@ -0,0 +1,45 @@
+"""카테고리별 quiz id에서 k개를 중복 없이 뽑는 O(k) 샘플러."""
+
+import random
+from collections.abc import Iterable
+
+
+class QuizSampler:
+    def __init__(self, entries: Iterable[tuple[str, str | None]]):
+        """생성자
+
+        Args:
+            entries: (quiz_id, 정규 카테고리) 쌍 목록. 카테고리가 None이면 전체 풀에만 포함됩니다.
+        """
+        self._all_ids: list[str] = []
+        self._ids_by_category: dict[str, list[str]] = {}
+
+        for quiz_id, category in entries:
+            self._all_ids.append(quiz_id)
+            if category is not None:
+                self._ids_by_category.setdefault(category, []).append(quiz_id)
+
+    def population_size(self, category: str | None = None) -> int:
+        return len(self._population(category))
+
+    def sample(self, k: int, category: str | None = None, seed: int | None = None) -> list[str]:
+        """category(없으면 전체) 풀에서 서로 다른 quiz id를 최대 k개 뽑습니다."""
+        population = self._population(category)
+        n = len(population)
+        k = max(0, min(k, n))
+        rng = random.Random(seed) if seed is not None else random
+
+        # swapped[i]: 가상 셔플 후 i번째 자리에 있는 원소의 원본 인덱스
+        swapped: dict[int, int] = {}
+        picked: list[str] = []
+        for i in range(k):
+            j = rng.randrange(i, n)
+            picked.append(population[swapped.get(j, j)])
+            swapped[j] = swapped.get(i, i)
+
+        return picked
+
+    def _population(self, category: str | None) -> list[str]:
+        if category is None:
+            return self._all_ids
+        return self._ids_by_category.get(category, [])
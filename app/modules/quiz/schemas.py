@@ -1,16 +1,18 @@
-from typing import Dict, Optional
+from datetime import datetime
 
-from pydantic import ConfigDict, Field, model_validator, field_validator
+from pydantic import ConfigDict, Field, field_validator, model_validator
 
 from app.core.schemas import APIModel, MessageResponse
 
 
 class QuizListQuery(APIModel):
-    category: Optional[str] = Field(default=None, max_length=100)
+    category: str | None = Field(default=None, max_length=100)
+    # 전체 랜덤 출제를 재현하기 위한 시드 (미지정 시 매번 새로 추첨)
+    seed: int | None = Field(default=None, ge=0)
 
     @field_validator("category")
     @classmethod
-    def normalize_category(cls, value: Optional[str]) -> Optional[str]:
+    def normalize_category(cls, value: str | None) -> str | None:
         if value is None:
             return None
         normalized = value.strip()
@@ -43,15 +45,15 @@ class ScoreSubmitRequest(APIModel):
     # 프론트의 추가 필드(score)를 허용하기 위해 request만 ignore 적용
     model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
 
-    category: Optional[str] = Field(default=None, max_length=100)
+    category: str | None = Field(default=None, max_length=100)
     correct: int = Field(default=0, ge=0)
     total: int = Field(default=10, ge=0)
-    score: Optional[float] = Field(default=None, ge=0, le=100)
-    user_answers: Dict[str, str] = Field(default_factory=dict)
+    score: float | None = Field(default=None, ge=0, le=100)
+    user_answers: dict[str, str] = Field(default_factory=dict)
 
     @field_validator("category")
     @classmethod
-    def normalize_category(cls, value: Optional[str]) -> Optional[str]:
+    def normalize_category(cls, value: str | None) -> str | None:
         if value is None:
             return None
         normalized = value.strip()
@@ -65,7 +67,7 @@ class ScoreSubmitRequest(APIModel):
         if not isinstance(value, dict):
             raise ValueError("user_answers는 {quiz_id: answer} 형태여야 합니다.")
 
-        normalized: Dict[str, str] = {}
+        normalized: dict[str, str] = {}
         for key, answer in value.items():
             quiz_id = str(key).strip()
             if not quiz_id:
@@ -94,5 +96,35 @@ class ScoreSubmitResponse(MessageResponse):
     incorrect_items: list[IncorrectItem] = Field(default_factory=list)
 
 
+class ImportRowError(APIModel):
+    source: str = ""
+    row: int
+    reason: str
+    value: str
+
+
+class CatalogImportStatus(APIModel):
+    source: str
+    status: str  # running | completed | failed
+    started_at: datetime
+    finished_at: datetime | None = None
+    elapsed_seconds: float = Field(ge=0)
+    rows_read: int = Field(ge=0)
+    rows_per_second: float = Field(ge=0)
+    chunks_committed: int = Field(ge=0)
+    inserted: int = Field(ge=0)
+    updated: int = Field(ge=0)
+    deleted: int = Field(ge=0)
+    unchanged: int = Field(ge=0)
+    error_count: int = Field(ge=0)
+    errors: list[ImportRowError]
+    failure: str | None = None
+
+
+class CatalogImportStatusResponse(MessageResponse):
+    # 이 프로세스에서 CSV 임포트를 한 번도 실행하지 않았으면 None (CSV 감시 리더가 아닌 경우 등)
+    data: CatalogImportStatus | None = None
+
+
 # 기존 코드/임포트와의 호환성 유지
 ScoreSubmit = ScoreSubmitRequest
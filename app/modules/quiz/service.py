@@ -1,50 +1,53 @@
-from typing import Optional
-
-from app.modules.quiz.grading import is_answer_accepted
-from app.modules.quiz.repository import QuizRepository
+from app.core.database import maybe_await
+from app.modules.quiz.catalog import (
+    ADMARKET_CATEGORY,
+    ADMARKET_CATEGORY_ALIASES,
+    canonicalize_category,
+    get_quiz_catalog,
+)
+from app.modules.quiz.grading import CompiledAnswer, grade_answer
+from app.modules.quiz.repository import AsyncQuizRepository, QuizRepository
 from app.modules.quiz.schemas import IncorrectItem, QuizItem, ScoreSubmitRequest, ScoreSubmitResponse
+from app.modules.ranking.leaderboard import get_leaderboard, reset_leaderboard
 
 
 class QuizService:
-    ADMARKET_CATEGORY = "ADmarket"
-    ADMARKET_CATEGORY_ALIASES = {"ADmarket", "Corp", "Bidding", "Message"}
+    ADMARKET_CATEGORY = ADMARKET_CATEGORY
+    ADMARKET_CATEGORY_ALIASES = ADMARKET_CATEGORY_ALIASES
     OVERALL_CATEGORY = "전체"
     QUIZ_COUNT_PER_GAME = 10
 
-    def __init__(self, repo: QuizRepository):
+    def __init__(self, repo: QuizRepository | AsyncQuizRepository):
         """생성자"""
         self.repo = repo
 
-    async def get_quizzes(self, category: Optional[str] = None) -> list[QuizItem]:
-        """카테고리별(또는 전체) 퀴즈 목록 반환"""
+    async def get_quizzes(
+        self,
+        category: str | None = None,
+        seed: int | None = None,
+    ) -> list[QuizItem]:
+        """카테고리별(또는 전체) 퀴즈 목록 반환 (메모리 카탈로그 사용)"""
         normalized = self._normalize_category(category)
+        catalog = get_quiz_catalog()
 
         if normalized is None or normalized == self.OVERALL_CATEGORY:
-            # 전체 챕터는 랜덤 10문제만 출제
-            rows = self.repo.fetch_quizzes(limit=self.QUIZ_COUNT_PER_GAME, random_order=True)
-        elif normalized == self.ADMARKET_CATEGORY:
-            rows = self.repo.fetch_quizzes(categories=sorted(self.ADMARKET_CATEGORY_ALIASES))
+            # 전체 챕터는 랜덤 10문제만 출제 (seed가 있으면 재현 가능한 출제)
+            quiz_ids = catalog.sampler.sample(self.QUIZ_COUNT_PER_GAME, seed=seed)
+            rows = [catalog.quizzes_by_id[quiz_id] for quiz_id in quiz_ids]
         else:
-            rows = self.repo.fetch_quizzes(category=normalized)
+            rows = catalog.get_quizzes(normalized)
 
-        return [QuizItem.model_validate(row) for row in rows]
+        return [QuizItem.model_validate(self._to_quiz_item(row)) for row in rows]
 
     async def get_categories(self) -> list[str]:
-        """사용 가능한 카테고리 리스트 반환"""
-        raw_categories = self.repo.fetch_categories()
-
-        normalized_set = {self._normalize_category(c) for c in raw_categories}
-        normalized_set.discard(None)
-
-        ordered = sorted([c for c in normalized_set if c != self.ADMARKET_CATEGORY])
-        if self.ADMARKET_CATEGORY in normalized_set:
-            return [self.ADMARKET_CATEGORY, *ordered]
-        return ordered
+        """사용 가능한 카테고리 리스트 반환 (ADmarket 우선, 나머지는 이름순)"""
+        return list(get_quiz_catalog().categories)
 
     async def submit_score(
         self,
         user_id: str,
         score_data: ScoreSubmitRequest,
+        username: str | None = None,
     ) -> ScoreSubmitResponse:
         """사용자 점수를 계산하여 저장하고 결과 메시지를 반환합니다."""
         category = self._normalize_category(score_data.category) or self.OVERALL_CATEGORY
@@ -53,14 +56,21 @@ class QuizService:
         incorrect_items: list[IncorrectItem] = []
 
         if score_data.user_answers:
-            correct_count, total_questions, incorrect_items = self._evaluate_submitted_answers(
+            correct_count, total_questions, incorrect_items = await self._evaluate_submitted_answers(
                 score_data.user_answers,
             )
 
         score_percentage = (correct_count / total_questions) * 100 if total_questions else 0.0
 
-        result = self.repo.upsert_score(user_id, category, score_percentage)
-        message = "기존 점수 업데이트 성공" if result == "update" else "새 점수 저장 성공"
+        result = await maybe_await(self.repo.upsert_score(user_id, category, score_percentage))
+
+        # 메모리 리더보드도 같은 값으로 제자리 갱신 (username을 모르면 다음 조회 때 DB에서 재적재)
+        if username:
+            get_leaderboard().apply_score(user_id, username, category, int(score_percentage), result.created_at)
+        else:
+            reset_leaderboard()
+
+        message = "기존 점수 업데이트 성공" if result.action == "update" else "새 점수 저장 성공"
         return ScoreSubmitResponse(
             message=message,
             score=score_percentage,
@@ -70,24 +80,33 @@ class QuizService:
         )
 
     @classmethod
-    def _normalize_category(cls, category: Optional[str]) -> Optional[str]:
-        if category is None:
-            return None
-
-        normalized = category.strip()
-        if not normalized:
-            return None
-
-        if normalized in cls.ADMARKET_CATEGORY_ALIASES:
-            return cls.ADMARKET_CATEGORY
-
-        return normalized
-
-    def _evaluate_submitted_answers(
+    def _normalize_category(cls, category: str | None) -> str | None:
+        return canonicalize_category(category)
+
+    @staticmethod
+    def _to_quiz_item(quiz: dict) -> dict:
+        return {
+            "id": quiz["id"],
+            "question": quiz["question"],
+            "explanation": quiz["explanation"],
+            "answer": quiz["answer"],
+        }
+
+    async def _evaluate_submitted_answers(
         self,
         user_answers: dict[str, str],
     ) -> tuple[int, int, list[IncorrectItem]]:
-        quiz_map = self.repo.fetch_quizzes_by_ids(list(user_answers.keys()))
+        catalog = get_quiz_catalog()
+        quiz_map = {quiz_id: catalog.get_quiz(quiz_id) for quiz_id in user_answers}
+        compiled_map = {quiz_id: catalog.compiled_answers.get(quiz_id) for quiz_id in user_answers}
+
+        # 카탈로그 교체 직전에 출제된 문제 등 카탈로그에 없는 id만 DB에서 보충
+        missing_ids = [quiz_id for quiz_id, quiz in quiz_map.items() if quiz is None]
+        if missing_ids:
+            fetched = await maybe_await(self.repo.fetch_quizzes_by_ids(missing_ids))
+            for quiz_id, quiz in fetched.items():
+                quiz_map[quiz_id] = quiz
+                compiled_map[quiz_id] = CompiledAnswer(str(quiz["answer"]))
 
         correct_count = 0
         total_questions = 0
@@ -102,7 +121,7 @@ class QuizService:
             answer_text = submitted_answer or ""
             expected_answer = str(quiz["answer"])
 
-            if is_answer_accepted(answer_text, expected_answer):
+            if grade_answer(quiz_id, catalog.version, compiled_map[quiz_id], answer_text):
                 correct_count += 1
             else:
                 incorrect_items.append(
@@ -0,0 +1,97 @@
+"""채점의 오타 허용 판정에 쓰는 유사도 엔진. (compat / levenshtein)"""
+
+from collections import Counter
+from difflib import SequenceMatcher
+
+# levenshtein: 임계값에서 허용 편집 거리를 역산해 판정 (더 빠르지만 SequenceMatcher가 탈락시키던 답 일부도 통과)
+# compat: difflib.SequenceMatcher 비율 판정과 결과가 같음 (상한으로 먼저 거르고 통과한 경우만 비율 계산)
+SIMILARITY_MODE_LEVENSHTEIN = "levenshtein"
+SIMILARITY_MODE_COMPAT = "compat"
+SIMILARITY_MODES = {SIMILARITY_MODE_LEVENSHTEIN, SIMILARITY_MODE_COMPAT}
+
+
+def is_similar(a: str, b: str, threshold: float, mode: str = SIMILARITY_MODE_COMPAT) -> bool:
+    """두 문자열의 유사도가 threshold 이상인지 판정합니다."""
+    if mode == SIMILARITY_MODE_COMPAT:
+        return _is_similar_compat(a, b, threshold)
+    if mode == SIMILARITY_MODE_LEVENSHTEIN:
+        return _is_similar_levenshtein(a, b, threshold)
+    raise ValueError(f"지원하지 않는 유사도 모드입니다: {mode!r}")
+
+
+def max_edit_distance(total_length: int, threshold: float) -> int:
+    """`1 - distance / total_length >= threshold`를 만족하는 최대 편집 거리."""
+    # 부동소수 오차로 경계값(예: 0.8 * 10)이 한 칸 내려가지 않도록 보정
+    return max(0, int((1.0 - threshold) * total_length + 1e-9))
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> int | None:
+    """삽입/삭제 편집 거리(치환 = 삭제 + 삽입)를 계산하되, max_distance를 넘으면 None을 반환합니다."""
+    if a == b:
+        return 0
+
+    len_a, len_b = len(a), len(b)
+    if abs(len_a - len_b) > max_distance:
+        return None
+
+    # d = T - 2L 이므로, 거리 한도를 "최소로 필요한 공통 부분열 길이"로 바꿔서 판정
+    total = len_a + len_b
+    required = (total - max_distance + 1) // 2
+    if required <= 0:
+        return total - 2 * _lcs_length(a, b)
+
+    lcs = _lcs_length(a, b, required)
+    if lcs is None:
+        return None
+    distance = total - 2 * lcs
+    return distance if distance <= max_distance else None
+
+
+def _lcs_length(a: str, b: str, required: int = 0) -> int | None:
+    """비트 병렬(Hyyrö) 방식의 최장 공통 부분열 길이.
+
+    b의 문자 위치를 정수 비트마스크로 만들어 a의 문자 하나당 정수 연산 몇 번으로 한 행을 계산합니다.
+    남은 문자를 모두 맞혀도 required에 못 미치면 그 자리에서 None을 반환합니다.
+    """
+    if len(a) > len(b):
+        a, b = b, a
+
+    masks: dict[str, int] = {}
+    for index, char in enumerate(b):
+        masks[char] = masks.get(char, 0) | (1 << index)
+
+    full = (1 << len(b)) - 1
+    row = full
+    remaining = len(a)
+    for char in a:
+        matched = row & masks.get(char, 0)
+        row = ((row + matched) | (row - matched)) & full
+        remaining -= 1
+        if required and len(b) - row.bit_count() + remaining < required:
+            return None
+
+    return len(b) - row.bit_count()
+
+
+def _is_similar_levenshtein(a: str, b: str, threshold: float) -> bool:
+    # 삽입/삭제 거리 d와 최장 공통 부분열 L 사이에는 d = T - 2L 관계가 있으므로
+    # 1 - d / T = 2L / T 로, SequenceMatcher 비율(2M / T, M <= L)과 같은 척도가 됩니다.
+    total = len(a) + len(b)
+    if total == 0:
+        return True
+    return bounded_edit_distance(a, b, max_edit_distance(total, threshold)) is not None
+
+
+def _is_similar_compat(a: str, b: str, threshold: float) -> bool:
+    total = len(a) + len(b)
+    if total == 0:
+        return True
+
+    # SequenceMatcher.ratio() = 2M / T 이고, M은 짧은 쪽 길이와 공통 문자 수를 넘을 수 없음
+    if 2.0 * min(len(a), len(b)) / total < threshold:
+        return False
+    common = sum((Counter(a) & Counter(b)).values())
+    if 2.0 * common / total < threshold:
+        return False
+
+    return SequenceMatcher(None, a, b).ratio() >= threshold
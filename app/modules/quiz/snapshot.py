@@ -0,0 +1,308 @@
+"""퀴즈 카탈로그를 mmap으로 바로 읽을 수 있는 바이너리 스냅샷으로 저장/적재합니다."""
+
+import mmap
+import os
+import struct
+from collections.abc import Iterator, Sequence
+from typing import Any, NamedTuple, Optional
+
+from app.modules.quiz.grading import CompiledAnswer, CompiledCandidate
+
+# 파일 구조 (little-endian, 모든 정수는 uint32)
+# - 헤더: magic, 포맷 버전, 원본 해시(SHA-256 32바이트), DB 카탈로그 버전, 각 섹션 개수
+# - 문자열 테이블: 오프셋 배열(string_count + 1) + UTF-8 blob (중복 문자열은 한 번만 저장)
+# - 퀴즈: (id, question, explanation, answer, category, 정답 후보 시작, 정답 후보 수)
+# - 정답 후보: `CompiledCandidate` 전처리 결과 (text, compact, 공백으로 이은 tokens, 플래그 문자열 index + number)
+# - 카테고리 색인: (정규 카테고리명, 시작, 개수) + 퀴즈 index 배열
+# - 샤드: (파일명, 파일 해시, 시작, 개수) + 퀴즈 index 배열
+MAGIC = b"QZSNAP01"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<8sI32sIIIIIII")
+_U32 = struct.Struct("<I")
+_QUIZ = struct.Struct("<7I")
+_RANGE = struct.Struct("<3I")
+_SHARD = struct.Struct("<4I")
+_CANDIDATE = struct.Struct("<4Id")
+
+# 정답 후보 플래그
+_HAS_NUMBER = 1
+_IS_ASCII_WORD = 2
+
+
+class SnapshotShard(NamedTuple):
+    name: str  # CSV 파일명
+    content_hash: str
+    quiz_ids: list[str]
+
+
+class _StringTable:
+    def __init__(self):
+        self.index: dict[str, int] = {}
+        self.encoded: list[bytes] = []
+
+    def add(self, value: str) -> int:
+        position = self.index.get(value)
+        if position is None:
+            position = len(self.encoded)
+            self.index[value] = position
+            self.encoded.append(value.encode("utf-8"))
+        return position
+
+
+def write_snapshot(
+    path: str,
+    source_hash: str,
+    db_version: int,
+    quizzes: Sequence[dict[str, Any]],
+    categories: dict[str, Sequence[int]],
+    shards: Sequence[SnapshotShard] = (),
+) -> None:
+    """스냅샷 파일을 씁니다. (임시 파일에 쓴 뒤 rename으로 교체)
+
+    Args:
+        source_hash: CSV 내용 해시 (hex)
+        db_version: 스냅샷을 만든 시점의 catalog_state 버전
+        quizzes: id/question/explanation/answer/category 키를 가진 퀴즈 목록
+        categories: 정규 카테고리명 -> quizzes index 목록
+        shards: CSV 파일별 해시와 해당 파일의 퀴즈 id
+    """
+    strings = _StringTable()
+    quiz_rows: list[tuple] = []
+    candidate_rows: list[tuple] = []
+    for quiz in quizzes:
+        candidates = CompiledAnswer(quiz["answer"]).candidates
+        quiz_rows.append(
+            (
+                strings.add(quiz["id"]),
+                strings.add(quiz["question"]),
+                strings.add(quiz["explanation"]),
+                strings.add(quiz["answer"]),
+                strings.add(quiz["category"]),
+                len(candidate_rows),
+                len(candidates),
+            )
+        )
+        candidate_rows.extend(_candidate_row(strings, candidate) for candidate in candidates)
+
+    position_by_id = {quiz["id"]: position for position, quiz in enumerate(quizzes)}
+    category_ranges, category_members = _build_ranges(
+        (strings.add(name), list(members)) for name, members in categories.items()
+    )
+    shard_ranges, shard_members = _build_ranges(
+        (
+            (strings.add(shard.name), strings.add(shard.content_hash)),
+            [position_by_id[quiz_id] for quiz_id in shard.quiz_ids if quiz_id in position_by_id],
+        )
+        for shard in shards
+    )
+
+    offsets = [0]
+    for encoded in strings.encoded:
+        offsets.append(offsets[-1] + len(encoded))
+    blob = b"".join(strings.encoded)
+    blob += b"\0" * (-len(blob) % 4)
+
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        bytes.fromhex(source_hash),
+        db_version,
+        len(strings.encoded),
+        len(blob),
+        len(quiz_rows),
+        len(candidate_rows),
+        len(category_ranges),
+        len(shard_ranges),
+    )
+
+    temp_path = f"{path}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(temp_path, "wb") as file:
+        file.write(header)
+        file.write(_pack_u32(offsets))
+        file.write(blob)
+        file.writelines(_QUIZ.pack(*row) for row in quiz_rows)
+        file.writelines(_CANDIDATE.pack(*row) for row in candidate_rows)
+        file.writelines(_RANGE.pack(name_index, start, count) for name_index, start, count in category_ranges)
+        file.write(_pack_u32([len(category_members)]))
+        file.write(_pack_u32(category_members))
+        file.writelines(
+            _SHARD.pack(name_index, hash_index, start, count) for (name_index, hash_index), start, count in shard_ranges
+        )
+        file.write(_pack_u32([len(shard_members)]))
+        file.write(_pack_u32(shard_members))
+    os.replace(temp_path, path)
+
+
+class QuizSnapshot:
+    """mmap으로 연 스냅샷. 문자열은 요청할 때만 디코딩합니다."""
+
+    def __init__(self, buffer: mmap.mmap | bytes):
+        """생성자 (`QuizSnapshot.open` 사용)"""
+        self._buffer = buffer
+        (
+            magic,
+            format_version,
+            source_hash,
+            self.db_version,
+            string_count,
+            blob_size,
+            self.quiz_count,
+            candidate_count,
+            category_count,
+            shard_count,
+        ) = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError("지원하지 않는 스냅샷 형식입니다.")
+        self.source_hash = source_hash.hex()
+
+        offset = _HEADER.size
+        self._string_offsets = offset
+        offset += (string_count + 1) * 4
+        self._blob = offset
+        offset += blob_size
+        self._quizzes = offset
+        offset += self.quiz_count * _QUIZ.size
+        self._candidates = offset
+        offset += candidate_count * _CANDIDATE.size
+        self._categories = offset
+        self.category_count = category_count
+        offset += category_count * _RANGE.size
+        category_member_count = _U32.unpack_from(buffer, offset)[0]
+        self._category_members = offset + 4
+        offset += 4 + category_member_count * 4
+        self._shards = offset
+        self.shard_count = shard_count
+        offset += shard_count * _SHARD.size
+        shard_member_count = _U32.unpack_from(buffer, offset)[0]
+        self._shard_members = offset + 4
+        offset += 4 + shard_member_count * 4
+        if offset > len(buffer):
+            raise ValueError("스냅샷 파일이 잘렸습니다.")
+
+    @classmethod
+    def open(cls, path: str) -> Optional["QuizSnapshot"]:
+        """스냅샷을 mmap으로 엽니다. 파일이 없거나 손상되었으면 None"""
+        try:
+            with open(path, "rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            return cls(buffer)
+        except (ValueError, struct.error) as e:
+            print(f"스냅샷을 읽을 수 없어 무시합니다: {path} ({e})")
+            buffer.close()
+            return None
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def in_memory(self) -> "QuizSnapshot":
+        """파일 내용을 메모리로 복사한 스냅샷. (파일을 닫거나 새 스냅샷으로 교체한 뒤에도 읽을 수 있음)"""
+        return QuizSnapshot(self._buffer[:])
+
+    def __len__(self) -> int:
+        return self.quiz_count
+
+    def string(self, index: int) -> str:
+        start, end = struct.unpack_from("<2I", self._buffer, self._string_offsets + index * 4)
+        return self._buffer[self._blob + start : self._blob + end].decode("utf-8")
+
+    def quiz(self, position: int) -> dict[str, str]:
+        id_, question, explanation, answer, category, _, _ = _QUIZ.unpack_from(
+            self._buffer, self._quizzes + position * _QUIZ.size
+        )
+        return {
+            "id": self.string(id_),
+            "question": self.string(question),
+            "explanation": self.string(explanation),
+            "answer": self.string(answer),
+            "category": self.string(category),
+        }
+
+    def iter_quizzes(self) -> Iterator[dict[str, str]]:
+        for position in range(self.quiz_count):
+            yield self.quiz(position)
+
+    def answer_candidates(self, position: int) -> list[str]:
+        """정규화된 정답 후보 목록 (`split_answer_candidates` 결과)"""
+        return [candidate.text for candidate in self._compiled_candidates(position)]
+
+    def compiled_answer(self, position: int) -> CompiledAnswer:
+        """저장해 둔 전처리 결과로 퀴즈의 채점기를 만듭니다. (정답을 다시 정규화/분해하지 않음)"""
+        answer = _QUIZ.unpack_from(self._buffer, self._quizzes + position * _QUIZ.size)[3]
+        return CompiledAnswer.from_candidates(self.string(answer), self._compiled_candidates(position))
+
+    def _compiled_candidates(self, position: int) -> list[CompiledCandidate]:
+        start, count = _QUIZ.unpack_from(self._buffer, self._quizzes + position * _QUIZ.size)[5:]
+        candidates: list[CompiledCandidate] = []
+        for row in range(start, start + count):
+            text, compact, tokens, flags, number = _CANDIDATE.unpack_from(
+                self._buffer, self._candidates + row * _CANDIDATE.size
+            )
+            joined_tokens = self.string(tokens)
+            candidates.append(
+                CompiledCandidate.restore(
+                    self.string(text),
+                    self.string(compact),
+                    number if flags & _HAS_NUMBER else None,
+                    joined_tokens.split(" ") if joined_tokens else [],
+                    bool(flags & _IS_ASCII_WORD),
+                )
+            )
+        return candidates
+
+    def categories(self) -> dict[str, list[int]]:
+        """정규 카테고리명 -> 퀴즈 위치 목록"""
+        result: dict[str, list[int]] = {}
+        for position in range(self.category_count):
+            name_index, start, count = _RANGE.unpack_from(self._buffer, self._categories + position * _RANGE.size)
+            result[self.string(name_index)] = list(
+                struct.unpack_from(f"<{count}I", self._buffer, self._category_members + start * 4)
+            )
+        return result
+
+    def shards(self) -> list[SnapshotShard]:
+        result: list[SnapshotShard] = []
+        for position in range(self.shard_count):
+            name_index, hash_index, start, count = _SHARD.unpack_from(
+                self._buffer, self._shards + position * _SHARD.size
+            )
+            members = struct.unpack_from(f"<{count}I", self._buffer, self._shard_members + start * 4)
+            result.append(
+                SnapshotShard(
+                    self.string(name_index),
+                    self.string(hash_index),
+                    [self.string(_QUIZ.unpack_from(self._buffer, self._quizzes + m * _QUIZ.size)[0]) for m in members],
+                )
+            )
+        return result
+
+
+def _candidate_row(strings: _StringTable, candidate: CompiledCandidate) -> tuple:
+    # tokens는 영숫자/한글만 담으므로 공백으로 이어 문자열 하나로 저장
+    flags = (_HAS_NUMBER if candidate.number is not None else 0) | (_IS_ASCII_WORD if candidate.is_ascii_word else 0)
+    return (
+        strings.add(candidate.text),
+        strings.add(candidate.compact),
+        strings.add(" ".join(candidate.tokens)),
+        flags,
+        candidate.number if candidate.number is not None else 0.0,
+    )
+
+
+def _build_ranges(groups) -> tuple:
+    ranges: list[tuple] = []
+    members: list[int] = []
+    for key, group in groups:
+        ranges.append((key, len(members), len(group)))
+        members.extend(group)
+    return ranges, members
+
+
+def _pack_u32(values: Sequence[int]) -> bytes:
+    return struct.pack(f"<{len(values)}I", *values)
@@ -0,0 +1,458 @@
+"""scores를 카테고리별 정렬 상태로 메모리에 유지하는 랭킹 엔진."""
+
+import threading
+from bisect import bisect_left, insort
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from app.core.config import config
+from app.core.database import SessionLocal
+from app.modules.ranking.repository import ADMARKET_CATEGORY, ADMARKET_CATEGORY_ALIASES, RankingRepository
+
+# (user_id, 원본 카테고리) - scores 테이블의 유니크 키
+EntryKey = tuple[str, str]
+# (-score, created_at 없음 여부, created_at, username, user_id, 원본 카테고리)
+SortKey = tuple[int, bool, datetime, str, str, str]
+
+
+# 점수 버킷 범위 (제출 점수는 0~100% 정수, 범위를 벗어난 값은 양 끝 버킷에 넣음)
+MAX_SCORE = 100
+
+
+def _sort_key(user_id: str, username: str, category: str, score: int, created_at: datetime | None) -> SortKey:
+    return (-score, created_at is None, created_at or datetime.min, username, user_id, category)
+
+
+def _board_names(category: str) -> list[str | None]:
+    names: list[str | None] = [None, category]
+    if category in ADMARKET_CATEGORY_ALIASES and category != ADMARKET_CATEGORY:
+        names.append(ADMARKET_CATEGORY)
+    return names
+
+
+def _is_multi_row_board(name: str | None) -> bool:
+    # 한 사용자의 여러 카테고리 행이 함께 들어가는 보드
+    return name is None or name == ADMARKET_CATEGORY
+
+
+def _bucket_index(key: SortKey) -> int:
+    # 높은 점수가 앞 버킷에 오도록 뒤집어서 배치
+    return MAX_SCORE - min(max(-key[0], 0), MAX_SCORE)
+
+
+class FenwickTree:
+    """버킷별 개수의 구간 합과 k번째 원소 위치를 O(log n)에 구하는 Fenwick(BIT) 트리."""
+
+    def __init__(self, size: int):
+        """생성자"""
+        self.size = size
+        self._tree = [0] * (size + 1)
+        self._top_bit = 1 << (size.bit_length() - 1) if size else 0
+
+    def add(self, index: int, delta: int) -> None:
+        """index(0부터) 버킷의 개수에 delta를 더합니다."""
+        index += 1
+        while index <= self.size:
+            self._tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, count: int) -> int:
+        """앞에서부터 count개 버킷(0 ~ count-1)의 개수 합."""
+        total = 0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+    def find_by_order(self, order: int) -> int:
+        """누적 개수가 처음으로 order(1부터) 이상이 되는 버킷 index(0부터)를 반환합니다."""
+        position = 0
+        remaining = order
+        bit = self._top_bit
+        while bit:
+            next_position = position + bit
+            if next_position <= self.size and self._tree[next_position] < remaining:
+                position = next_position
+                remaining -= self._tree[next_position]
+            bit >>= 1
+        return position
+
+
+class CategoryBoard:
+    """한 카테고리의 점수 순위표.
+
+    점수 버킷마다 정렬된 목록을 두고, 버킷별 개수를 Fenwick 트리로 관리합니다.
+    - 순위 조회: 앞선 버킷 개수 합(O(log B)) + 버킷 안 이진 탐색(O(log n))
+    - k위 조회: Fenwick 트리에서 버킷 탐색(O(log B)) + 버킷 안 인덱싱(O(1))
+    """
+
+    def __init__(self):
+        """생성자"""
+        self._buckets: list[list[SortKey]] = [[] for _ in range(MAX_SCORE + 1)]
+        self._counts = FenwickTree(MAX_SCORE + 1)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: SortKey) -> None:
+        index = _bucket_index(key)
+        insort(self._buckets[index], key)
+        self._counts.add(index, 1)
+        self._size += 1
+
+    def remove(self, key: SortKey) -> None:
+        index = _bucket_index(key)
+        bucket = self._buckets[index]
+        position = bisect_left(bucket, key)
+        if position < len(bucket) and bucket[position] == key:
+            del bucket[position]
+            self._counts.add(index, -1)
+            self._size -= 1
+
+    def rank(self, key: SortKey) -> int:
+        """보드에 들어 있는 key의 순위(1부터)."""
+        index = _bucket_index(key)
+        return self._counts.prefix_sum(index) + bisect_left(self._buckets[index], key) + 1
+
+    def select(self, rank: int) -> SortKey:
+        """rank위(1부터) key를 반환합니다."""
+        index = self._counts.find_by_order(rank)
+        return self._buckets[index][rank - self._counts.prefix_sum(index) - 1]
+
+    def range(self, start_rank: int, end_rank: int) -> list[SortKey]:
+        """start_rank ~ end_rank위(양끝 포함, 1부터) key 목록."""
+        start_rank = max(start_rank, 1)
+        end_rank = min(end_rank, self._size)
+        if start_rank > end_rank:
+            return []
+
+        index = self._counts.find_by_order(start_rank)
+        offset = start_rank - self._counts.prefix_sum(index) - 1
+        keys: list[SortKey] = []
+        wanted = end_rank - start_rank + 1
+        while len(keys) < wanted:
+            keys.extend(self._buckets[index][offset : offset + wanted - len(keys)])
+            index += 1
+            offset = 0
+        return keys
+
+    def top(self, limit: int) -> list[SortKey]:
+        return self.range(1, limit)
+
+
+class Leaderboard:
+    """카테고리 보드 묶음. 정렬 기준과 보드 구성은 `RankingRepository.fetch_ranking`과 같습니다.
+
+    - None: 전체 점수 / 원본 카테고리명: 해당 카테고리 점수 / ADmarket: ADmarket 계열 카테고리를 합친 점수
+    - 전체/ADmarket 보드는 한 사용자가 여러 행을 가질 수 있어, `rank_of`용으로 사용자별 최고 점수 보드를 따로 둡니다.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        """생성자
+
+        Args:
+            rows: user_id, username, category, score, created_at 키를 가진 점수 목록
+        """
+        self._lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+        self._boards: dict[str | None, CategoryBoard] = {}
+        self._keys: dict[EntryKey, SortKey] = {}
+        self._user_categories: dict[str, set[str]] = {}
+        # 전체/ADmarket 보드의 사용자별 최고 점수 보드와 그 key
+        self._best_boards: dict[str | None, CategoryBoard] = {}
+        self._best_keys: dict[tuple[str, str | None], SortKey] = {}
+        # rebuild 중 반영된 점수 (새 보드에 다시 적용)
+        self._replay: list[tuple[str, str, str, int, datetime | None]] | None = None
+
+        for row in rows:
+            self._apply(
+                str(row["user_id"]),
+                str(row.get("username") or ""),
+                str(row.get("category") or "전체"),
+                int(row.get("score") or 0),
+                row.get("created_at"),
+            )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def apply_score(
+        self,
+        user_id: str,
+        username: str,
+        category: str,
+        score: int,
+        created_at: datetime | None,
+    ) -> None:
+        """점수 저장 결과를 반영합니다. (같은 user_id + category가 있으면 교체)"""
+        with self._lock:
+            self._apply(user_id, username, category, score, created_at)
+            if self._replay is not None:
+                self._replay.append((user_id, username, category, score, created_at))
+
+    def rebuild(self, load_rows: Callable[[], list[dict[str, Any]]]) -> None:
+        """load_rows()로 읽은 점수로 보드를 다시 만들어 교체합니다.
+
+        읽는 동안 apply_score로 반영된 점수는 새 보드에 다시 적용합니다. (읽기 전에 커밋된 점수면 같은 값으로 교체)
+        """
+        with self._rebuild_lock:
+            with self._lock:
+                self._replay = []
+            try:
+                fresh = Leaderboard(load_rows())
+            except BaseException:
+                with self._lock:
+                    self._replay = None
+                raise
+
+            with self._lock:
+                for args in self._replay:
+                    fresh._apply(*args)
+                self._boards, self._keys, self._user_categories = fresh._boards, fresh._keys, fresh._user_categories
+                self._best_boards, self._best_keys = fresh._best_boards, fresh._best_keys
+                self._replay = None
+
+    def top(self, category: str | None = None, limit: int = 10) -> list[dict[str, Any]]:
+        """`RankingRepository.fetch_ranking`과 같은 형태의 상위 limit개 행을 반환합니다."""
+        with self._lock:
+            board = self._boards.get(category)
+            keys = board.top(limit) if board is not None else []
+
+        return [_to_row(key) for key in keys]
+
+    def rank_of(self, user_id: str, category: str | None = None, neighbors: int = 5) -> dict[str, Any] | None:
+        """사용자의 순위, 전체 인원, 앞뒤 neighbors명을 반환합니다. (점수가 없으면 None)
+
+        전체/ADmarket처럼 한 사용자가 여러 행을 가질 수 있는 보드에서는 사용자마다 가장 높은 행 하나만
+        순위에 넣으므로, total과 neighbors도 행 수가 아니라 사용자 수 기준입니다.
+        """
+        with self._lock:
+            if _is_multi_row_board(category):
+                board = self._best_boards.get(category)
+                key = self._best_keys.get((user_id, category))
+            else:
+                board = self._boards.get(category)
+                key = self._keys.get((user_id, category)) if category is not None else None
+            if board is None or key is None:
+                return None
+
+            rank = board.rank(key)
+            total = len(board)
+            start_rank = max(rank - neighbors, 1)
+            window = board.range(start_rank, rank + neighbors)
+
+        return {
+            "rank": rank,
+            "total": total,
+            "entry": _to_row(key),
+            "neighbors": [{"rank": start_rank + offset, **_to_row(neighbor)} for offset, neighbor in enumerate(window)],
+        }
+
+    def _apply(
+        self,
+        user_id: str,
+        username: str,
+        category: str,
+        score: int,
+        created_at: datetime | None,
+    ) -> None:
+        entry_key = (user_id, category)
+        previous = self._keys.get(entry_key)
+        if previous is not None:
+            for name in _board_names(category):
+                self._boards[name].remove(previous)
+            if created_at is None:
+                # 점수만 바뀐 경우 최초 저장 시각은 유지
+                created_at = None if previous[1] else previous[2]
+
+        key = _sort_key(user_id, username, category, score, _coerce_created_at(created_at))
+        self._keys[entry_key] = key
+        self._user_categories.setdefault(user_id, set()).add(category)
+        for name in _board_names(category):
+            self._boards.setdefault(name, CategoryBoard()).add(key)
+            if _is_multi_row_board(name):
+                self._update_best(user_id, name)
+
+    def _update_best(self, user_id: str, name: str | None) -> None:
+        best = min(
+            self._keys[(user_id, raw_category)]
+            for raw_category in self._user_categories[user_id]
+            if name in _board_names(raw_category)
+        )
+        previous = self._best_keys.get((user_id, name))
+        if previous == best:
+            return
+        board = self._best_boards.setdefault(name, CategoryBoard())
+        if previous is not None:
+            board.remove(previous)
+        board.add(best)
+        self._best_keys[(user_id, name)] = best
+
+
+_leaderboard: Leaderboard | None = None
+_leaderboard_lock = threading.Lock()
+
+
+def load_leaderboard() -> Leaderboard:
+    """DB의 점수 전체로 리더보드를 새로 만들어 교체합니다."""
+    global _leaderboard
+
+    with _leaderboard_lock:
+        leaderboard = Leaderboard(_fetch_all_scores())
+        _leaderboard = leaderboard
+
+    print(f"리더보드 적재 완료 (scores={len(leaderboard)})")
+    return leaderboard
+
+
+def refresh_leaderboard() -> Leaderboard:
+    """DB의 점수 전체로 현재 리더보드를 다시 만듭니다. (다른 워커가 저장한 점수 반영)"""
+    leaderboard = _leaderboard
+    if leaderboard is None:
+        return load_leaderboard()
+
+    leaderboard.rebuild(_fetch_all_scores)
+    return leaderboard
+
+
+def _fetch_all_scores() -> list[dict[str, Any]]:
+    with SessionLocal() as session:
+        return RankingRepository(session).fetch_all_scores()
+
+
+def _fetch_scores_marker() -> tuple[Any, ...]:
+    with SessionLocal() as session:
+        return RankingRepository(session).fetch_scores_marker()
+
+
+def get_leaderboard() -> Leaderboard:
+    """현재 리더보드를 반환합니다. 아직 적재 전이면 DB에서 한 번 읽어 옵니다."""
+    leaderboard = _leaderboard
+    if leaderboard is None:
+        leaderboard = load_leaderboard()
+    return leaderboard
+
+
+def reset_leaderboard() -> None:
+    """다음 조회 때 DB에서 다시 적재하도록 메모리 리더보드를 버립니다."""
+    global _leaderboard
+    _leaderboard = None
+
+
+class LeaderboardRefresher:
+    """interval_seconds마다 scores가 바뀌었는지 확인하고, 바뀌었으면 리더보드를 DB에서 다시 적재하는 백그라운드 스레드"""
+
+    def __init__(self, interval_seconds: float):
+        """생성자"""
+        self.interval_seconds = interval_seconds
+        # 마지막으로 다시 적재할 때의 scores 집계값 (None이면 다음 확인 때 무조건 적재)
+        self._marker: tuple[Any, ...] | None = None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="leaderboard-refresher", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def refresh_if_changed(self) -> bool:
+        """scores 집계값이 지난 적재 때와 다르면 리더보드를 다시 적재합니다. (적재했으면 True)"""
+        # 적재 전에 읽어 두므로, 적재 중에 들어온 변경은 다음 확인 때 다시 적재됩니다.
+        marker = _fetch_scores_marker()
+        if marker == self._marker:
+            return False
+        refresh_leaderboard()
+        self._marker = marker
+        return True
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                self.refresh_if_changed()
+            except Exception as e:
+                print(f"리더보드 갱신 중 오류 발생: {str(e)}")
+
+
+refresher: LeaderboardRefresher | None = None  # 이 프로세스의 리더보드 주기 갱신
+
+
+def start_leaderboard_refresher() -> None:
+    """RANKING_LEADERBOARD_REFRESH_SECONDS가 0보다 크면 주기 갱신을 시작합니다."""
+    global refresher
+    if refresher is not None or config.RANKING_LEADERBOARD_REFRESH_SECONDS <= 0:
+        return
+    refresher = LeaderboardRefresher(config.RANKING_LEADERBOARD_REFRESH_SECONDS)
+    refresher.start()
+
+
+def stop_leaderboard_refresher() -> None:
+    global refresher
+    if refresher is not None:
+        refresher.stop()
+        refresher = None
+
+
+def check_consistency(sql_rows: list[dict[str, Any]], memory_rows: list[dict[str, Any]]) -> list[str]:
+    """SQL 랭킹과 메모리 랭킹을 비교해 불일치 내역을 반환합니다. (빈 목록이면 일치)
+
+    score/created_at이 완전히 같은 동점 행의 순서는 SQL에서도 정해져 있지 않으므로,
+    순서는 (score, created_at) 열로 비교하고 행 구성은 집합으로 비교합니다.
+    """
+
+    def order_key(row: dict[str, Any]) -> tuple[int, str]:
+        return int(row.get("score") or 0), _format_created_at(row.get("created_at"))
+
+    def row_key(row: dict[str, Any]) -> tuple[str, int, str, str]:
+        return (
+            str(row.get("username") or ""),
+            int(row.get("score") or 0),
+            str(row.get("category") or ""),
+            _format_created_at(row.get("created_at")),
+        )
+
+    mismatches: list[str] = []
+    if len(sql_rows) != len(memory_rows):
+        mismatches.append(f"행 수 불일치: sql={len(sql_rows)}, memory={len(memory_rows)}")
+
+    for index, (sql_row, memory_row) in enumerate(zip(sql_rows, memory_rows), start=1):
+        if order_key(sql_row) != order_key(memory_row):
+            mismatches.append(f"{index}위 정렬 불일치: sql={order_key(sql_row)}, memory={order_key(memory_row)}")
+
+    sql_set = {row_key(row) for row in sql_rows}
+    memory_set = {row_key(row) for row in memory_rows}
+    for row in sorted(sql_set - memory_set):
+        mismatches.append(f"메모리에 없는 행: {row}")
+    for row in sorted(memory_set - sql_set):
+        mismatches.append(f"SQL에 없는 행: {row}")
+
+    return mismatches
+
+
+def _to_row(key: SortKey) -> dict[str, Any]:
+    negative_score, no_created_at, created_at, username, _, raw_category = key
+    return {
+        "username": username,
+        "score": -negative_score,
+        "category": raw_category,
+        "created_at": None if no_created_at else created_at,
+    }
+
+
+def _coerce_created_at(value: Any) -> datetime | None:
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.strptime(str(value)[:19], "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+
+
+def _format_created_at(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return str(value or "")
@@ -1,41 +1,108 @@
-from typing import Any, Dict, List, Optional
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.database import prefer_replica
 from app.models import Score, User
 
+ADMARKET_CATEGORY = "ADmarket"
+ADMARKET_CATEGORY_ALIASES = {"ADmarket", "Corp", "Bidding", "Message"}
+
+
+def _build_fetch_all_scores_stmt() -> Select:
+    return (
+        select(
+            Score.user_id.label("user_id"),
+            User.username.label("username"),
+            Score.category.label("category"),
+            Score.score.label("score"),
+            Score.created_at.label("created_at"),
+        )
+        .select_from(Score)
+        .join(User, Score.user_id == User.id)
+    )
+
+
+def _build_fetch_scores_marker_stmt() -> Select:
+    # 행 추가/삭제는 count, 기존 행 점수 변경(upsert)은 sum(score)로 드러납니다.
+    return select(
+        func.count(Score.id).label("count"),
+        func.coalesce(func.sum(Score.score), 0).label("score_sum"),
+        func.max(Score.created_at).label("latest"),
+    )
+
+
+def _build_fetch_ranking_stmt(category: str | None, limit: int | None) -> Select:
+    stmt = (
+        select(
+            User.username.label("username"),
+            Score.score.label("score"),
+            Score.category.label("category"),
+            Score.created_at.label("created_at"),
+        )
+        .select_from(Score)
+        .join(User, Score.user_id == User.id)
+    )
+
+    if category and category != "전체":
+        if category == ADMARKET_CATEGORY:
+            stmt = stmt.where(Score.category.in_(sorted(ADMARKET_CATEGORY_ALIASES)))
+        else:
+            stmt = stmt.where(Score.category == category)
+    elif category == "전체":
+        stmt = stmt.where(Score.category == "전체")
+
+    stmt = stmt.order_by(Score.score.desc(), Score.created_at.asc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return prefer_replica(stmt)
+
 
 class RankingRepository:
-    ADMARKET_CATEGORY = "ADmarket"
-    ADMARKET_CATEGORY_ALIASES = {"ADmarket", "Corp", "Bidding", "Message"}
+    ADMARKET_CATEGORY = ADMARKET_CATEGORY
+    ADMARKET_CATEGORY_ALIASES = ADMARKET_CATEGORY_ALIASES
 
     def __init__(self, db: Session):
         """생성자"""
         self.db = db
 
-    def fetch_ranking(self, category: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+    def fetch_ranking(self, category: str | None = None, limit: int = 10) -> list[dict[str, Any]]:
         """랭킹 원시 데이터를 조회합니다."""
-        stmt = (
-            select(
-                User.username.label("username"),
-                Score.score.label("score"),
-                Score.category.label("category"),
-                Score.created_at.label("created_at"),
-            )
-            .select_from(Score)
-            .join(User, Score.user_id == User.id)
-        )
+        rows = self.db.execute(_build_fetch_ranking_stmt(category, limit)).mappings().all()
+        return [dict(r) for r in rows]
+
+    def fetch_all_scores(self) -> list[dict[str, Any]]:
+        """리더보드 적재용으로 점수 전체(user_id 포함)를 조회합니다."""
+        rows = self.db.execute(_build_fetch_all_scores_stmt()).mappings().all()
+        return [dict(r) for r in rows]
+
+    def fetch_scores_marker(self) -> tuple[Any, ...]:
+        """scores 변경 여부 확인용 집계값 (count, sum(score), max(created_at))"""
+        return tuple(self.db.execute(_build_fetch_scores_marker_stmt()).one())
+
+
+class AsyncRankingRepository:
+    """RankingRepository의 비동기 세션(AsyncSession) 버전."""
 
-        if category and category != "전체":
-            if category == self.ADMARKET_CATEGORY:
-                stmt = stmt.where(Score.category.in_(sorted(self.ADMARKET_CATEGORY_ALIASES)))
-            else:
-                stmt = stmt.where(Score.category == category)
-        elif category == "전체":
-            stmt = stmt.where(Score.category == "전체")
+    ADMARKET_CATEGORY = ADMARKET_CATEGORY
+    ADMARKET_CATEGORY_ALIASES = ADMARKET_CATEGORY_ALIASES
 
-        stmt = stmt.order_by(Score.score.desc(), Score.created_at.asc()).limit(limit)
+    def __init__(self, db: AsyncSession):
+        """생성자"""
+        self.db = db
+
+    async def fetch_ranking(self, category: str | None = None, limit: int = 10) -> list[dict[str, Any]]:
+        """랭킹 원시 데이터를 조회합니다."""
+        rows = (await self.db.execute(_build_fetch_ranking_stmt(category, limit))).mappings().all()
+        return [dict(r) for r in rows]
 
-        rows = self.db.execute(stmt).mappings().all()
+    async def fetch_all_scores(self) -> list[dict[str, Any]]:
+        """리더보드 적재용으로 점수 전체(user_id 포함)를 조회합니다."""
+        rows = (await self.db.execute(_build_fetch_all_scores_stmt())).mappings().all()
         return [dict(r) for r in rows]
+
+    async def fetch_scores_marker(self) -> tuple[Any, ...]:
+        """scores 변경 여부 확인용 집계값 (count, sum(score), max(created_at))"""
+        return tuple((await self.db.execute(_build_fetch_scores_marker_stmt())).one())
@@ -1,16 +1,27 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
-from app.modules.ranking.repository import RankingRepository
-from app.modules.ranking.schemas import RankingListResponse, RankingQuery
+from app.core.config import config
+from app.core.database import get_db_session
+from app.modules.auth.dependencies import get_current_user
+from app.modules.auth.schemas import AuthenticatedUser
+from app.modules.ranking.repository import AsyncRankingRepository, RankingRepository
+from app.modules.ranking.schemas import (
+    MyRankingQuery,
+    MyRankingResponse,
+    RankingConsistencyQuery,
+    RankingConsistencyResponse,
+    RankingListResponse,
+    RankingQuery,
+)
 from app.modules.ranking.service import RankingService
 
 router = APIRouter()
 
 
-def _get_ranking_service(db: Session = Depends(get_db)) -> RankingService:
-    repo = RankingRepository(db)
+def _get_ranking_service(db: Session | AsyncSession = Depends(get_db_session)) -> RankingService:
+    repo = AsyncRankingRepository(db) if isinstance(db, AsyncSession) else RankingRepository(db)
     return RankingService(repo)
 
 
@@ -25,3 +36,45 @@ async def get_ranking(
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"랭킹 조회 오류: {str(e)}")
+
+
+@router.get("/me", response_model=MyRankingResponse)
+async def get_my_ranking(
+    query: MyRankingQuery = Depends(),
+    user: AuthenticatedUser = Depends(get_current_user),
+    ranking_service: RankingService = Depends(_get_ranking_service),
+) -> MyRankingResponse:
+    """
+    로그인한 사용자의 순위, 백분위, 앞뒤 순위 사용자를 가져옴.
+    """
+    try:
+        result = await ranking_service.get_my_ranking(user.id, query.category, query.neighbors)
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"랭킹 조회 오류: {str(e)}")
+
+    if result is None:
+        raise HTTPException(status_code=404, detail="해당 카테고리의 점수가 없습니다.")
+    return result
+
+
+# 메모리 리더보드와 SQL 랭킹 비교 (스테이징 검증용, RANKING_CONSISTENCY_CHECK_ALLOWED_USERS만 호출 가능)
+@router.get("/verify", response_model=RankingConsistencyResponse)
+async def verify_ranking(
+    query: RankingConsistencyQuery = Depends(),
+    user: AuthenticatedUser = Depends(get_current_user),
+    ranking_service: RankingService = Depends(_get_ranking_service),
+) -> RankingConsistencyResponse:
+    if not config.RANKING_CONSISTENCY_CHECK_ENABLED:
+        raise HTTPException(status_code=404, detail="Ranking consistency check is disabled.")
+    if user.username not in config.RANKING_CONSISTENCY_CHECK_ALLOWED_USERS:
+        raise HTTPException(
+            status_code=403,
+            detail="랭킹 검증은 RANKING_CONSISTENCY_CHECK_ALLOWED_USERS에 등록된 사용자만 할 수 있습니다.",
+        )
+
+    try:
+        return await ranking_service.verify_ranking(query.category, query.limit)
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"랭킹 검증 오류: {str(e)}")
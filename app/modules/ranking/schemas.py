@@ -1,17 +1,15 @@
-from typing import Optional
-
 from pydantic import Field, field_validator
 
 from app.core.schemas import APIModel, MessageResponse
 
 
 class RankingQuery(APIModel):
-    category: Optional[str] = Field(default=None, max_length=100)
+    category: str | None = Field(default=None, max_length=100)
     limit: int = Field(default=10, ge=1, le=100)
 
     @field_validator("category")
     @classmethod
-    def normalize_category(cls, value: Optional[str]) -> Optional[str]:
+    def normalize_category(cls, value: str | None) -> str | None:
         if value is None:
             return None
         normalized = value.strip()
@@ -28,3 +26,43 @@ class RankingItem(APIModel):
 
 class RankingListResponse(MessageResponse):
     ranking: list[RankingItem]
+
+
+class MyRankingQuery(APIModel):
+    category: str | None = Field(default=None, max_length=100)
+    neighbors: int = Field(default=5, ge=0, le=50)
+
+    @field_validator("category")
+    @classmethod
+    def normalize_category(cls, value: str | None) -> str | None:
+        if value is None:
+            return None
+        normalized = value.strip()
+        return normalized or None
+
+
+class MyRankingResponse(MessageResponse):
+    rank: int = Field(ge=1)
+    total: int = Field(ge=1)
+    percentile: float = Field(ge=0, le=100)  # 내 점수 이하인 사용자 비율(%), 1위 = 100
+    me: RankingItem
+    neighbors: list[RankingItem]  # 내 앞뒤 순위 (본인 포함, 순위순)
+
+
+class RankingConsistencyQuery(APIModel):
+    category: str | None = Field(default=None, max_length=100)
+    limit: int = Field(default=100, ge=1, le=1000)
+
+    @field_validator("category")
+    @classmethod
+    def normalize_category(cls, value: str | None) -> str | None:
+        if value is None:
+            return None
+        normalized = value.strip()
+        return normalized or None
+
+
+class RankingConsistencyResponse(MessageResponse):
+    consistent: bool
+    checked_rows: int = Field(ge=0)
+    mismatches: list[str]
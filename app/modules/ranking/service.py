@@ -1,43 +1,78 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any
 
-from app.modules.ranking.repository import RankingRepository
-from app.modules.ranking.schemas import RankingItem
+from app.core.database import maybe_await
+from app.modules.ranking.leaderboard import check_consistency, get_leaderboard
+from app.modules.ranking.repository import AsyncRankingRepository, RankingRepository
+from app.modules.ranking.schemas import MyRankingResponse, RankingConsistencyResponse, RankingItem
 
 
 class RankingService:
     ADMARKET_CATEGORY = "ADmarket"
     ADMARKET_CATEGORY_ALIASES = {"ADmarket", "Corp", "Bidding", "Message"}
 
-    def __init__(self, repo: RankingRepository):
+    def __init__(self, repo: RankingRepository | AsyncRankingRepository):
         self.repo = repo
 
-    async def get_ranking(self, category: Optional[str] = None, limit: int = 10) -> list[RankingItem]:
-        """랭킹 데이터를 포맷팅하여 반환합니다."""
-        rows = self.repo.fetch_ranking(category, limit)
-        result: list[RankingItem] = []
-        for i, r in enumerate(rows, start=1):
-            created_at = r.get("created_at")
-            if isinstance(created_at, str):
-                try:
-                    created_at = datetime.strptime(
-                        created_at,
-                        "%Y-%m-%d %H:%M:%S",
-                    )
-                except ValueError:
-                    created_at = None
-
-            result.append(
-                RankingItem(
-                    rank=i,
-                    username=str(r.get("username") or ""),
-                    score=int(r.get("score") or 0),
-                    category=self._normalize_category(str(r.get("category") or "전체")),
-                    date=created_at.strftime("%Y-%m-%d %H:%M") if created_at else "N/A",
+    async def get_ranking(self, category: str | None = None, limit: int = 10) -> list[RankingItem]:
+        """랭킹 데이터를 포맷팅하여 반환합니다. (메모리 리더보드 사용)"""
+        rows = get_leaderboard().top(category, limit)
+        return [self._to_ranking_item(i, r) for i, r in enumerate(rows, start=1)]
+
+    async def get_my_ranking(
+        self,
+        user_id: str,
+        category: str | None = None,
+        neighbors: int = 5,
+    ) -> MyRankingResponse | None:
+        """사용자의 순위, 백분위, 앞뒤 neighbors명을 반환합니다. (해당 카테고리 점수가 없으면 None)"""
+        position = get_leaderboard().rank_of(user_id, category, neighbors)
+        if position is None:
+            return None
+
+        rank = position["rank"]
+        total = position["total"]
+        return MyRankingResponse(
+            message="내 랭킹 조회 성공",
+            rank=rank,
+            total=total,
+            percentile=round((total - rank + 1) / total * 100, 2),
+            me=self._to_ranking_item(rank, position["entry"]),
+            neighbors=[self._to_ranking_item(r["rank"], r) for r in position["neighbors"]],
+        )
+
+    async def verify_ranking(self, category: str | None = None, limit: int = 100) -> RankingConsistencyResponse:
+        """메모리 리더보드의 상위 limit개가 SQL 랭킹 결과와 같은지 검증합니다."""
+        sql_rows = await maybe_await(self.repo.fetch_ranking(category, limit))
+        memory_rows = get_leaderboard().top(category, limit)
+        mismatches = check_consistency(sql_rows, memory_rows)
+
+        return RankingConsistencyResponse(
+            message="랭킹 일치" if not mismatches else "랭킹 불일치",
+            consistent=not mismatches,
+            checked_rows=len(sql_rows),
+            mismatches=mismatches,
+        )
+
+    @classmethod
+    def _to_ranking_item(cls, rank: int, r: dict[str, Any]) -> RankingItem:
+        created_at = r.get("created_at")
+        if isinstance(created_at, str):
+            try:
+                created_at = datetime.strptime(
+                    created_at,
+                    "%Y-%m-%d %H:%M:%S",
                 )
-            )
+            except ValueError:
+                created_at = None
 
-        return result
+        return RankingItem(
+            rank=rank,
+            username=str(r.get("username") or ""),
+            score=int(r.get("score") or 0),
+            category=cls._normalize_category(str(r.get("category") or "전체")),
+            date=created_at.strftime("%Y-%m-%d %H:%M") if created_at else "N/A",
+        )
 
     @classmethod
     def _normalize_category(cls, category: str) -> str:
@@ -7,8 +7,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core import csv_listener  # CSV 감시 모듈 import
 from app.core.config import config
 from app.core.database import init_db
+from app.core.password_hasher import password_hasher
 from app.core.schemas import MessageResponse
 from app.modules import api_router
+from app.modules.notification_test.executor import notification_executor
+from app.modules.notification_test.outbox import start_outbox_dispatcher, stop_outbox_dispatcher
+from app.modules.notification_test.service import close_http_client
+from app.modules.quiz.catalog import get_quiz_catalog
+from app.modules.ranking.leaderboard import get_leaderboard, start_leaderboard_refresher, stop_leaderboard_refresher
 
 # 현재 실행 중인 파일의 디렉토리를 기준으로 Python path 설정
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -50,6 +56,10 @@ def read_root():
 @app.on_event("startup")
 def on_startup():
     csv_listener.start_csv_listener()  # 서버 시작 시 감시 시작
+    get_quiz_catalog()  # CSV 동기화가 실패했더라도 DB 기준으로 카탈로그를 적재
+    get_leaderboard()  # 랭킹 조회용 메모리 리더보드 적재
+    start_leaderboard_refresher()  # 다른 워커가 저장한 점수를 주기적으로 반영
+    start_outbox_dispatcher()  # notification outbox 백그라운드 발송 시작
     for route in api_router.routes:
         print(f" {route.path} -> {route.methods}")
 
@@ -57,3 +67,8 @@ def on_startup():
 @app.on_event("shutdown")
 def on_shutdown():
     csv_listener.stop_csv_listener()  # 서버 종료 시 감시 중지
+    stop_leaderboard_refresher()  # 리더보드 주기 갱신 중지
+    password_hasher.shutdown()  # 비밀번호 해싱 스레드 풀 정리
+    stop_outbox_dispatcher()  # outbox 발송 중지 (진행 중인 배치는 마무리)
+    notification_executor.shutdown()  # notification-be 호출 스레드 풀 정리
+    close_http_client()  # notification-be keep-alive 연결 정리
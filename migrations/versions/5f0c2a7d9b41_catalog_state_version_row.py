@@ -0,0 +1,38 @@
+"""catalog state version row
+
+Revision ID: 5f0c2a7d9b41
+Revises: d3983d3bc480
+Create Date: 2026-10-17 14:03:22.118904
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f0c2a7d9b41"
+down_revision: str | Sequence[str] | None = "d3983d3bc480"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if "catalog_state" in sa.inspect(op.get_bind()).get_table_names():
+        # init_db(create_all)가 이미 만든 경우
+        return
+
+    op.create_table(
+        "catalog_state",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("catalog_state")
@@ -0,0 +1,53 @@
+"""notification outbox
+
+Revision ID: 8b1e4c7a2f60
+Revises: 5f0c2a7d9b41
+Create Date: 2026-10-17 18:20:05.417362
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b1e4c7a2f60"
+down_revision: str | Sequence[str] | None = "5f0c2a7d9b41"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if "notification_outbox" in sa.inspect(op.get_bind()).get_table_names():
+        # init_db(create_all)가 이미 만든 경우
+        return
+
+    op.create_table(
+        "notification_outbox",
+        sa.Column("id", sa.String(length=26), nullable=False),
+        sa.Column("message_type", sa.String(length=20), nullable=False),
+        sa.Column("user_id", sa.String(length=20), nullable=True),
+        sa.Column("definition_code", sa.String(length=64), nullable=True),
+        sa.Column("template_code", sa.String(length=64), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_status_code", sa.Integer(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("delivered_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_notification_outbox_status_next_attempt_at",
+        "notification_outbox",
+        ["status", "next_attempt_at"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_notification_outbox_status_next_attempt_at", table_name="notification_outbox")
+    op.drop_table("notification_outbox")
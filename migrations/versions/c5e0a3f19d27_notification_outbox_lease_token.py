@@ -0,0 +1,34 @@
+"""notification outbox lease token
+
+Revision ID: c5e0a3f19d27
+Revises: 8b1e4c7a2f60
+Create Date: 2026-10-17 21:04:37.118240
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e0a3f19d27"
+down_revision: str | Sequence[str] | None = "8b1e4c7a2f60"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("notification_outbox")}
+    if "lease_token" in columns:
+        # init_db(create_all)가 테이블을 새로 만들면서 이미 포함한 경우
+        return
+
+    op.add_column("notification_outbox", sa.Column("lease_token", sa.String(length=26), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("notification_outbox") as batch_op:
+        batch_op.drop_column("lease_token")
@@ -0,0 +1,63 @@
+"""unique score per user and category
+
+Revision ID: d3983d3bc480
+Revises: 66c1c2f32a88
+Create Date: 2026-10-17 10:12:41.502311
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3983d3bc480"
+down_revision: str | Sequence[str] | None = "66c1c2f32a88"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+CONSTRAINT_NAME = "uq_scores_user_id_category"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "scores" not in inspector.get_table_names():
+        # 테이블은 init_db(create_all)가 만들며, 그때 제약 조건도 함께 생성됨
+        return
+
+    existing = {constraint["name"] for constraint in inspector.get_unique_constraints("scores")}
+    if CONSTRAINT_NAME in existing:
+        return
+
+    # 동시 제출로 생긴 (user_id, category) 중복 행 정리
+    # 랭킹 정렬 기준(score desc, created_at asc)으로 가장 앞선 행 하나만 남깁니다.
+    rows = bind.execute(sa.text("SELECT id, user_id, category, score, created_at FROM scores")).all()
+    keepers: dict[tuple[str, str], tuple] = {}
+    duplicate_ids: list[str] = []
+    for row in rows:
+        key = (row.user_id, row.category)
+        rank_key = (-(row.score or 0), str(row.created_at or ""), row.id)
+        kept = keepers.get(key)
+        if kept is None:
+            keepers[key] = (rank_key, row.id)
+        elif rank_key < kept[0]:
+            duplicate_ids.append(kept[1])
+            keepers[key] = (rank_key, row.id)
+        else:
+            duplicate_ids.append(row.id)
+
+    delete_stmt = sa.text("DELETE FROM scores WHERE id IN :ids").bindparams(sa.bindparam("ids", expanding=True))
+    for start in range(0, len(duplicate_ids), 500):
+        bind.execute(delete_stmt, {"ids": duplicate_ids[start : start + 500]})
+
+    with op.batch_alter_table("scores") as batch_op:
+        batch_op.create_unique_constraint(CONSTRAINT_NAME, ["user_id", "category"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("scores") as batch_op:
+        batch_op.drop_constraint(CONSTRAINT_NAME, type_="unique")
@@ -0,0 +1,38 @@
+"""notification outbox requested_by
+
+Revision ID: e2b7d4a80c13
+Revises: c5e0a3f19d27
+Create Date: 2026-10-17 22:11:52.604918
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7d4a80c13"
+down_revision: str | Sequence[str] | None = "c5e0a3f19d27"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("notification_outbox")}
+    if "requested_by" in columns:
+        # init_db(create_all)가 테이블을 새로 만들면서 이미 포함한 경우
+        return
+
+    op.add_column("notification_outbox", sa.Column("requested_by", sa.String(length=20), nullable=True))
+    # 기존 직접 발송 행은 수신자가 곧 등록자
+    op.execute("UPDATE notification_outbox SET requested_by = user_id WHERE message_type = 'user'")
+    op.create_index("ix_notification_outbox_requested_by", "notification_outbox", ["requested_by"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_notification_outbox_requested_by", table_name="notification_outbox")
+    with op.batch_alter_table("notification_outbox") as batch_op:
+        batch_op.drop_column("requested_by")
@@ -0,0 +1,87 @@
+"""
+notification-be 호출 지연 벤치마크: 요청마다 새 연결(urlopen) vs KeepAliveHttpClient
+
+    python scripts/bench_notification_proxy.py [요청 수] [동시 스레드 수]
+
+로컬 스텁 서버(HTTP/1.1 keep-alive)를 띄워 같은 JSON 요청을 보내고 p50/p99 지연을 비교합니다.
+"""
+
+import json
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib import request
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.http_pool import KeepAliveHttpClient
+
+BODY = json.dumps({"template_code": "TPL-1", "user_id": "benchuser"}).encode("utf-8")
+HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        payload = b'{"target_count":1,"success_count":1,"failure_count":0}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def send_with_urlopen(url: str) -> None:
+    outbound = request.Request(url, data=BODY, headers=HEADERS, method="POST")
+    with request.urlopen(outbound, timeout=10) as response:
+        response.read()
+
+
+def _measure(name: str, send, count: int, workers: int) -> None:
+    def timed(_):
+        started = time.perf_counter()
+        send()
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        latencies = sorted(executor.map(timed, range(count)))
+    elapsed = time.perf_counter() - started
+
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[min(int(count * 0.99), count - 1)] * 1000
+    print(f"{name:<22} p50={p50:7.3f}ms  p99={p99:7.3f}ms  throughput={count / elapsed:8.1f} req/s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/messages:sendUser"
+
+    client = KeepAliveHttpClient(pool_size=workers)
+    print(f"count={count} workers={workers}")
+    try:
+        _measure("urlopen (per request)", lambda: send_with_urlopen(url), count, workers)
+        _measure("keep-alive pool", lambda: client.request("POST", url, body=BODY, headers=HEADERS), count, workers)
+        print(f"pool stats: {client.stats()}")
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
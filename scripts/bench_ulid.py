@@ -0,0 +1,75 @@
+"""
+ULID 벤치마크: app.core.ulid vs 기존 py-ulid 기반 구현
+
+    python scripts/bench_ulid.py [반복 횟수]
+
+py-ulid가 설치되어 있어야 기존 구현과 비교할 수 있습니다.
+"""
+
+import secrets
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.ulid import generate_many, generate_ulid, is_valid_ulid
+
+try:
+    from ulid import ULID
+except ImportError:  # pragma: no cover - 비교 대상 없이 새 구현만 측정
+    ULID = None
+
+
+def legacy_is_valid_ulid(value: str) -> bool:
+    if not isinstance(value, str) or len(value) != 26:
+        return False
+    try:
+        ULID().decode(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def legacy_generate_ulid() -> str:
+    return ULID().generate()
+
+
+def _report(name: str, seconds: float, count: int) -> None:
+    print(f"{name:<34} {seconds * 1e9 / count:>10.1f} ns/op")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    samples = generate_many(1000) + ["01KH2YQ2VE0000000000000000"[:25] + "U", "not-a-ulid"]
+    rounds = max(count // len(samples), 1)
+
+    print(f"count={count}")
+    _report(
+        "is_valid_ulid (new)",
+        timeit.timeit(lambda: [is_valid_ulid(s) for s in samples], number=rounds),
+        rounds * len(samples),
+    )
+    if ULID is not None:
+        _report(
+            "is_valid_ulid (py-ulid)",
+            timeit.timeit(lambda: [legacy_is_valid_ulid(s) for s in samples], number=rounds),
+            rounds * len(samples),
+        )
+
+    _report("generate_ulid (new)", timeit.timeit(generate_ulid, number=count), count)
+    _report("generate_many (new)", timeit.timeit(lambda: generate_many(count), number=1), count)
+    _report(
+        "random ULID, fixed time (new)", timeit.timeit(lambda: generate_ulid(1_700_000_000_000), number=count), count
+    )
+    if ULID is not None:
+        _report("generate_ulid (py-ulid)", timeit.timeit(legacy_generate_ulid, number=count), count)
+        _report(
+            "random ULID, fixed time (py-ulid)",
+            timeit.timeit(lambda: ULID().encode((1_700_000_000_000 << 80) | secrets.randbits(80)), number=count),
+            count,
+        )
+
+
+if __name__ == "__main__":
+    main()
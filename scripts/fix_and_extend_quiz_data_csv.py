@@ -3,8 +3,7 @@ from __future__ import annotations
 import csv
 from pathlib import Path
 
-from app.core.ulid import generate_ulid, is_valid_ulid
-
+from app.core.ulid import generate_many, generate_ulid, is_valid_ulid
 
 CSV_PATH = Path("csv_files/quiz_data.csv")
 BROKEN_MARKER = "??"
@@ -190,7 +189,7 @@ FIXED_QUESTIONS_61: list[dict[str, str]] = [
     },
     {
         "question": "FastAPI에서 WebSocket 엔드포인트를 선언할 때 사용하는 데코레이터(핵심 키워드)는?",
-        "explanation": "HTTP 라우트(@app.get)와 별도로 @app.websocket(\"/ws\") 형태로 정의합니다.",
+        "explanation": 'HTTP 라우트(@app.get)와 별도로 @app.websocket("/ws") 형태로 정의합니다.',
         "answer": "websocket/@app.websocket",
         "category": "FastAPI",
     },
@@ -238,7 +237,7 @@ FIXED_QUESTIONS_61: list[dict[str, str]] = [
     },
     {
         "question": "Pydantic에서 정의되지 않은 extra 필드를 금지하는 설정 값은?",
-        "explanation": "ConfigDict(extra=\"forbid\") 처럼 설정하면 스키마에 없는 필드가 들어오면 검증 에러가 발생합니다.",
+        "explanation": 'ConfigDict(extra="forbid") 처럼 설정하면 스키마에 없는 필드가 들어오면 검증 에러가 발생합니다.',
         "answer": "forbid",
         "category": "FastAPI",
     },
@@ -305,13 +304,13 @@ FIXED_QUESTIONS_61: list[dict[str, str]] = [
     },
     {
         "question": "SQLAlchemy에서 중복을 막기 위한 유니크 제약을 선언할 때 사용하는 클래스는?",
-        "explanation": "UniqueConstraint(\"col1\", \"col2\") 형태로 복합 유니크 제약도 선언할 수 있습니다.",
+        "explanation": 'UniqueConstraint("col1", "col2") 형태로 복합 유니크 제약도 선언할 수 있습니다.',
         "answer": "UniqueConstraint",
         "category": "SQLAlchemy",
     },
     {
         "question": "SQLAlchemy에서 인덱스를 선언할 때 사용하는 클래스는?",
-        "explanation": "Index(\"ix_name\", Model.col) 형태로 인덱스를 정의할 수 있습니다.",
+        "explanation": 'Index("ix_name", Model.col) 형태로 인덱스를 정의할 수 있습니다.',
         "answer": "Index",
         "category": "SQLAlchemy",
     },
@@ -432,19 +431,19 @@ EXTRA_QUESTIONS: list[dict[str, str]] = [
     },
     {
         "question": "FastAPI에서 Swagger UI 문서 페이지의 URL 경로를 바꾸는 FastAPI 생성자 인자는?",
-        "explanation": "FastAPI(docs_url=\"/docs\")처럼 설정합니다.",
+        "explanation": 'FastAPI(docs_url="/docs")처럼 설정합니다.',
         "answer": "docs_url",
         "category": "FastAPI",
     },
     {
         "question": "FastAPI에서 OpenAPI 스펙 JSON의 URL 경로를 바꾸는 FastAPI 생성자 인자는?",
-        "explanation": "FastAPI(openapi_url=\"/openapi.json\")처럼 설정합니다.",
+        "explanation": 'FastAPI(openapi_url="/openapi.json")처럼 설정합니다.',
         "answer": "openapi_url",
         "category": "FastAPI",
     },
     {
         "question": "FastAPI에서 ReDoc 문서 페이지의 URL 경로를 바꾸는 FastAPI 생성자 인자는?",
-        "explanation": "FastAPI(redoc_url=\"/redoc\")처럼 설정합니다.",
+        "explanation": 'FastAPI(redoc_url="/redoc")처럼 설정합니다.',
         "answer": "redoc_url",
         "category": "FastAPI",
     },
@@ -647,16 +646,19 @@ def main() -> None:
 
     # Append extra questions with new ULIDs.
     added = 0
+    pending = []
     for item in EXTRA_QUESTIONS:
         key = (item["question"], item["answer"], item["category"])
-        if key in existing_qas:
-            continue
-        new_id = generate_ulid()
+        if key not in existing_qas:
+            pending.append(item)
+            existing_qas.add(key)  # EXTRA_QUESTIONS 안의 중복도 한 번만 추가
+
+    # 단조 증가 ULID라 한 번에 만든 id끼리는 겹치지 않음
+    for item, new_id in zip(pending, generate_many(len(pending))):
         while new_id in existing_ids:
             new_id = generate_ulid()
         existing_ids.add(new_id)
         new_rows.append([new_id, item["question"], item["explanation"], item["answer"], item["category"]])
-        existing_qas.add(key)
         added += 1
 
     tmp_path = CSV_PATH.with_suffix(".csv.tmp")
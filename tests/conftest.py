@@ -0,0 +1,8 @@
+import os
+import tempfile
+
+# 테스트가 로컬 개발 DB(quiz_app.db)를 건드리지 않도록 앱 import 전에 임시 SQLite 파일로 교체
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="coding-quiz-test-")
+os.environ["ENV"] = "development"
+os.environ["DATABASE_URL_DEV"] = f"sqlite:///{os.path.join(_TEST_DB_DIR, 'test_quiz_app.db')}"
+os.environ["CATALOG_SNAPSHOT_PATH"] = os.path.join(_TEST_DB_DIR, "catalog.snapshot")
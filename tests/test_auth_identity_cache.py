@@ -0,0 +1,102 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.database import SessionLocal, init_db
+from app.core.security import create_access_token
+from app.models import User
+from app.modules.auth import dependencies
+from app.modules.auth.identity_cache import IdentityCache
+from app.modules.auth.repository import UserRepository
+from app.modules.auth.schemas import AuthenticatedUser
+
+
+@pytest.fixture(scope="module", autouse=True)
+def create_tables():
+    init_db()
+
+
+@pytest.fixture
+def user():
+    name = f"c{uuid.uuid4().hex[:10]}"
+    with SessionLocal() as session:
+        created = UserRepository(session).create_user(name, f"{name}@example.com", "x")
+        yield created.id, create_access_token(created.id, created.email)
+
+
+def _count_user_lookups(monkeypatch):
+    calls = []
+    original = UserRepository.get_by_id
+
+    def counting_get_by_id(self, user_id):
+        calls.append(user_id)
+        return original(self, user_id)
+
+    monkeypatch.setattr(UserRepository, "get_by_id", counting_get_by_id)
+    return calls
+
+
+def test_warm_token_skips_users_table(user, monkeypatch):
+    user_id, token = user
+    calls = _count_user_lookups(monkeypatch)
+
+    with SessionLocal() as session:
+        first = asyncio.run(dependencies.resolve_user(token, session))
+        second = asyncio.run(dependencies.resolve_user(token, session))
+
+    assert first == second and first.id == user_id
+    assert calls == [user_id]
+
+
+def test_user_update_and_delete_invalidate_cached_identity(user, monkeypatch):
+    user_id, token = user
+    calls = _count_user_lookups(monkeypatch)
+
+    with SessionLocal() as session:
+        asyncio.run(dependencies.resolve_user(token, session))
+
+        stored = session.get(User, user_id)
+        stored.username = f"{stored.username}x"
+        session.commit()
+        renamed = asyncio.run(dependencies.resolve_user(token, session))
+        assert renamed.username == stored.username
+        assert len(calls) == 2
+
+        session.delete(stored)
+        session.commit()
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(dependencies.resolve_user(token, session))
+        assert exc_info.value.status_code == 404
+
+
+def test_entry_expires_with_token():
+    cache = IdentityCache(max_size=10, ttl_seconds=300)
+    snapshot = AuthenticatedUser(id="u1", username="alice", email="alice@example.com")
+
+    cache.set("expired", snapshot, expires_at=int(time.time()) - 1)
+    cache.set("short", snapshot, expires_at=time.time() + 0.05)
+    cache.set("long", snapshot, expires_at=int(time.time()) + 3600)
+
+    assert cache.get("expired") is None
+    assert cache.get("short") == snapshot
+    time.sleep(0.06)
+    assert cache.get("short") is None
+    assert cache.get("long") == snapshot
+
+    cache.invalidate_user("u1")
+    assert cache.get("long") is None
+
+
+def test_hit_is_rejected_once_token_exp_has_passed(monkeypatch):
+    cache = IdentityCache(max_size=10, ttl_seconds=None)
+    snapshot = AuthenticatedUser(id="u1", username="alice", email="alice@example.com")
+    now = time.time()
+    cache.set("token", snapshot, expires_at=int(now) + 60)
+    assert cache.get("token") == snapshot
+
+    # 캐시 TTL(monotonic)과 관계없이 벽시계 기준으로 exp가 지나면 사용하지 않음
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get("token") is None
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.config import config
+from app.core.password_hasher import PasswordHasher, PasswordHasherBusyError
+from app.core.security import get_password_hash, password_needs_rehash, verify_password
+from app.modules.auth.service import AuthService
+
+
+def test_hash_and_verify_run_in_executor():
+    hasher = PasswordHasher(max_workers=2, queue_limit=8)
+
+    async def scenario():
+        hashed = await hasher.hash("pw1234")
+        return hashed, await hasher.verify("pw1234", hashed), await hasher.verify("wrong", hashed)
+
+    hashed, ok, bad = asyncio.run(scenario())
+    hasher.shutdown()
+
+    assert hashed.startswith("$2b$")
+    assert (ok, bad) == (True, False)
+    assert hasher.stats()["completed"] == 3
+    assert hasher.stats()["queue_depth"] == 0
+
+
+def test_queue_limit_rejects_when_saturated():
+    hasher = PasswordHasher(max_workers=1, queue_limit=1)
+    release = threading.Event()
+
+    async def scenario():
+        blocking = asyncio.ensure_future(hasher._run(release.wait))
+        queued = asyncio.ensure_future(hasher._run(lambda: "queued"))
+        await asyncio.sleep(0.05)
+        with pytest.raises(PasswordHasherBusyError):
+            await hasher._run(lambda: "rejected")
+        release.set()
+        return await blocking, await queued
+
+    assert asyncio.run(scenario()) == (True, "queued")
+    hasher.shutdown()
+    assert hasher.stats()["rejected"] == 1
+
+
+def test_password_needs_rehash_compares_cost():
+    hashed = get_password_hash("pw1234", rounds=4)
+
+    assert password_needs_rehash(hashed, rounds=4) is False
+    assert password_needs_rehash(hashed, rounds=5) is True
+    assert password_needs_rehash("not-a-bcrypt-hash", rounds=5) is False
+
+
+class _MemoryUserRepository:
+    def __init__(self, user):
+        self.user = user
+        self.updated = 0
+
+    def get_by_email(self, email):
+        return self.user if email == self.user.email else None
+
+    def update_password_hash(self, user, hashed_password):
+        user.hashed_password = hashed_password
+        self.updated += 1
+
+
+class _User:
+    def __init__(self, hashed_password):
+        self.id = "01KH2YQ2VEAAW3HHBQ684D48ZE"
+        self.username = "rehash"
+        self.email = "rehash@example.com"
+        self.hashed_password = hashed_password
+
+
+def test_login_rehashes_when_cost_changes(monkeypatch):
+    monkeypatch.setattr(config, "PASSWORD_HASH_ROUNDS", 5)
+    user = _User(get_password_hash("pw1234", rounds=4))
+    repo = _MemoryUserRepository(user)
+    service = AuthService(repo)
+
+    result, err = asyncio.run(service.login(user.email, "pw1234"))
+    assert err is None and result["access_token"]
+    assert repo.updated == 1
+    assert user.hashed_password.startswith("$2b$05$")
+    assert verify_password("pw1234", user.hashed_password)
+
+    asyncio.run(service.login(user.email, "pw1234"))
+    assert repo.updated == 1
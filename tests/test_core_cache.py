@@ -0,0 +1,46 @@
+from app.core import cache as cache_module
+from app.core.cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUCache(max_size=10, ttl_seconds=5)
+    cache.set("default", 1)
+    cache.set("short", 2, ttl_seconds=1)
+
+    now[0] += 2
+    assert cache.get("short") is None
+    assert cache.get("default") == 1
+
+    now[0] += 5
+    assert cache.get("default") is None
+    assert cache.stats()["misses"] == 2
+
+
+def test_lru_cache_add_only_stores_missing_or_expired_keys(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUCache(max_size=10, ttl_seconds=5)
+
+    assert cache.add("key", 1) is True
+    assert cache.add("key", 2) is False
+    assert cache.get("key") == 1
+
+    now[0] += 6
+    assert cache.add("key", 3) is True
+    assert cache.get("key") == 3
@@ -0,0 +1,86 @@
+import threading
+
+import pytest
+from ulid import ULID
+
+from app.core.ulid import (
+    MonotonicUlidGenerator,
+    decode_ulid,
+    encode_ulid,
+    generate_many,
+    generate_ulid,
+    is_valid_ulid,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("01BX5ZZKBKACTAV9WEVGEMMVRY", True),
+        ("7ZZZZZZZZZZZZZZZZZZZZZZZZZ", True),  # 최대 타임스탬프
+        ("00000000000000000000000000", True),
+        ("8ZZZZZZZZZZZZZZZZZZZZZZZZZ", False),  # 48비트 초과
+        ("01BX5ZZKBKACTAV9WEVGEMMVR", False),  # 25자
+        ("01BX5ZZKBKACTAV9WEVGEMMVRYY", False),  # 27자
+        ("01BX5ZZKBKACTAV9WEVGEMMVRI", False),  # I는 Crockford base32에 없음
+        ("01BX5ZZKBKACTAV9WEVGEMMVRU", False),
+        ("01bx5zzkbkactav9wevgemmvry", False),  # 기존 구현과 같이 대문자만 허용
+        ("01BX5ZZKBKACTAV9WEVGEMMVR가", False),
+        ("", False),
+        (None, False),
+        (12345, False),
+    ],
+)
+def test_is_valid_ulid_matches_py_ulid_rules(value, expected):
+    assert is_valid_ulid(value) is expected
+
+
+def test_encode_and_decode_match_py_ulid():
+    for timestamp_ms, randomness in [(0, 0), (1508808576371, 392928161897179156999966), (2**48 - 1, 2**80 - 1)]:
+        encoded = encode_ulid(timestamp_ms, randomness)
+        assert encoded == ULID().encode((timestamp_ms << 80) | randomness)
+        assert decode_ulid(encoded) == (timestamp_ms, randomness)
+
+    assert decode_ulid(generate_ulid(1_700_000_000_000))[0] == 1_700_000_000_000
+    with pytest.raises(ValueError):
+        generate_ulid(2**48)
+    with pytest.raises(ValueError):
+        decode_ulid("not-a-ulid")
+
+
+def test_generated_ulids_are_monotonic_within_a_millisecond():
+    ids = [generate_ulid() for _ in range(2000)] + generate_many(5000)
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert all(is_valid_ulid(value) for value in ids)
+    assert generate_many(0) == []
+
+
+def test_random_overflow_carries_into_next_millisecond(monkeypatch):
+    generator = MonotonicUlidGenerator()
+    monkeypatch.setattr("app.core.ulid.time.time_ns", lambda: 1_700_000_000_000 * 1_000_000)
+    first = generator.generate()
+    generator._last_random = 2**80 - 2
+
+    ids = generator.generate_many(3)
+
+    assert [first, *ids] == sorted([first, *ids])
+    assert decode_ulid(ids[0]) == (1_700_000_000_000, 2**80 - 1)
+    assert decode_ulid(ids[1])[0] == 1_700_000_000_001
+
+
+def test_concurrent_generation_has_no_duplicates():
+    generator = MonotonicUlidGenerator()
+    results = []
+
+    def worker():
+        results.extend(generator.generate_many(500) + [generator.generate() for _ in range(500)])
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(results)) == 8 * 1000
@@ -0,0 +1,121 @@
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core import csv_import, csv_shards
+from app.core.csv_import import get_import_status
+from app.core.csv_shards import ShardedCatalogSync
+from app.core.csv_sync import read_catalog_version
+from app.core.database import Base
+from app.core.ulid import generate_ulid
+from app.models import Quiz
+
+HEADER = "id,question,explanation,answer,category\n"
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def csv_directory(tmp_path):
+    directory = tmp_path / "csv_files"
+    directory.mkdir()
+    return directory
+
+
+def _write_csv(path, rows):
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        file.write(HEADER)
+        file.writelines(row + "\n" for row in rows)
+
+
+def _syncer(directory, session_factory, **kwargs):
+    return ShardedCatalogSync(str(directory), session_factory, parse_workers=1, **kwargs)
+
+
+def test_import_commits_in_chunks_and_reports_row_errors(csv_directory, session_factory):
+    path = csv_directory / "quiz.csv"
+    good = [f"{generate_ulid()},q{i},e,a{i},Java" for i in range(25)]
+    _write_csv(path, good[:10] + ["bad-id,q,e,a,Java", "too,short"] + good[10:])
+
+    report = _syncer(csv_directory, session_factory, chunk_size=10, max_errors=1).sync()
+
+    assert report.status == "completed"
+    assert (report.rows_read, report.inserted, report.chunks_committed) == (25, 25, 3)
+    assert report.error_count == 2
+    assert [(e.row, e.reason) for e in report.errors] == [(12, "잘못된 ULID")]
+
+    status = get_import_status()
+    assert status["status"] == "completed" and status["rows_read"] == 25
+    assert status["rows_per_second"] > 0
+
+    with session_factory() as session:
+        assert session.scalar(select(func.count()).select_from(Quiz)) == 25
+        assert read_catalog_version(session) == 1
+
+    # 새로 시작한 프로세스처럼 상태 없이 다시 읽으면 차이가 없음
+    again = _syncer(csv_directory, session_factory, chunk_size=10).sync()
+    assert (again.inserted, again.updated, again.unchanged) == (0, 0, 25)
+
+
+def test_delete_missing_removes_rows_absent_from_csv(csv_directory, session_factory):
+    path = csv_directory / "quiz.csv"
+    rows = [f"{generate_ulid()},q{i},e,a,Java" for i in range(6)]
+    _write_csv(path, rows)
+    syncer = _syncer(csv_directory, session_factory, chunk_size=4)
+    syncer.sync(delete_missing=True)
+
+    _write_csv(path, rows[:2])
+    report = syncer.sync(delete_missing=True)
+
+    assert (report.unchanged, report.deleted) == (2, 4)
+
+
+def test_failure_keeps_committed_chunks(csv_directory, session_factory, monkeypatch):
+    _write_csv(csv_directory / "quiz.csv", [f"{generate_ulid()},q{i},e,a,Java" for i in range(10)])
+    original = csv_import.sync_quizzes
+    calls = []
+
+    def failing_second_chunk(session, chunk, **kwargs):
+        calls.append(len(chunk))
+        if len(calls) == 2:
+            raise RuntimeError("boom")
+        return original(session, chunk, **kwargs)
+
+    monkeypatch.setattr(csv_import, "sync_quizzes", failing_second_chunk)
+    report = _syncer(csv_directory, session_factory, chunk_size=4).sync()
+
+    assert report.status == "failed" and report.failure == "boom"
+    with session_factory() as session:
+        assert session.scalar(select(func.count()).select_from(Quiz)) == 4
+        # 커밋된 청크가 있으므로 팔로워가 다시 읽도록 버전은 올라가 있어야 함
+        assert read_catalog_version(session) == 1
+
+
+def test_rows_are_streamed_one_chunk_at_a_time(csv_directory, session_factory, monkeypatch):
+    _write_csv(csv_directory / "quiz.csv", (f"{generate_ulid()},q{i},e,a,Java" for i in range(2500)))
+    yielded = []
+    read_ahead = []
+    original_iter = csv_shards.iter_quiz_csv
+    original_sync = csv_import.sync_quizzes
+
+    def counting_iter(*args, **kwargs):
+        for record in original_iter(*args, **kwargs):
+            yielded.append(record.id)
+            yield record
+
+    def recording_sync(session, chunk, **kwargs):
+        read_ahead.append(len(yielded))
+        return original_sync(session, chunk, **kwargs)
+
+    monkeypatch.setattr(csv_shards, "iter_quiz_csv", counting_iter)
+    monkeypatch.setattr(csv_import, "sync_quizzes", recording_sync)
+    report = _syncer(csv_directory, session_factory, chunk_size=1000).sync()
+
+    assert report.rows_read == 2500
+    # 각 청크를 반영하는 시점까지 읽은 행은 그 청크까지의 분량뿐
+    assert read_ahead == [1000, 2000, 2500]
@@ -0,0 +1,118 @@
+import threading
+import time
+
+from watchdog.events import FileCreatedEvent, FileDeletedEvent, FileModifiedEvent, FileMovedEvent
+
+from app.core import csv_listener
+from app.core.csv_listener import CatalogVersionPoller, CsvFileListener, CsvReloadWorker
+from app.core.leader_lock import LeaderLock
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_worker_debounces_bursts_into_one_reload():
+    calls = []
+    worker = CsvReloadWorker(0.1, reload=lambda: calls.append("reload"))
+    worker.start()
+    try:
+        for _ in range(5):
+            worker.schedule("/tmp/quiz_data.csv")
+            time.sleep(0.02)
+        assert _wait_for(lambda: calls)
+        time.sleep(0.15)
+    finally:
+        worker.stop()
+
+    assert calls == ["reload"]
+
+
+def test_worker_never_runs_reloads_concurrently():
+    active = []
+    overlaps = []
+    lock = threading.Lock()
+
+    def slow_reload():
+        with lock:
+            active.append(True)
+            overlaps.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+
+    worker = CsvReloadWorker(0, reload=slow_reload)
+    worker.start()
+    try:
+        for name in ("a.csv", "b.csv", "c.csv"):
+            worker.schedule(name)
+        assert _wait_for(lambda: len(overlaps) == 3)
+    finally:
+        worker.stop()
+
+    assert max(overlaps) == 1
+
+
+def test_listener_schedules_directory_for_csv_events(tmp_path):
+    target = tmp_path / "java.csv"
+    scheduled = []
+    worker = type("Worker", (), {"schedule": lambda self, path: scheduled.append(path)})()
+    listener = CsvFileListener(str(tmp_path), worker)
+
+    listener.on_modified(FileModifiedEvent(str(target)))
+    listener.on_created(FileCreatedEvent(str(tmp_path / "corp.csv")))
+    listener.on_deleted(FileDeletedEvent(str(tmp_path / "old.csv")))
+    listener.on_moved(FileMovedEvent(str(tmp_path / ".java.csv.tmp"), str(target)))
+    listener.on_modified(FileModifiedEvent(str(tmp_path / "notes.txt")))
+    listener.on_modified(FileModifiedEvent(str(tmp_path / "sub" / "java.csv")))
+
+    assert scheduled == [str(tmp_path)] * 4
+
+
+def test_only_one_leader_lock_holder(tmp_path):
+    lock_path = str(tmp_path / "csv_listener.lock")
+    first = LeaderLock(lock_path)
+    second = LeaderLock(lock_path)
+
+    assert first.acquire() is True
+    assert second.acquire() is False
+
+    first.release()
+    assert second.acquire() is True
+    second.release()
+
+
+def test_follower_reloads_catalog_when_version_changes(tmp_path, monkeypatch):
+    versions = iter([1, 1, 2])
+    reloads = []
+    monkeypatch.setattr(csv_listener, "load_quiz_catalog", lambda: reloads.append(True))
+
+    poller = CatalogVersionPoller(60, LeaderLock(str(tmp_path / "lock")), on_leader=lambda: None)
+    monkeypatch.setattr(poller, "_read_version", lambda: next(versions))
+    poller._seen_version = poller._read_version()
+
+    assert poller.poll_once() is False
+    assert poller.poll_once() is True
+    assert reloads == [True]
+
+
+def test_follower_takes_over_when_leader_lock_is_released(tmp_path):
+    lock_path = str(tmp_path / "csv_listener.lock")
+    leader = LeaderLock(lock_path)
+    assert leader.acquire()
+
+    promoted = threading.Event()
+    poller = CatalogVersionPoller(0.02, LeaderLock(lock_path), on_leader=promoted.set)
+    poller.start()
+    try:
+        time.sleep(0.1)
+        assert not promoted.is_set()
+        leader.release()
+        assert promoted.wait(2)
+    finally:
+        poller.stop()
@@ -0,0 +1,120 @@
+import pickle
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core import csv_shards
+from app.core.csv_shards import ShardedCatalogSync, list_csv_shards
+from app.core.database import Base
+from app.core.ulid import generate_ulid
+from app.models import Quiz
+
+HEADER = "id,question,explanation,answer,category\n"
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'shards.db'}")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def _write_shard(path, category, ids, answer="a"):
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        file.write(HEADER)
+        file.writelines(f"{quiz_id},{category} q{i},e,{answer},{category}\n" for i, quiz_id in enumerate(ids))
+
+
+def _ids(count):
+    return [generate_ulid() for _ in range(count)]
+
+
+def _stored_ids(session_factory):
+    with session_factory() as session:
+        return set(session.scalars(select(Quiz.id)))
+
+
+def test_only_changed_shards_are_parsed(tmp_path, session_factory, monkeypatch):
+    directory = tmp_path / "csv_files"
+    directory.mkdir()
+    java_ids, corp_ids = _ids(3), _ids(2)
+    _write_shard(directory / "java.csv", "Java", java_ids)
+    _write_shard(directory / "corp.csv", "Corp", corp_ids)
+    (directory / "notes.txt").write_text("ignored", encoding="utf-8")
+    assert [p.rsplit("/", 1)[-1] for p in list_csv_shards(str(directory))] == ["corp.csv", "java.csv"]
+
+    parsed = []
+    original = csv_shards.iter_quiz_csv
+    monkeypatch.setattr(csv_shards, "iter_quiz_csv", lambda path, **kw: parsed.append(path) or original(path, **kw))
+    syncer = ShardedCatalogSync(str(directory), session_factory, parse_workers=1)
+
+    first = syncer.sync()
+    assert (first.inserted, first.status) == (5, "completed")
+    assert len(parsed) == 2
+
+    assert syncer.sync() is None  # 내용이 같으면 아무것도 읽지 않음
+    assert len(parsed) == 2
+
+    _write_shard(directory / "java.csv", "Java", java_ids, answer="b")
+    second = syncer.sync()
+    assert (second.updated, second.unchanged) == (3, 0)
+    assert parsed[-1].endswith("java.csv") and len(parsed) == 3
+
+
+def test_changed_shards_are_parsed_in_worker_processes(tmp_path, session_factory):
+    directory = tmp_path / "csv_files"
+    directory.mkdir()
+    _write_shard(directory / "java.csv", "Java", _ids(3))
+    _write_shard(directory / "corp.csv", "Corp", _ids(4))
+    with open(directory / "corp.csv", "a", encoding="utf-8") as file:
+        file.write("bad-id,q,e,a,Corp\n")
+
+    report = ShardedCatalogSync(str(directory), session_factory, parse_workers=2).sync()
+
+    assert (report.status, report.inserted) == ("completed", 7)
+    assert [(e.source, e.row) for e in report.errors] == [("corp.csv", 6)]
+    assert len(_stored_ids(session_factory)) == 7
+
+
+def test_delete_missing_is_tracked_per_shard(tmp_path, session_factory):
+    directory = tmp_path / "csv_files"
+    directory.mkdir()
+    java_ids, corp_ids = _ids(3), _ids(2)
+    _write_shard(directory / "java.csv", "Java", java_ids)
+    _write_shard(directory / "corp.csv", "Corp", corp_ids)
+    syncer = ShardedCatalogSync(str(directory), session_factory, parse_workers=1)
+    syncer.sync(delete_missing=True)
+
+    # java 샤드에서 1건 제거 + 1건을 corp 샤드로 이동
+    _write_shard(directory / "java.csv", "Java", java_ids[:1])
+    _write_shard(directory / "corp.csv", "Corp", corp_ids + java_ids[2:])
+    report = syncer.sync(delete_missing=True)
+    assert report.deleted == 1
+    assert _stored_ids(session_factory) == {java_ids[0], java_ids[2], *corp_ids}
+
+    (directory / "corp.csv").unlink()
+    removed = syncer.sync(delete_missing=True)
+    assert removed.deleted == 3
+    assert _stored_ids(session_factory) == {java_ids[0]}
+
+
+def test_worker_parse_results_are_spooled_in_bounded_chunks(tmp_path):
+    shard = tmp_path / "java.csv"
+    _write_shard(shard, "Java", _ids(5))
+    with open(shard, "a", encoding="utf-8") as file:
+        file.write("bad-1,q,e,a,Java\nbad-2,q,e,a,Java\n")
+
+    chunk_path = str(tmp_path / "java.chunks")
+    parsed = csv_shards.parse_shard(str(shard), chunk_path, chunk_size=2, max_errors=1)
+
+    assert (parsed.error_count, [e.row for e in parsed.errors]) == (2, [7])
+    with open(chunk_path, "rb") as file:
+        chunk_sizes = []
+        while True:
+            try:
+                chunk_sizes.append(len(pickle.load(file)))
+            except EOFError:
+                break
+    assert chunk_sizes == [2, 2, 1]
+    assert len(list(csv_shards.read_shard_chunks(chunk_path))) == 5
@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
+
+from app.core.csv_sync import (
+    QuizRecord,
+    RowError,
+    bump_catalog_version,
+    iter_quiz_csv,
+    read_catalog_version,
+    sync_quizzes,
+)
+from app.core.database import Base
+from app.models import Quiz
+
+IDS = [
+    "01KH2YQ2VEAAW3HHBQ684D48ZE",
+    "01KH2YQ2VEVWWGM0VHMJCP4YMC",
+    "01KH2YQ2VETJYKN87HM450CK5M",
+]
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        yield db
+
+
+def _records(answer_suffix=""):
+    return [QuizRecord(quiz_id, f"q{i}", "-", f"a{i}{answer_suffix}", "Java") for i, quiz_id in enumerate(IDS)]
+
+
+def _count_statements(db):
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_sync_reports_inserts_updates_and_skips_unchanged_rows(session):
+    first = sync_quizzes(session, _records())
+    session.commit()
+    assert (first.inserted, first.updated, first.unchanged) == (3, 0, 0)
+
+    statements = _count_statements(session)
+    unchanged = sync_quizzes(session, _records())
+    assert unchanged.to_dict() == {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 3}
+    assert len(statements) == 1  # (id, 내용) 조회 한 번뿐
+
+    changed = _records()
+    changed[1] = changed[1]._replace(answer="new")
+    result = sync_quizzes(session, changed)
+    session.commit()
+    assert (result.updated, result.unchanged) == (1, 2)
+    assert session.get(Quiz, IDS[1]).answer == "new"
+
+
+def test_missing_rows_are_deleted_only_when_requested(session):
+    sync_quizzes(session, _records())
+    session.commit()
+
+    kept = sync_quizzes(session, _records()[:1])
+    assert kept.deleted == 0
+
+    removed = sync_quizzes(session, _records()[:1], delete_missing=True)
+    session.commit()
+    assert removed.deleted == 2
+    assert session.scalars(select(Quiz.id)).all() == [IDS[0]]
+
+
+def test_iter_quiz_csv_reports_invalid_rows(tmp_path):
+    path = tmp_path / "quiz.csv"
+    path.write_text(
+        f"id,question,explanation,answer,category\n{IDS[0]},q,e,a,Java\n\nnot-a-ulid,q,e,a,Java\n{IDS[1]},short\n",
+        encoding="utf-8-sig",
+    )
+
+    errors = []
+    assert list(iter_quiz_csv(str(path), on_error=errors.append)) == [QuizRecord(IDS[0], "q", "e", "a", "Java")]
+    assert errors == [RowError(4, "잘못된 ULID", "not-a-ulid"), RowError(5, "컬럼 수 부족", f"{IDS[1]},short")]
+
+    path.write_text("id,question\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_quiz_csv(str(path)))
+
+
+def test_catalog_version_row_is_created_and_bumped(session):
+    assert read_catalog_version(session) == 0
+
+    bump_catalog_version(session)
+    bump_catalog_version(session)
+    session.commit()
+
+    assert read_catalog_version(session) == 2
@@ -0,0 +1,98 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import exc, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+
+from app.core import database
+from app.core.database import Base, RoutingSession, build_engine, get_pool_metrics
+from app.core.pool_metrics import MeteredQueuePool, pool_stats
+from app.core.sqlite_profile import WRITER
+from app.core.ulid import generate_ulid
+from app.models import Quiz, Score, User
+from app.modules.quiz.repository import QuizRepository
+from app.modules.ranking.repository import RankingRepository
+
+
+@pytest.fixture
+def primary_and_replica(tmp_path):
+    primary = build_engine("test_primary", f"sqlite:///{tmp_path / 'primary.db'}", WRITER)
+    replica = build_engine("test_replica", f"sqlite:///{tmp_path / 'replica.db'}", WRITER)
+    for engine in (primary, replica):
+        Base.metadata.create_all(engine)
+    yield primary, replica
+    for name, engine in (("test_primary", primary), ("test_replica", replica)):
+        database._engines.pop(name, None)
+        engine.dispose()
+
+
+def _quiz(question):
+    return {"id": generate_ulid(), "question": question, "explanation": "e", "answer": "a", "category": "Java"}
+
+
+def test_marked_reads_use_replica_and_writes_use_primary(primary_and_replica):
+    primary, replica = primary_and_replica
+    user_id = generate_ulid()
+    with replica.begin() as conn:
+        conn.execute(insert(Quiz).values(_quiz("replica")))
+        conn.execute(insert(User).values(id=user_id, username="kim", email="k@x.io", hashed_password="h"))
+        conn.execute(insert(Score).values(id=generate_ulid(), user_id=user_id, category="Java", score=90))
+    with primary.begin() as conn:
+        conn.execute(insert(Quiz).values(_quiz("primary")))
+        conn.execute(insert(User).values(id=user_id, username="kim", email="k@x.io", hashed_password="h"))
+
+    factory = sessionmaker(bind=primary, class_=RoutingSession, info={"replica_bind": replica})
+    with factory() as session:
+        repo = QuizRepository(session)
+        assert [row["question"] for row in repo.fetch_quizzes()] == ["replica"]
+        assert repo.fetch_categories() == ["Java"]
+        # 카탈로그 적재와 일반 ORM 조회는 primary
+        assert [row["question"] for row in repo.fetch_all_quizzes()] == ["primary"]
+        assert session.scalars(select(Quiz.question)).all() == ["primary"]
+        assert [row["score"] for row in RankingRepository(session).fetch_ranking("Java")] == [90]
+
+        assert repo.upsert_score(user_id, "Java", 70).action == "insert"
+
+    with primary.connect() as conn:
+        assert conn.execute(select(Score.score)).scalars().all() == [70]
+    with replica.connect() as conn:
+        assert conn.execute(select(Score.score)).scalars().all() == [90]
+
+
+def test_pool_metrics_report_checkouts_and_wait_timeouts(primary_and_replica):
+    primary, _ = primary_and_replica
+    with primary.connect():
+        pass
+    metrics = get_pool_metrics()
+    assert metrics["test_primary"]["checkouts"] >= 1
+    assert metrics["test_primary"]["size"] == 1  # SQLite 프로필: 쓰기 연결 1개
+    assert "primary" in metrics
+
+    pool = MeteredQueuePool(lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=0, timeout=0.05)
+    held = pool.connect()
+    with pytest.raises(exc.TimeoutError):
+        pool.connect()
+    stats = pool_stats(pool)
+    assert (stats["checked_out"], stats["timeouts"]) == (1, 1)
+    assert stats["wait_ms_max"] >= 40
+    held.close()
+
+
+def test_in_memory_sqlite_keeps_dialect_default_pool():
+    engine = build_engine("test_memory", "sqlite://", WRITER)
+    async_engine = database.build_async_engine("test_memory_async", "sqlite+aiosqlite://", WRITER)
+    try:
+        assert isinstance(engine.pool, SingletonThreadPool)
+        assert isinstance(async_engine.pool, StaticPool)
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(insert(Quiz).values(_quiz("memory")))
+        # 다음 연결도 같은 메모리 DB를 봐야 함
+        with engine.connect() as conn:
+            assert conn.execute(select(Quiz.question)).scalars().all() == ["memory"]
+        assert get_pool_metrics()["test_memory"] == {"pool": "SingletonThreadPool"}
+    finally:
+        database._engines.pop("test_memory", None)
+        database._engines.pop("test_memory_async", None)
+        engine.dispose()
@@ -0,0 +1,135 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+
+import pytest
+
+from app.core.http_pool import HttpConnectionLostError, HttpTransportError, KeepAliveHttpClient
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    received: ClassVar[list] = []
+
+    def do_GET(self):
+        self.do_POST()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        StubHandler.received.append((self.command, self.path))
+        if self.path == "/drop":
+            # 요청을 읽은 뒤 응답 없이 연결을 닫음
+            self.close_connection = True
+            return
+        if self.path == "/slow":
+            time.sleep(0.5)
+        status = 500 if self.path == "/error" else 200
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.path == "/idle-close":
+            # Connection: close 없이 닫음 (keep-alive 만료 흉내)
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    StubHandler.received = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_reuses_connection_for_same_host(stub_server):
+    client = KeepAliveHttpClient(pool_size=2)
+
+    for index in range(5):
+        response = client.request("POST", f"{stub_server}/echo", body=f"#{index}".encode())
+        assert response == (200, f"#{index}".encode())
+
+    stats = client.stats()
+    client.close()
+    assert stats["connections_created"] == 1
+    assert stats["requests"] == 5
+    assert stats["idle_connections"] == 1
+
+
+def test_error_status_is_returned_not_raised(stub_server):
+    client = KeepAliveHttpClient()
+
+    response = client.request("POST", f"{stub_server}/error", body=b"boom")
+
+    client.close()
+    assert response.status == 500
+    assert response.body == b"boom"
+
+
+def test_read_timeout_raises_transport_error(stub_server):
+    client = KeepAliveHttpClient(read_timeout=0.1)
+
+    with pytest.raises(HttpTransportError, match="timed out"):
+        client.request("POST", f"{stub_server}/slow", body=b"")
+
+    client.close()
+
+
+def test_per_request_timeout_overrides_read_timeout(stub_server):
+    client = KeepAliveHttpClient(read_timeout=30)
+
+    with pytest.raises(HttpTransportError, match="timed out"):
+        client.request("POST", f"{stub_server}/slow", body=b"", timeout=0.1)
+
+    client.close()
+
+
+def test_connect_failure_raises_transport_error():
+    client = KeepAliveHttpClient(connect_timeout=0.5)
+
+    with pytest.raises(HttpTransportError):
+        client.request("POST", "http://127.0.0.1:1/unreachable", body=b"")
+
+
+def test_connection_closed_while_idle_is_replaced_before_sending(stub_server):
+    client = KeepAliveHttpClient()
+    client.request("POST", f"{stub_server}/idle-close", body=b"a")
+    time.sleep(0.1)
+
+    response = client.request("POST", f"{stub_server}/echo", body=b"b")
+
+    stats = client.stats()
+    client.close()
+    assert response == (200, b"b")
+    assert stats["connections_created"] == 2
+    assert len(StubHandler.received) == 2
+
+
+def test_post_is_not_resent_when_reused_connection_drops_before_response(stub_server):
+    client = KeepAliveHttpClient()
+    client.request("POST", f"{stub_server}/echo", body=b"a")
+
+    with pytest.raises(HttpConnectionLostError):
+        client.request("POST", f"{stub_server}/drop", body=b"b")
+
+    client.close()
+    assert StubHandler.received == [("POST", "/echo"), ("POST", "/drop")]
+
+
+def test_idempotent_request_is_resent_once_on_new_connection(stub_server):
+    client = KeepAliveHttpClient()
+    client.request("GET", f"{stub_server}/echo")
+
+    with pytest.raises(HttpTransportError):
+        client.request("GET", f"{stub_server}/drop")
+
+    client.close()
+    assert StubHandler.received == [("GET", "/echo"), ("GET", "/drop"), ("GET", "/drop")]
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.cache import LRUCache
+from app.core.config import config
+from app.core.database import SessionLocal
+from app.core.http_pool import HttpResponse
+from app.models import Score, User
+from app.modules.notification_test import bulk as bulk_module
+from app.modules.notification_test import service as notification_service
+from app.modules.notification_test.bulk import BulkNotificationSender
+from app.modules.notification_test.router import get_optional_current_user
+from app.modules.notification_test.schemas import NotificationProxyResult
+from app.modules.notification_test.service import NotificationProxyError
+from main import app
+
+
+class FakeAsyncProxyService:
+    def __init__(self, failing_user_ids=()):
+        self.failing_user_ids = set(failing_user_ids)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send_user_message(self, user_id, template_code):
+        self.calls.append(user_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if user_id in self.failing_user_ids:
+            raise NotificationProxyError("notification-be returned an error response.", status_code=500)
+        return NotificationProxyResult(status_code=200, body=None)
+
+
+def _collect(sender, user_ids, template_code="TPL-1", concurrency=2):
+    async def scenario():
+        return [result async for result in sender.fan_out(user_ids, template_code, concurrency)]
+
+    return asyncio.run(scenario())
+
+
+def test_fan_out_limits_concurrency_and_reports_each_recipient():
+    proxy = FakeAsyncProxyService(failing_user_ids={"u3"})
+    sender = BulkNotificationSender(proxy, LRUCache(max_size=100, ttl_seconds=60))
+
+    results = _collect(sender, ["u1", "u2", "u3", "u1", "", "u5"], concurrency=2)
+
+    by_status = {}
+    for result in results[:-1]:
+        by_status.setdefault(result["status"], []).append(result["user_id"])
+    assert proxy.max_in_flight == 2
+    assert sorted(by_status["sent"]) == ["u1", "u2", "u5"]
+    assert by_status["failed"] == ["u3"]
+    assert by_status["duplicate"] == ["u1"]
+    assert by_status["invalid"] == [""]
+    assert results[-1] == {
+        "summary": {"template_code": "TPL-1", "total": 6, "sent": 3, "failed": 1, "duplicate": 1, "invalid": 1}
+    }
+
+
+def test_dedup_window_applies_across_requests_but_not_to_failures():
+    proxy = FakeAsyncProxyService(failing_user_ids={"u2"})
+    sender = BulkNotificationSender(proxy, LRUCache(max_size=100, ttl_seconds=60))
+
+    _collect(sender, ["u1", "u2"])
+    second = _collect(sender, ["u1", "u2"])
+    other_template = _collect(sender, ["u1"], template_code="TPL-2")
+
+    assert {result["user_id"]: result["status"] for result in second[:-1]} == {"u1": "duplicate", "u2": "failed"}
+    assert other_template[0]["status"] == "sent"
+    assert proxy.calls.count("u2") == 2
+
+
+@pytest.fixture
+def bulk_client(monkeypatch):
+    monkeypatch.setattr(config, "FCM_TEST_PROXY_ENABLED", True)
+    monkeypatch.setattr(config, "FCM_TEST_BULK_ALLOWED_USERS", ["quizuser"])
+    monkeypatch.setattr(bulk_module, "recent_sends", LRUCache(max_size=100, ttl_seconds=60))
+    current_user = type("FakeUser", (), {"username": "quizuser"})()
+    app.dependency_overrides[get_optional_current_user] = lambda: current_user
+    sent = []
+
+    class FakeHttpClient:
+        def request(self, method, url, body=None, headers=None, timeout=None):
+            sent.append(json.loads(body)["user_id"])
+            return HttpResponse(200, b'{"success_count":1}')
+
+    monkeypatch.setattr(notification_service, "get_http_client", lambda: FakeHttpClient())
+    yield TestClient(app), sent
+    app.dependency_overrides.pop(get_optional_current_user, None)
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+def test_send_bulk_route_streams_ndjson_results(bulk_client):
+    client, sent = bulk_client
+
+    response = client.post("/fcm-test/send-bulk", json={"user_ids": ["a1", "a2", "a1"], "template_code": "TPL-1"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = _lines(response)
+    assert sorted(sent) == ["a1", "a2"]
+    assert lines[-1]["summary"]["sent"] == 2
+    assert lines[-1]["summary"]["duplicate"] == 1
+
+
+def test_send_bulk_route_targets_users_with_score_in_category(bulk_client):
+    client, sent = bulk_client
+    category = f"bulk-{uuid.uuid4().hex[:8]}"
+    usernames = [f"b{uuid.uuid4().hex[:8]}" for _ in range(3)]
+    with SessionLocal() as session:
+        for index, username in enumerate(usernames):
+            user = User(username=username, email=f"{username}@example.com", hashed_password="x")
+            session.add(user)
+            session.flush()
+            session.add(Score(user_id=user.id, category=category, score=index * 50))
+        session.commit()
+
+    response = client.post(
+        "/fcm-test/send-bulk",
+        json={"score_category": category, "min_score": 50, "template_code": "TPL-1", "concurrency": 3},
+    )
+
+    assert response.status_code == 200
+    assert sorted(sent) == sorted(usernames[1:])
+    assert _lines(response)[-1]["summary"]["total"] == 2
+
+
+def test_send_bulk_route_requires_exactly_one_target(bulk_client):
+    client, _ = bulk_client
+
+    both = client.post("/fcm-test/send-bulk", json={"user_ids": ["a1"], "score_category": "Java"})
+    neither = client.post("/fcm-test/send-bulk", json={"template_code": "TPL-1"})
+
+    assert (both.status_code, neither.status_code) == (400, 400)
+
+
+def test_send_bulk_route_is_limited_to_allowed_users(bulk_client, monkeypatch):
+    client, sent = bulk_client
+    monkeypatch.setattr(config, "FCM_TEST_BULK_ALLOWED_USERS", ["operator"])
+
+    response = client.post("/fcm-test/send-bulk", json={"user_ids": ["a1"], "template_code": "TPL-1"})
+
+    assert response.status_code == 403
+    assert sent == []
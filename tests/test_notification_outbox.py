@@ -0,0 +1,200 @@
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import config
+from app.core.database import Base
+from app.modules.notification_test.outbox import (
+    NotificationOutboxDispatcher,
+    NotificationOutboxService,
+    backoff_seconds,
+    get_outbox_proxy_service,
+    utcnow,
+)
+from app.modules.notification_test.repository import NotificationOutboxRepository
+from app.modules.notification_test.router import get_optional_current_user
+from app.modules.notification_test.schemas import NotificationProxyResult
+from app.modules.notification_test.service import NotificationProxyError
+from main import app
+
+
+class FakeProxyService:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def send_user_message(self, user_id, template_code):
+        return self._next(("user", user_id, template_code))
+
+    def send_definition_message(self, definition_code, template_code):
+        return self._next(("definition", definition_code, template_code))
+
+    def _next(self, call):
+        self.calls.append(call)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return sessionmaker(engine, expire_on_commit=False)
+
+
+def _dispatcher(session_factory, proxy, max_attempts=3):
+    return NotificationOutboxDispatcher(
+        session_factory,
+        lambda: proxy,
+        batch_size=10,
+        poll_seconds=60,
+        max_attempts=max_attempts,
+        backoff_base_seconds=2,
+        backoff_max_seconds=10,
+        lease_seconds=30,
+    )
+
+
+def _enqueue_user_message(session_factory, user_id="quizuser"):
+    with session_factory() as db:
+        return NotificationOutboxService(NotificationOutboxRepository(db)).enqueue_user_message(user_id, "TPL-1")
+
+
+def _load(session_factory, outbox_id):
+    with session_factory() as db:
+        return NotificationOutboxRepository(db).get(outbox_id)
+
+
+def _make_due(session_factory, outbox_id):
+    with session_factory() as db:
+        entry = NotificationOutboxRepository(db).get(outbox_id)
+        entry.next_attempt_at = utcnow() - timedelta(seconds=1)
+        db.commit()
+
+
+def test_backoff_doubles_and_is_capped():
+    assert [backoff_seconds(attempt, 2, 10) for attempt in (1, 2, 3, 4)] == [2, 4, 8, 10]
+
+
+def test_dispatcher_proxy_does_not_retry_inside_an_attempt(monkeypatch):
+    monkeypatch.setattr(config, "TVCF_NOTIFICATION_MAX_RETRIES", 3)
+    # outbox 백오프가 유일한 재시도 계층
+    assert get_outbox_proxy_service().max_retries == 0
+
+
+def test_dispatcher_delivers_pending_entries(session_factory):
+    entry = _enqueue_user_message(session_factory)
+    proxy = FakeProxyService([NotificationProxyResult(status_code=200, body={"success_count": 1})])
+    dispatcher = _dispatcher(session_factory, proxy)
+
+    assert dispatcher.run_once() == 1
+    assert dispatcher.run_once() == 0
+
+    saved = _load(session_factory, entry.id)
+    assert proxy.calls == [("user", "quizuser", "TPL-1")]
+    assert (saved.status, saved.attempts, saved.last_status_code) == ("delivered", 1, 200)
+    assert saved.delivered_at is not None
+    assert dispatcher.stats()["delivered"] == 1
+
+
+def test_transient_failures_back_off_then_dead_letter(session_factory):
+    entry = _enqueue_user_message(session_factory)
+    proxy = FakeProxyService([NotificationProxyError("notification-be request failed: timed out")] * 2)
+    dispatcher = _dispatcher(session_factory, proxy, max_attempts=2)
+
+    before = utcnow()
+    dispatcher.run_once()
+    saved = _load(session_factory, entry.id)
+    assert (saved.status, saved.attempts) == ("pending", 1)
+    assert saved.next_attempt_at >= before + timedelta(seconds=2)
+    assert dispatcher.run_once() == 0  # 재시도 시간 전에는 꺼내지 않음
+
+    _make_due(session_factory, entry.id)
+    dispatcher.run_once()
+    saved = _load(session_factory, entry.id)
+    assert (saved.status, saved.attempts) == ("dead", 2)
+    assert "timed out" in saved.last_error
+    assert (dispatcher.stats()["retried"], dispatcher.stats()["dead"]) == (1, 1)
+
+
+def test_non_retryable_client_error_is_dead_lettered_immediately(session_factory):
+    entry = _enqueue_user_message(session_factory)
+    proxy = FakeProxyService([NotificationProxyError("bad request", status_code=400, body={"detail": "bad"})])
+
+    _dispatcher(session_factory, proxy).run_once()
+
+    saved = _load(session_factory, entry.id)
+    assert (saved.status, saved.attempts, saved.last_status_code) == ("dead", 1, 400)
+
+
+def test_claim_leases_rows_until_the_lease_expires(session_factory):
+    entry = _enqueue_user_message(session_factory)
+    now = utcnow()
+
+    with session_factory() as db:
+        repo = NotificationOutboxRepository(db)
+        assert repo.claim_next(now, lease_seconds=30).id == entry.id
+        assert repo.claim_next(now, lease_seconds=30) is None
+        # 발송 중 프로세스가 중단되어 점유가 만료되면 다시 꺼냄
+        reclaimed = repo.claim_next(now + timedelta(seconds=31), lease_seconds=30)
+        assert (reclaimed.id, reclaimed.attempts) == (entry.id, 2)
+        assert repo.count_by_status()["sending"] == 1
+
+
+def test_expired_lease_holder_cannot_overwrite_the_new_claim(session_factory):
+    entry = _enqueue_user_message(session_factory)
+    now = utcnow()
+
+    with session_factory() as first_db, session_factory() as second_db:
+        first_repo = NotificationOutboxRepository(first_db)
+        second_repo = NotificationOutboxRepository(second_db)
+        stale = first_repo.claim_next(now, lease_seconds=30)
+        current = second_repo.claim_next(now + timedelta(seconds=31), lease_seconds=30)
+        assert stale.lease_token != current.lease_token
+
+        assert first_repo.mark_failed(stale, None, "timed out", retry_at=now) is False
+        assert first_repo.mark_delivered(stale, 200, now) is False
+        assert _load(session_factory, entry.id).status == "sending"
+
+        assert second_repo.mark_delivered(current, 200, now) is True
+        assert second_repo.defer(current, "late", now) is False
+
+    saved = _load(session_factory, entry.id)
+    assert (saved.status, saved.attempts, saved.lease_token) == ("delivered", 2, None)
+
+
+def test_outbox_routes_enqueue_and_report_status():
+    original_enabled = config.FCM_TEST_PROXY_ENABLED
+    config.FCM_TEST_PROXY_ENABLED = True
+    current_user = type("FakeUser", (), {"username": "quizuser"})()
+    app.dependency_overrides[get_optional_current_user] = lambda: current_user
+    client = TestClient(app)
+    try:
+        response = client.post("/fcm-test/outbox/send", json={"template_code": "TPL-1"})
+        assert response.status_code == 202
+        entry = response.json()["entry"]
+        assert (entry["status"], entry["user_id"], entry["attempts"]) == ("pending", "quizuser", 0)
+
+        status_response = client.get(f"/fcm-test/outbox/{entry['id']}")
+        assert status_response.status_code == 200
+        assert status_response.json()["status"] == "pending"
+
+        list_response = client.get("/fcm-test/outbox", params={"status": "pending"})
+        assert entry["id"] in [item["id"] for item in list_response.json()["entries"]]
+        assert list_response.json()["counts"]["pending"] >= 1
+
+        assert client.get("/fcm-test/outbox/01KH2YQ2VE0000000000000000").status_code == 404
+
+        # 다른 사용자가 등록한 항목은 보이지 않음
+        current_user.username = "otheruser"
+        assert client.get(f"/fcm-test/outbox/{entry['id']}").status_code == 404
+        other_list = client.get("/fcm-test/outbox").json()
+        assert entry["id"] not in [item["id"] for item in other_list["entries"]]
+    finally:
+        config.FCM_TEST_PROXY_ENABLED = original_enabled
+        app.dependency_overrides.pop(get_optional_current_user, None)
@@ -0,0 +1,248 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError, RetryBudget
+from app.core.config import config
+from app.core.database import Base
+from app.core.http_pool import HttpConnectError, HttpConnectionLostError, HttpResponse, HttpTransportError
+from app.modules.auth.dependencies import get_current_user
+from app.modules.notification_test import service as notification_service
+from app.modules.notification_test.outbox import NotificationOutboxDispatcher, NotificationOutboxService
+from app.modules.notification_test.repository import NotificationOutboxRepository
+from app.modules.notification_test.router import get_optional_current_user
+from app.modules.notification_test.service import (
+    NotificationCircuitOpenError,
+    NotificationProxyError,
+    NotificationProxyService,
+)
+from main import app
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class ScriptedHttpClient:
+    """미리 정한 응답/예외를 순서대로 돌려주는 클라이언트"""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def request(self, method, url, body=None, headers=None, timeout=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep(monkeypatch):
+    monkeypatch.setattr(config, "TVCF_NOTIFICATION_RETRY_BACKOFF_BASE_SECONDS", 0)
+    monkeypatch.setattr(config, "TVCF_NOTIFICATION_RETRY_BACKOFF_MAX_SECONDS", 0)
+
+
+def _service(http_client, breaker=None, budget=None, max_retries=2):
+    return NotificationProxyService(
+        base_url="http://notification.test",
+        device_path="/v1/devices",
+        subscription_path="/v1/subscriptions",
+        send_user_path="/v1/messages:sendUser",
+        send_definition_path="/v1/messages:sendDefinition",
+        auth_token=None,
+        user_agent="test",
+        timeout_seconds=3,
+        http_client=http_client,
+        circuit_breaker=breaker or CircuitBreaker(failure_threshold=3, recovery_seconds=30),
+        retry_budget=budget or RetryBudget(ratio=1.0, min_per_second=10),
+        max_retries=max_retries,
+    )
+
+
+def test_breaker_opens_after_threshold_and_probes_after_recovery():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=10, half_open_max_calls=1, clock=clock)
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_after_seconds == 10
+
+    clock.now += 10
+    assert breaker.state == "half_open"
+    breaker.before_call()  # 시험 호출 1건만 허용
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_failure()  # 시험 호출 실패 -> 다시 open
+    assert breaker.state == "open"
+    clock.now += 10
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.stats()["opened_count"] == 2
+    assert breaker.stats()["rejected"] == 2
+
+
+def test_half_open_slot_is_released_when_the_request_raises_unexpectedly():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=10, half_open_max_calls=1, clock=clock)
+    breaker.record_failure()
+    clock.now += 10
+
+    http_client = ScriptedHttpClient([ValueError("Invalid header value"), HttpResponse(200, b"{}")])
+    service = _service(http_client, breaker=breaker)
+    with pytest.raises(ValueError):
+        service.send_user_message("quizuser", "TPL-1")
+
+    # 시험 슬롯이 반환되어 다음 시험 호출을 보낼 수 있음
+    assert breaker.state == "half_open"
+    assert service.send_user_message("quizuser", "TPL-1").status_code == 200
+    assert breaker.state == "closed"
+
+
+def test_retry_budget_limits_retries_to_ratio_of_requests():
+    clock = FakeClock()
+    budget = RetryBudget(ratio=0.5, min_per_second=0, clock=clock)
+
+    for _ in range(4):
+        budget.record_request()
+
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+    assert budget.stats()["exhausted"] == 1
+
+
+def test_connect_failures_are_retried_until_success():
+    http_client = ScriptedHttpClient(
+        [HttpConnectError("connect failed"), HttpConnectError("connect failed"), HttpResponse(200, b"{}")]
+    )
+
+    result = _service(http_client).send_user_message("quizuser", "TPL-1")
+
+    assert result.status_code == 200
+    assert http_client.calls == 3
+
+
+def test_lost_keep_alive_connection_is_retried_within_budget():
+    http_client = ScriptedHttpClient([HttpConnectionLostError("connection lost"), HttpResponse(200, b"{}")])
+    result = _service(http_client).send_user_message("quizuser", "TPL-1")
+    assert (result.status_code, http_client.calls) == (200, 2)
+
+    exhausted_client = ScriptedHttpClient([HttpConnectionLostError("connection lost"), HttpResponse(200, b"{}")])
+    with pytest.raises(NotificationProxyError):
+        _service(exhausted_client, budget=RetryBudget(ratio=0, min_per_second=0)).send_user_message("quizuser", "TPL-1")
+    assert exhausted_client.calls == 1
+
+
+def test_read_timeouts_and_server_errors_are_not_retried():
+    # 요청이 서버에 전달됐을 수 있으므로 다시 보내면 중복 발송될 수 있음
+    timeout_client = ScriptedHttpClient([HttpTransportError("timed out")])
+    with pytest.raises(NotificationProxyError):
+        _service(timeout_client).send_user_message("quizuser", "TPL-1")
+
+    error_client = ScriptedHttpClient([HttpResponse(500, b"{}")])
+    with pytest.raises(NotificationProxyError) as exc_info:
+        _service(error_client).send_user_message("quizuser", "TPL-1")
+
+    assert (timeout_client.calls, error_client.calls) == (1, 1)
+    assert exc_info.value.status_code == 500
+
+
+def test_retries_stop_when_budget_is_exhausted():
+    http_client = ScriptedHttpClient([HttpResponse(503, b"{}")])
+    budget = RetryBudget(ratio=0, min_per_second=0)
+
+    with pytest.raises(NotificationProxyError):
+        _service(http_client, budget=budget, max_retries=5).send_user_message("quizuser", "TPL-1")
+
+    assert http_client.calls == 1
+
+
+def test_open_circuit_fails_fast_without_calling_notification_be():
+    http_client = ScriptedHttpClient([HttpTransportError("timed out")])
+    breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=30)
+    service = _service(http_client, breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(NotificationProxyError):
+            service.send_user_message("quizuser", "TPL-1")
+    with pytest.raises(NotificationCircuitOpenError):
+        service.send_user_message("quizuser", "TPL-1")
+
+    assert http_client.calls == 2
+
+
+def test_client_errors_do_not_open_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=30)
+    service = _service(ScriptedHttpClient([HttpResponse(400, b"{}")]), breaker=breaker)
+
+    for _ in range(3):
+        with pytest.raises(NotificationProxyError):
+            service.send_user_message("quizuser", "TPL-1")
+
+    assert breaker.state == "closed"
+
+
+def test_send_route_returns_503_while_circuit_is_open(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=30)
+    breaker.record_failure()
+    monkeypatch.setattr(notification_service, "_circuit_breaker", breaker)
+    monkeypatch.setattr(config, "FCM_TEST_PROXY_ENABLED", True)
+    monkeypatch.setattr(config, "METRICS_ALLOWED_USERS", ["quizuser"])
+    current_user = type("FakeUser", (), {"username": "quizuser"})()
+    app.dependency_overrides[get_optional_current_user] = lambda: current_user
+    app.dependency_overrides[get_current_user] = lambda: current_user
+    try:
+        response = TestClient(app).post("/fcm-test/send", json={"template_code": "TPL-1"})
+        metrics = TestClient(app).get("/metrics/get").json()
+    finally:
+        app.dependency_overrides.pop(get_optional_current_user, None)
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == 503
+    assert 1 <= int(response.headers["retry-after"]) <= 30
+    assert metrics["data"]["notification"]["circuit_breaker"]["state"] == "open"
+
+
+def test_outbox_defers_and_pauses_without_using_attempts_while_circuit_is_open():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(engine, expire_on_commit=False)
+    with session_factory() as db:
+        outbox_service = NotificationOutboxService(NotificationOutboxRepository(db))
+        entries = [outbox_service.enqueue_user_message(f"user{index}", "TPL-1") for index in range(3)]
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=30)
+    breaker.record_failure()
+    http_client = ScriptedHttpClient([HttpResponse(200, b"{}")])
+    dispatcher = NotificationOutboxDispatcher(
+        session_factory,
+        lambda: _service(http_client, breaker=breaker),
+        batch_size=10,
+        poll_seconds=60,
+        max_attempts=3,
+        backoff_base_seconds=1,
+        backoff_max_seconds=1,
+        lease_seconds=30,
+    )
+
+    assert dispatcher.run_once() == 1
+    assert dispatcher.run_once() == 0  # 차단 해제 시점까지는 행을 꺼내지 않음
+
+    with session_factory() as db:
+        repo = NotificationOutboxRepository(db)
+        saved = [repo.get(entry.id) for entry in entries]
+    assert http_client.calls == 0
+    assert [(entry.status, entry.attempts) for entry in saved] == [("pending", 0)] * 3
+    assert saved[0].next_attempt_at > saved[1].next_attempt_at
+    assert dispatcher.stats()["deferred"] == 1
@@ -1,17 +1,18 @@
-import io
+import asyncio
 import json
-from urllib.error import HTTPError
+import threading
 
 import jwt
 import pytest
 from fastapi.testclient import TestClient
 
 from app.core.config import config
+from app.core.http_pool import HttpResponse
 from app.modules.notification_test import service as notification_service
+from app.modules.notification_test.executor import NotificationCallExecutor, NotificationProxyBusyError
 from app.modules.notification_test.router import get_optional_current_user
 from main import app
 
-
 CONFIG_FIELDS = (
     "FCM_TEST_PROXY_ENABLED",
     "TVCF_NOTIFICATION_BASE_URL",
@@ -27,19 +28,31 @@ CONFIG_FIELDS = (
 )
 
 
-class FakeResponse:
-    def __init__(self, status: int, body: dict):
-        self.status = status
-        self._body = json.dumps(body).encode("utf-8")
+class FakeRequest:
+    def __init__(self, method: str, url: str, body: bytes, headers: dict, timeout: float | None):
+        self.method = method
+        self.full_url = url
+        self.data = body
+        self.headers = {key.lower(): value for key, value in headers.items()}
+        self.timeout = timeout
+
+
+class FakeHttpClient:
+    """KeepAliveHttpClient 대신 요청을 handler로 넘기는 가짜 클라이언트"""
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def request(self, method, url, body=None, headers=None, timeout=None):
+        return self.handler(FakeRequest(method, url, body, headers or {}, timeout))
+
 
-    def __enter__(self):
-        return self
+def FakeResponse(status: int, body: dict) -> HttpResponse:
+    return HttpResponse(status, json.dumps(body).encode("utf-8"))
 
-    def __exit__(self, exc_type, exc, traceback):
-        return False
 
-    def read(self):
-        return self._body
+def install_fake_client(monkeypatch, handler) -> None:
+    monkeypatch.setattr(notification_service, "get_http_client", lambda: FakeHttpClient(handler))
 
 
 @pytest.fixture
@@ -54,10 +67,11 @@ def restore_config():
     for field, value in original_values.items():
         setattr(config, field, value)
     app.dependency_overrides.pop(get_optional_current_user, None)
+    notification_service.get_circuit_breaker().reset()
 
 
 def _headers(request):
-    return {key.lower(): value for key, value in request.header_items()}
+    return request.headers
 
 
 def override_current_user(username: str) -> None:
@@ -98,14 +112,14 @@ def test_register_device_posts_logged_in_user_to_notification_be(client, monkeyp
     config.TVCF_NOTIFICATION_TIMEOUT_SECONDS = 3
     override_current_user("quizuser")
 
-    def fake_urlopen(outbound_request, timeout):
+    def fake_send(outbound_request):
         captured["url"] = outbound_request.full_url
         captured["body"] = json.loads(outbound_request.data.decode("utf-8"))
         captured["headers"] = _headers(outbound_request)
-        captured["timeout"] = timeout
+        captured["timeout"] = outbound_request.timeout
         return FakeResponse(201, {"code": "DEVICE-1", "token": "fcm-token"})
 
-    monkeypatch.setattr(notification_service.request, "urlopen", fake_urlopen)
+    install_fake_client(monkeypatch, fake_send)
 
     response = client.post(
         "/fcm-test/register-device",
@@ -135,14 +149,14 @@ def test_register_device_uses_logged_in_user_and_browser_user_agent(client, monk
     config.TVCF_NOTIFICATION_TIMEOUT_SECONDS = 3
     override_current_user("edgeuser")
 
-    def fake_urlopen(outbound_request, timeout):
+    def fake_send(outbound_request):
         captured["url"] = outbound_request.full_url
         captured["body"] = json.loads(outbound_request.data.decode("utf-8"))
         captured["headers"] = _headers(outbound_request)
-        captured["timeout"] = timeout
+        captured["timeout"] = outbound_request.timeout
         return FakeResponse(200, {"code": "DEVICE-1", "token": "fcm-token"})
 
-    monkeypatch.setattr(notification_service.request, "urlopen", fake_urlopen)
+    install_fake_client(monkeypatch, fake_send)
 
     response = client.post(
         "/fcm-test/register-device",
@@ -178,7 +192,7 @@ def test_send_posts_logged_in_user_and_template_code_to_notification_be(client,
     config.TVCF_NOTIFICATION_SEND_USER_PATH = "/v1/messages:sendUser"
     override_current_user("quizuser")
 
-    def fake_urlopen(outbound_request, timeout):
+    def fake_send(outbound_request):
         captured["url"] = outbound_request.full_url
         captured["body"] = json.loads(outbound_request.data.decode("utf-8"))
         captured["headers"] = _headers(outbound_request)
@@ -192,7 +206,7 @@ def test_send_posts_logged_in_user_and_template_code_to_notification_be(client,
             },
         )
 
-    monkeypatch.setattr(notification_service.request, "urlopen", fake_urlopen)
+    install_fake_client(monkeypatch, fake_send)
 
     response = client.post(
         "/fcm-test/send",
@@ -239,13 +253,13 @@ def test_subscribe_definition_posts_logged_in_user_and_definition_code_to_notifi
     config.TVCF_NOTIFICATION_SUBSCRIPTION_PATH = "/v1/subscriptions"
     override_current_user("quizuser")
 
-    def fake_urlopen(outbound_request, timeout):
+    def fake_send(outbound_request):
         captured["url"] = outbound_request.full_url
         captured["body"] = json.loads(outbound_request.data.decode("utf-8"))
         captured["headers"] = _headers(outbound_request)
         return FakeResponse(201, {"code": "SUB-1", "user_id": "quizuser", "definition_code": "DEF-1"})
 
-    monkeypatch.setattr(notification_service.request, "urlopen", fake_urlopen)
+    install_fake_client(monkeypatch, fake_send)
 
     response = client.post(
         "/fcm-test/subscribe-definition",
@@ -271,11 +285,11 @@ def test_subscribe_definition_uses_default_definition_code(client, monkeypatch):
     config.FCM_TEST_DEFINITION_CODE = "DEF-ENV"
     override_current_user("quizuser")
 
-    def fake_urlopen(outbound_request, timeout):
+    def fake_send(outbound_request):
         captured["body"] = json.loads(outbound_request.data.decode("utf-8"))
         return FakeResponse(201, {"code": "SUB-1", "user_id": "quizuser", "definition_code": "DEF-ENV"})
 
-    monkeypatch.setattr(notification_service.request, "urlopen", fake_urlopen)
+    install_fake_client(monkeypatch, fake_send)
 
     response = client.post("/fcm-test/subscribe-definition", json={})
 
@@ -310,7 +324,7 @@ def test_send_definition_posts_definition_and_template_code_to_notification_be(c
     config.TVCF_NOTIFICATION_SEND_DEFINITION_PATH = "/v1/messages:sendDefinition"
     override_current_user("quizuser")
 
-    def fake_urlopen(outbound_request, timeout):
+    def fake_send(outbound_request):
         captured["url"] = outbound_request.full_url
         captured["body"] = json.loads(outbound_request.data.decode("utf-8"))
         captured["headers"] = _headers(outbound_request)
@@ -324,7 +338,7 @@ def test_send_definition_posts_definition_and_template_code_to_notification_be(c
             },
         )
 
-    monkeypatch.setattr(notification_service.request, "urlopen", fake_urlopen)
+    install_fake_client(monkeypatch, fake_send)
 
     response = client.post(
         "/fcm-test/send-definition",
@@ -353,7 +367,7 @@ def test_send_definition_uses_default_codes(client, monkeypatch):
     config.FCM_TEST_TEMPLATE_CODE = "TPL-ENV"
     override_current_user("quizuser")
 
-    def fake_urlopen(outbound_request, timeout):
+    def fake_send(outbound_request):
         captured["body"] = json.loads(outbound_request.data.decode("utf-8"))
         return FakeResponse(
             200,
@@ -365,7 +379,7 @@ def test_send_definition_uses_default_codes(client, monkeypatch):
             },
         )
 
-    monkeypatch.setattr(notification_service.request, "urlopen", fake_urlopen)
+    install_fake_client(monkeypatch, fake_send)
 
     response = client.post("/fcm-test/send-definition", json={})
 
@@ -403,16 +417,10 @@ def test_notification_be_error_is_wrapped_as_502(client, monkeypatch):
     config.TVCF_NOTIFICATION_SEND_USER_PATH = "/v1/messages:sendUser"
     override_current_user("quizuser")
 
-    def fake_urlopen(outbound_request, timeout):
-        raise HTTPError(
-            url=outbound_request.full_url,
-            code=500,
-            msg="Internal Server Error",
-            hdrs={},
-            fp=io.BytesIO(b'{"detail":"boom"}'),
-        )
+    def fake_send(outbound_request):
+        return HttpResponse(500, b'{"detail":"boom"}')
 
-    monkeypatch.setattr(notification_service.request, "urlopen", fake_urlopen)
+    install_fake_client(monkeypatch, fake_send)
 
     response = client.post(
         "/fcm-test/send",
@@ -436,3 +444,51 @@ def test_fcm_test_proxy_disabled_returns_404(client):
     )
 
     assert response.status_code == 404
+
+
+def test_shared_http_client_uses_configured_pool_and_timeouts(monkeypatch):
+    monkeypatch.setattr(notification_service, "_http_client", None)
+    monkeypatch.setattr(config, "TVCF_NOTIFICATION_POOL_SIZE", 4)
+    monkeypatch.setattr(config, "TVCF_NOTIFICATION_CONNECT_TIMEOUT_SECONDS", 1.5)
+    monkeypatch.setattr(config, "TVCF_NOTIFICATION_TIMEOUT_SECONDS", 7)
+
+    http_client = notification_service.get_http_client()
+
+    assert notification_service.get_http_client() is http_client
+    assert (http_client.pool_size, http_client.connect_timeout, http_client.read_timeout) == (4, 1.5, 7)
+    notification_service.close_http_client()
+    assert notification_service._http_client is None
+
+
+def test_executor_limits_concurrent_calls_and_rejects_when_queue_full():
+    executor = NotificationCallExecutor(max_concurrency=1, queue_limit=1)
+    release = threading.Event()
+
+    async def scenario():
+        blocking = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(lambda: "queued"))
+        await asyncio.sleep(0.05)
+        assert executor.stats()["running"] == 1
+        with pytest.raises(NotificationProxyBusyError):
+            await executor.run(lambda: "rejected")
+        release.set()
+        return await blocking, await queued
+
+    assert asyncio.run(scenario()) == (True, "queued")
+    executor.shutdown()
+    assert executor.stats()["rejected"] == 1
+    assert executor.stats()["completed"] == 2
+
+
+def test_send_returns_503_when_notification_calls_are_saturated(client, monkeypatch):
+    config.FCM_TEST_PROXY_ENABLED = True
+    override_current_user("quizuser")
+    executor = NotificationCallExecutor(max_concurrency=1, queue_limit=1)
+    executor._queued = 1  # 대기열이 이미 가득 찬 상태
+    monkeypatch.setattr(notification_service, "notification_executor", executor)
+    install_fake_client(monkeypatch, lambda outbound_request: FakeResponse(200, {}))
+
+    response = client.post("/fcm-test/send", json={"template_code": "TPL-1"})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
@@ -0,0 +1,137 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.config import config
+from app.core.database import SessionLocal
+from app.models import Quiz, Score, User
+from app.modules.quiz.catalog import load_quiz_catalog
+from app.modules.quiz.repository import QuizRepository
+from main import app
+
+QUIZZES = [
+    ("01KH2YQ2VEAAW3HHBQ684D48ZE", "자바 플랫폼을 위한 오픈소스 프레임워크는?", "Spring/스프링", "Java"),
+    ("01KH2YQ2VEVWWGM0VHMJCP4YMC", "객체를 외부에서 주입하는 개념은?", "DI/의존성 주입", "Java"),
+    ("01KH2YQ2VETJYKN87HM450CK5M", "공통 관심사를 분리하는 개념은?", "AOP", "Corp"),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seed_quizzes():
+    with SessionLocal() as session:
+        for quiz_id, question, answer, category in QUIZZES:
+            session.merge(Quiz(id=quiz_id, question=question, explanation="-", answer=answer, category=category))
+        session.commit()
+    load_quiz_catalog()
+
+
+@pytest.fixture(params=[True, False], ids=["async-db", "sync-db"])
+def client(request):
+    original = config.DATABASE_ASYNC_ENABLED
+    config.DATABASE_ASYNC_ENABLED = request.param
+    yield TestClient(app)
+    config.DATABASE_ASYNC_ENABLED = original
+
+
+def _signup_and_login(client) -> tuple[str, dict]:
+    username = f"u{uuid.uuid4().hex[:10]}"
+    email = f"{username}@example.com"
+
+    signup = client.post("/auth/signup", json={"username": username, "email": email, "password": "pw1234"})
+    assert signup.status_code == 200
+
+    login = client.post("/auth/login", json={"email": email, "password": "pw1234"})
+    assert login.status_code == 200
+    return username, {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+def test_quiz_flow_submits_score_and_shows_ranking(client, monkeypatch):
+    username, headers = _signup_and_login(client)
+
+    quizzes = client.get("/quiz/get", params={"category": "Java"}, headers=headers)
+    assert quizzes.status_code == 200
+    assert {item["id"] for item in quizzes.json()["data"]} == {QUIZZES[0][0], QUIZZES[1][0]}
+
+    submit = client.post(
+        "/quiz/submit",
+        headers=headers,
+        json={"category": "Java", "user_answers": {QUIZZES[0][0]: "스프링", QUIZZES[1][0]: "wrong"}},
+    )
+    assert submit.status_code == 200
+    assert submit.json()["score"] == 50.0
+    assert submit.json()["message"] == "새 점수 저장 성공"
+
+    resubmit = client.post(
+        "/quiz/submit",
+        headers=headers,
+        json={"category": "Java", "user_answers": {QUIZZES[0][0]: "spring", QUIZZES[1][0]: "의존성주입"}},
+    )
+    assert resubmit.json()["message"] == "기존 점수 업데이트 성공"
+
+    ranking = client.get("/ranking/get", params={"category": "Java", "limit": 100})
+    assert ranking.status_code == 200
+    mine = [item for item in ranking.json()["ranking"] if item["username"] == username]
+    assert [item["score"] for item in mine] == [100]
+
+    me = client.get("/ranking/me", params={"category": "Java", "neighbors": 2}, headers=headers)
+    assert me.status_code == 200
+    assert me.json()["me"]["username"] == username
+    assert me.json()["me"]["score"] == 100
+    assert any(item["username"] == username for item in me.json()["neighbors"])
+    assert client.get("/ranking/me", params={"category": "Corp"}, headers=headers).status_code == 404
+
+    assert client.get("/ranking/verify", params={"category": "Java"}).status_code == 401
+    assert client.get("/ranking/verify", params={"category": "Java"}, headers=headers).status_code == 403
+
+    monkeypatch.setattr(config, "RANKING_CONSISTENCY_CHECK_ALLOWED_USERS", [username])
+    verify = client.get("/ranking/verify", params={"category": "Java", "limit": 1000}, headers=headers)
+    assert verify.status_code == 200
+    assert verify.json()["consistent"] is True, verify.json()["mismatches"]
+
+
+def test_metrics_require_an_allowed_user(client, monkeypatch):
+    username, headers = _signup_and_login(client)
+
+    assert client.get("/metrics/get").status_code == 401
+    assert client.get("/metrics/get", headers=headers).status_code == 403
+
+    monkeypatch.setattr(config, "METRICS_ALLOWED_USERS", [username])
+    metrics = client.get("/metrics/get", headers=headers)
+    assert metrics.status_code == 200
+    assert "grading" in metrics.json()["data"]
+
+
+def test_duplicate_signup_is_rejected(client):
+    username = f"u{uuid.uuid4().hex[:10]}"
+    body = {"username": username, "email": f"{username}@example.com", "password": "pw1234"}
+
+    assert client.post("/auth/signup", json=body).status_code == 200
+    duplicate = client.post("/auth/signup", json=body)
+
+    assert duplicate.status_code == 400
+    assert duplicate.json()["detail"] == "이미 존재하는 이메일입니다."
+
+
+def test_concurrent_upserts_keep_single_score_row():
+    with SessionLocal() as session:
+        user = User(username=f"u{uuid.uuid4().hex[:10]}", email=f"{uuid.uuid4().hex}@example.com", hashed_password="x")
+        session.add(user)
+        session.commit()
+        user_id = user.id
+
+    def submit(score: int) -> str:
+        with SessionLocal() as session:
+            return QuizRepository(session).upsert_score(user_id, "Java", score).action
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(submit, range(10, 90, 10)))
+
+    assert results.count("insert") == 1
+    assert results.count("update") == 7
+    with SessionLocal() as session:
+        rows = session.scalars(select(Score).where(Score.user_id == user_id)).all()
+    assert len(rows) == 1
+    assert rows[0].created_at is not None
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from app.modules.quiz import service as quiz_service_module
+from app.modules.quiz.catalog import QuizCatalog
+from app.modules.quiz.service import QuizService
+
+ROWS = [
+    {"id": f"01KH2YQ2VE{i:016d}", "question": f"Q{i}", "explanation": f"E{i}", "answer": f"A{i}", "category": category}
+    for i, category in enumerate(
+        ["Java", "Java", "Python", "Corp", "Bidding", "Message", "ADmarket", "", *["Python"] * 12],
+    )
+]
+
+
+@pytest.fixture
+def catalog(monkeypatch):
+    catalog = QuizCatalog(version=1, rows=ROWS)
+    monkeypatch.setattr(quiz_service_module, "get_quiz_catalog", lambda: catalog)
+    return catalog
+
+
+def test_catalog_groups_by_canonical_category(catalog):
+    assert catalog.categories == ["ADmarket", "Java", "Python"]
+    assert len(catalog.get_quizzes("ADmarket")) == 4
+    assert len(catalog.get_quizzes("Java")) == 2
+    assert catalog.get_quizzes("Corp") == []
+    assert len(catalog) == len(ROWS)
+    assert catalog.get_quiz(ROWS[0]["id"])["answer"] == "A0"
+
+
+def test_service_serves_categories_and_quizzes_from_catalog(catalog):
+    service = QuizService(repo=None)
+
+    assert asyncio.run(service.get_categories()) == ["ADmarket", "Java", "Python"]
+
+    admarket = asyncio.run(service.get_quizzes("Bidding"))
+    assert {item.id for item in admarket} == {row["id"] for row in ROWS[3:7]}
+
+    overall = asyncio.run(service.get_quizzes("전체"))
+    assert len(overall) == QuizService.QUIZ_COUNT_PER_GAME
+    assert len({item.id for item in overall}) == QuizService.QUIZ_COUNT_PER_GAME
+
+
+def test_sampler_draws_distinct_ids_and_is_reproducible_with_seed(catalog):
+    sampler = catalog.sampler
+
+    first = sampler.sample(10, seed=42)
+    assert len(first) == 10
+    assert len(set(first)) == 10
+    assert first == sampler.sample(10, seed=42)
+
+    assert sorted(sampler.sample(100, category="Java")) == sorted(r["id"] for r in ROWS[:2])
+    assert sampler.sample(3, category="Unknown") == []
+    assert sampler.population_size() == len(ROWS)
+
+
+def test_overall_quizzes_follow_seed(catalog):
+    service = QuizService(repo=None)
+
+    first = asyncio.run(service.get_quizzes(None, seed=7))
+    second = asyncio.run(service.get_quizzes("전체", seed=7))
+    assert [item.id for item in first] == [item.id for item in second]
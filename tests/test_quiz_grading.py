@@ -0,0 +1,140 @@
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import pytest
+
+from app.core.cache import LRUCache
+from app.core.config import Config
+from app.core.csv_sync import iter_quiz_csv
+from app.modules.quiz import grading
+from app.modules.quiz.grading import CompiledAnswer, _similarity_threshold, is_answer_accepted
+from app.modules.quiz.similarity import SIMILARITY_MODE_COMPAT, bounded_edit_distance, is_similar
+
+CATALOG_CSV = Path(__file__).resolve().parent.parent / "csv_files" / "quiz_data.csv"
+
+
+@pytest.mark.parametrize(
+    ("user_answer", "answer_field", "expected"),
+    [
+        ("spring", "Spring/스프링", True),
+        ("스프링", "Spring/스프링", True),
+        ("  SPRING ", "Spring/스프링", True),
+        ("sprnig", "Spring/스프링", True),
+        ("summer", "Spring/스프링", False),
+        ("의존성주입", "DI/의존성 주입", True),
+        ("10 개", "10", True),
+        ("11", "10", False),
+        ("get", "GET", True),
+        ("gat", "GET", False),
+        ("", "Spring", False),
+    ],
+)
+def test_answer_acceptance(user_answer, answer_field, expected):
+    assert is_answer_accepted(user_answer, answer_field) is expected
+    assert CompiledAnswer(answer_field).accepts(user_answer) is expected
+
+
+def test_compiled_answer_precomputes_candidates():
+    compiled = CompiledAnswer("AOP/관점지향 프로그래밍/AOP")
+
+    assert [candidate.text for candidate in compiled.candidates] == ["aop", "관점지향 프로그래밍"]
+    assert compiled.candidates[1].compact == "관점지향프로그래밍"
+    assert compiled.candidates[1].tokens == ["관점지향", "프로그래밍"]
+    assert CompiledAnswer("").accepts("anything") is False
+
+
+def test_bounded_edit_distance_stops_at_bound():
+    assert bounded_edit_distance("spring", "spring", 0) == 0
+    assert bounded_edit_distance("spring", "sprng", 2) == 1
+    assert bounded_edit_distance("spring", "sprint", 2) == 2
+    assert bounded_edit_distance("spring", "sprint", 1) is None
+    assert bounded_edit_distance("a" * 50, "b" * 50, 3) is None
+    assert bounded_edit_distance("abc", "abcdefgh", 2) is None
+
+
+@pytest.mark.parametrize("mode", ["compat", "levenshtein"])
+@pytest.mark.parametrize(
+    ("a", "b"),
+    [
+        ("sprnig", "spring"),
+        ("dependencyinjection", "dependencyinjectoin"),
+        ("httpbearer", "htpbeerar"),
+        ("usestate", "usesate"),
+        ("관점지향프로그래밍", "관점지향프로그램"),
+        ("abcd", "wxyz"),
+    ],
+)
+def test_similarity_modes_agree_with_sequence_matcher(mode, a, b):
+    threshold = _similarity_threshold(max(len(a), len(b)))
+    expected = SequenceMatcher(None, a, b).ratio() >= threshold
+
+    if mode == "compat" or expected:
+        assert is_similar(a, b, threshold, mode=mode) is expected
+
+
+def _catalog_typo_probes():
+    """카탈로그 정답 후보마다 (한 글자 삭제, 인접 문자 교환, 삭제 + 교환) 오타를 만든 (사용자 답, 정답) 쌍"""
+    candidates = {
+        candidate.compact
+        for record in iter_quiz_csv(str(CATALOG_CSV))
+        for candidate in CompiledAnswer(record.answer).candidates
+        if candidate.compact
+    }
+
+    def deletions(word):
+        return {word[:i] + word[i + 1 :] for i in range(len(word))}
+
+    def swaps(word):
+        return {word[:i] + word[i + 1] + word[i] + word[i + 2 :] for i in range(len(word) - 1)}
+
+    probes = set()
+    for candidate in candidates:
+        probes.update((typo, candidate) for typo in swaps(candidate))
+        for deleted in deletions(candidate):
+            probes.update((typo, candidate) for typo in swaps(deleted) | {deleted})
+    return sorted(probes)
+
+
+def test_default_similarity_mode_keeps_sequence_matcher_verdicts_over_the_catalog():
+    assert Config.model_fields["GRADING_SIMILARITY_MODE"].default == SIMILARITY_MODE_COMPAT
+
+    probes = _catalog_typo_probes()
+    assert len(probes) > 10000
+    changed, levenshtein_changed = [], []
+    for user, candidate in probes:
+        threshold = _similarity_threshold(max(len(user), len(candidate)))
+        expected = SequenceMatcher(None, user, candidate).ratio() >= threshold
+        if is_similar(user, candidate, threshold, mode="compat") is not expected:
+            changed.append((user, candidate))
+        levenshtein = is_similar(user, candidate, threshold, mode="levenshtein")
+        assert levenshtein or not expected  # levenshtein은 기존에 통과하던 답을 떨어뜨리지 않음
+        if levenshtein is not expected:
+            levenshtein_changed.append((user, candidate))
+
+    assert changed == []
+    # levenshtein은 기존에 탈락하던 답 일부를 통과시키므로 기본값이 될 수 없음
+    assert ("jsonrsepose", "jsonresponse") in levenshtein_changed
+
+
+def test_grade_answer_caches_verdict_per_catalog_version(monkeypatch):
+    monkeypatch.setattr(grading, "verdict_cache", LRUCache(max_size=10))
+    compiled = CompiledAnswer("Spring/스프링")
+    calls = []
+    original = CompiledAnswer.accepts_normalized
+
+    def counting_accepts(self, user):
+        calls.append(user)
+        return original(self, user)
+
+    monkeypatch.setattr(CompiledAnswer, "accepts_normalized", counting_accepts)
+
+    assert grading.grade_answer("Q1", 1, compiled, "Spring") is True
+    assert grading.grade_answer("Q1", 1, compiled, "  spring ") is True
+    assert grading.grade_answer("Q1", 1, compiled, "summer") is False
+    assert grading.grade_answer("Q1", 1, compiled, "summer") is False
+    assert calls == ["spring", "summer"]
+    assert grading.verdict_cache.stats()["hits"] == 2
+
+    # CSV 재적재로 카탈로그 버전이 바뀌면 이전 판정을 재사용하지 않음
+    assert grading.grade_answer("Q1", 2, CompiledAnswer("Summer"), "summer") is True
+    assert calls == ["spring", "summer", "summer"]
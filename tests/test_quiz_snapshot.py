@@ -0,0 +1,149 @@
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import csv_listener, csv_shards
+from app.core.config import config
+from app.core.csv_shards import ShardedCatalogSync
+from app.core.csv_sync import bump_catalog_version
+from app.core.database import Base
+from app.core.ulid import generate_ulid
+from app.modules.quiz import catalog as catalog_module
+from app.modules.quiz.catalog import QuizCatalog
+from app.modules.quiz.snapshot import QuizSnapshot, SnapshotShard, write_snapshot
+
+HEADER = "id,question,explanation,answer,category\n"
+ROWS = [
+    {"id": generate_ulid(), "question": f"Q{i}", "explanation": "설명", "answer": answer, "category": category}
+    for i, (answer, category) in enumerate(
+        [("AOP/관점지향 프로그래밍", "Java"), ("Ｓｐｒｉｎｇ ", "Java"), ("42", "Corp"), ("x", "Bidding"), ("y", "")]
+    )
+]
+
+
+def test_snapshot_round_trip_keeps_catalog_and_normalized_answers(tmp_path):
+    original = QuizCatalog(1, ROWS)
+    path = str(tmp_path / "catalog.snapshot")
+    shard = SnapshotShard("java.csv", "ab" * 32, [ROWS[0]["id"], ROWS[1]["id"]])
+    write_snapshot(path, "cd" * 32, 7, original.quizzes, original.category_index(), [shard])
+
+    snapshot = QuizSnapshot.open(path)
+    try:
+        assert (snapshot.source_hash, snapshot.db_version, len(snapshot)) == ("cd" * 32, 7, len(ROWS))
+        assert snapshot.answer_candidates(0) == ["aop", "관점지향 프로그래밍"]
+        assert snapshot.answer_candidates(1) == ["spring"]
+        assert snapshot.shards() == [shard]
+        restored = QuizCatalog.from_snapshot(2, snapshot)
+    finally:
+        snapshot.close()
+
+    assert restored.quizzes == original.quizzes
+    assert restored.categories == original.categories == ["ADmarket", "Java"]
+    assert restored.get_quizzes("ADmarket") == original.get_quizzes("ADmarket")
+    assert restored.sampler.population_size() == original.sampler.population_size()
+    assert restored.compiled_answers[ROWS[0]["id"]].accepts("관점 지향 프로그래밍")
+    assert not restored.compiled_answers[ROWS[2]["id"]].accepts("43")
+
+
+def test_snapshot_restores_precompiled_answers_lazily(tmp_path):
+    original = QuizCatalog(1, ROWS)
+    path = str(tmp_path / "catalog.snapshot")
+    write_snapshot(path, "cd" * 32, 7, original.quizzes, original.category_index())
+
+    snapshot = QuizSnapshot.open(path)
+    restored = QuizCatalog.from_snapshot(2, snapshot)
+    snapshot.close()  # 카탈로그는 닫힌 파일 없이도 채점기를 만들 수 있어야 함
+
+    assert len(restored.compiled_answers) == len(ROWS)
+    assert restored.compiled_answers._compiled == {}  # 적재 시점에는 채점기를 만들지 않음
+    fields = ("text", "compact", "number", "tokens", "is_ascii_word")
+    for row in ROWS:
+        expected = original.compiled_answers[row["id"]]
+        actual = restored.compiled_answers[row["id"]]
+        assert actual.answer_field == expected.answer_field
+        assert [[getattr(c, f) for f in fields] for c in actual.candidates] == [
+            [getattr(c, f) for f in fields] for c in expected.candidates
+        ]
+    assert restored.compiled_answers.get("missing") is None
+
+
+def test_corrupt_or_missing_snapshot_is_ignored(tmp_path):
+    assert QuizSnapshot.open(str(tmp_path / "missing.snapshot")) is None
+
+    path = tmp_path / "broken.snapshot"
+    path.write_bytes(b"not a snapshot at all, just some bytes" * 4)
+    assert QuizSnapshot.open(str(path)) is None
+
+
+@pytest.fixture
+def listener_env(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'snapshot.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    directory = tmp_path / "csv_files"
+    directory.mkdir()
+
+    monkeypatch.setattr(csv_listener, "SessionLocal", session_factory)
+    monkeypatch.setattr(catalog_module, "SessionLocal", session_factory)
+    monkeypatch.setattr(catalog_module, "_catalog", None)  # 테스트 후 원래 카탈로그로 복원
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_PATH", str(tmp_path / "catalog.snapshot"))
+    monkeypatch.setattr(config, "CATALOG_SNAPSHOT_ENABLED", True)
+
+    def new_sync():
+        syncer = ShardedCatalogSync(str(directory), session_factory, parse_workers=1)
+        monkeypatch.setattr(csv_listener, "catalog_sync", syncer)
+        return syncer
+
+    return directory, new_sync
+
+
+def _write_shard(path, rows):
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        file.write(HEADER)
+        file.writelines(
+            f"{row['id']},{row['question']},{row['explanation']},{row['answer']},{row['category']}\n" for row in rows
+        )
+
+
+def test_boot_uses_snapshot_until_csv_changes(listener_env, monkeypatch):
+    directory, new_sync = listener_env
+    _write_shard(directory / "java.csv", ROWS[:2])
+    _write_shard(directory / "corp.csv", ROWS[2:4])
+
+    new_sync()
+    assert csv_listener.restore_catalog_snapshot() is False  # 스냅샷 없음 -> CSV 동기화
+    assert csv_listener.sync_csv_directory().inserted == 4
+
+    # 재시작: CSV를 파싱하지 않고 스냅샷으로 카탈로그를 올림
+    syncer = new_sync()
+    monkeypatch.setattr(csv_shards, "iter_quiz_csv", lambda *a, **kw: pytest.fail("CSV를 다시 파싱함"))
+    started = time.perf_counter()
+    assert csv_listener.restore_catalog_snapshot() is True
+    assert time.perf_counter() - started < 1.0
+    assert {quiz["id"] for quiz in catalog_module.get_quiz_catalog().quizzes} == {row["id"] for row in ROWS[:4]}
+    assert syncer.sync() is None  # 샤드 상태도 복원됨
+
+
+def test_boot_falls_back_to_csv_when_hash_or_db_version_differs(listener_env):
+    directory, new_sync = listener_env
+    _write_shard(directory / "java.csv", ROWS[:2])
+    new_sync()
+    csv_listener.sync_csv_directory()
+
+    _write_shard(directory / "java.csv", ROWS[:3])
+    new_sync()
+    assert csv_listener.restore_catalog_snapshot() is False
+
+    report = csv_listener.sync_csv_directory()
+    assert report.inserted == 1
+    new_sync()
+    assert csv_listener.restore_catalog_snapshot() is True
+
+    # 다른 프로세스가 DB 카탈로그를 바꾼 경우 (CSV는 그대로)
+    with csv_listener.SessionLocal() as session:
+        bump_catalog_version(session)
+        session.commit()
+    new_sync()
+    assert csv_listener.restore_catalog_snapshot() is False
@@ -0,0 +1,185 @@
+import random
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models import User
+from app.modules.quiz.repository import QuizRepository
+from app.modules.ranking import leaderboard as leaderboard_module
+from app.modules.ranking.leaderboard import (
+    CategoryBoard,
+    Leaderboard,
+    LeaderboardRefresher,
+    _sort_key,
+    check_consistency,
+)
+from app.modules.ranking.repository import RankingRepository
+
+
+def _row(user_id, username, category, score, minute):
+    return {
+        "user_id": user_id,
+        "username": username,
+        "category": category,
+        "score": score,
+        "created_at": datetime(2026, 1, 1, 12, minute),
+    }
+
+
+ROWS = [
+    _row("u1", "alice", "Java", 80, 0),
+    _row("u2", "bob", "Java", 90, 1),
+    _row("u3", "carol", "Java", 80, 2),
+    _row("u1", "alice", "Corp", 70, 3),
+    _row("u2", "bob", "Bidding", 95, 4),
+]
+
+
+def test_top_orders_by_score_then_created_at():
+    board = Leaderboard(ROWS)
+
+    assert [(r["username"], r["score"]) for r in board.top("Java", 10)] == [
+        ("bob", 90),
+        ("alice", 80),
+        ("carol", 80),
+    ]
+    assert [r["username"] for r in board.top("Java", 2)] == ["bob", "alice"]
+    assert board.top("Unknown", 10) == []
+
+
+def test_admarket_board_merges_alias_categories_and_all_board_has_everything():
+    board = Leaderboard(ROWS)
+
+    assert [(r["username"], r["category"]) for r in board.top("ADmarket", 10)] == [
+        ("bob", "Bidding"),
+        ("alice", "Corp"),
+    ]
+    assert len(board.top(None, 100)) == len(ROWS)
+
+
+def test_apply_score_replaces_entry_in_place_and_keeps_created_at():
+    board = Leaderboard(ROWS)
+
+    board.apply_score("u3", "carol", "Java", 100, None)
+
+    top = board.top("Java", 10)
+    assert [(r["username"], r["score"]) for r in top] == [("carol", 100), ("bob", 90), ("alice", 80)]
+    assert top[0]["created_at"] == datetime(2026, 1, 1, 12, 2)
+    assert len(board) == len(ROWS)
+
+
+def test_check_consistency_reports_differences():
+    board = Leaderboard(ROWS)
+    sql_rows = board.top("Java", 10)
+
+    assert check_consistency(sql_rows, board.top("Java", 10)) == []
+
+    board.apply_score("u2", "bob", "Java", 10, None)
+    mismatches = check_consistency(sql_rows, board.top("Java", 10))
+    assert any("정렬 불일치" in m for m in mismatches)
+    assert any("메모리에 없는 행" in m for m in mismatches)
+
+
+def test_category_board_rank_and_range_match_sorted_order():
+    rng = random.Random(7)
+    board = CategoryBoard()
+    keys = []
+    for i in range(300):
+        key = _sort_key(f"u{i}", f"user{i}", "Java", rng.randint(0, 100), datetime(2026, 1, 1, 0, i % 60))
+        keys.append(key)
+        board.add(key)
+    for key in keys[::3]:
+        board.remove(key)
+    expected = sorted(set(keys) - set(keys[::3]))
+
+    assert len(board) == len(expected)
+    assert all(board.rank(key) == i for i, key in enumerate(expected, start=1))
+    assert all(board.select(i) == key for i, key in enumerate(expected, start=1))
+    assert board.range(10, 25) == expected[9:25]
+    assert board.range(len(expected) - 2, len(expected) + 5) == expected[-3:]
+    assert board.top(5) == expected[:5]
+
+
+def test_rank_of_returns_rank_total_and_neighbors():
+    board = Leaderboard(ROWS)
+
+    position = board.rank_of("u1", "Java", neighbors=1)
+    assert (position["rank"], position["total"]) == (2, 3)
+    assert position["entry"]["username"] == "alice"
+    assert [(r["rank"], r["username"]) for r in position["neighbors"]] == [(1, "bob"), (2, "alice"), (3, "carol")]
+
+    # ADmarket 보드에서는 같은 사용자의 가장 높은 ADmarket 계열 점수를 기준으로 함
+    assert board.rank_of("u2", "ADmarket", neighbors=0)["entry"]["category"] == "Bidding"
+    assert board.rank_of("u3", "ADmarket") is None
+    assert board.rank_of("nobody", "Java") is None
+
+
+def test_rank_of_all_board_counts_each_user_once():
+    board = Leaderboard(ROWS)
+
+    # 전체 보드는 행 5개지만 사용자별 최고 점수 하나씩만 순위에 넣음
+    position = board.rank_of("u1", None, neighbors=2)
+    assert (position["rank"], position["total"]) == (2, 3)
+    assert [(r["rank"], r["username"], r["category"]) for r in position["neighbors"]] == [
+        (1, "bob", "Bidding"),
+        (2, "alice", "Java"),
+        (3, "carol", "Java"),
+    ]
+    assert board.rank_of("u1", "ADmarket")["total"] == 2
+
+    board.apply_score("u3", "carol", "Corp", 99, datetime(2026, 1, 1, 12, 5))
+    position = board.rank_of("u3", None, neighbors=0)
+    assert (position["rank"], position["total"], position["entry"]["category"]) == (1, 3, "Corp")
+    assert board.rank_of("u1", None)["rank"] == 3
+    assert len(board.top(None, 10)) == 6  # top은 SQL 랭킹과 같이 행 단위
+
+
+def test_rebuild_picks_up_other_writers_and_keeps_scores_applied_meanwhile():
+    leaderboard = Leaderboard([_row("u1", "alice", "Java", 50, 0)])
+
+    def load_rows():
+        # 다시 읽는 동안 이 프로세스에서 저장한 점수
+        leaderboard.apply_score("u3", "carol", "Java", 70, datetime(2026, 1, 1, 12, 2))
+        return [_row("u1", "alice", "Java", 50, 0), _row("u2", "bob", "Java", 90, 1)]
+
+    leaderboard.rebuild(load_rows)
+
+    assert [row["username"] for row in leaderboard.top("Java")] == ["bob", "carol", "alice"]
+
+
+def test_refresher_reloads_only_when_scores_marker_changes(monkeypatch):
+    markers = iter([(1, 50, None), (1, 50, None), (1, 70, None), (1, 70, None)])
+    refreshed = []
+    monkeypatch.setattr(leaderboard_module, "_fetch_scores_marker", lambda: next(markers))
+    monkeypatch.setattr(leaderboard_module, "refresh_leaderboard", lambda: refreshed.append(True))
+
+    refresher = LeaderboardRefresher(interval_seconds=30)
+
+    assert [refresher.refresh_if_changed() for _ in range(4)] == [True, False, True, False]
+    assert len(refreshed) == 2
+
+
+def test_scores_marker_changes_on_insert_and_in_place_update():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.execute(insert(User).values(id="u1", username="alice", email="a@x.io", hashed_password="h"))
+        session.commit()
+        ranking = RankingRepository(session)
+        quizzes = QuizRepository(session)
+
+        empty = ranking.fetch_scores_marker()
+        quizzes.upsert_score("u1", "Java", 50)
+        inserted = ranking.fetch_scores_marker()
+        # created_at은 그대로 두고 점수만 바꾸는 upsert
+        quizzes.upsert_score("u1", "Java", 80)
+        updated = ranking.fetch_scores_marker()
+
+    assert empty[:2] == (0, 0)
+    assert inserted[:2] == (1, 50)
+    assert updated[:2] == (1, 80)
+    assert inserted[2] == updated[2]
+    engine.dispose()
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import exc, func, insert, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base, RoutingSession
+from app.core.sqlite_profile import (
+    READER,
+    WRITER,
+    SharedWriteSlot,
+    apply_sqlite_profile,
+    create_sqlite_engine,
+    is_file_sqlite,
+)
+from app.core.ulid import generate_ulid
+from app.models import Quiz
+
+SETTINGS = SimpleNamespace(
+    SQLITE_SYNCHRONOUS="NORMAL",
+    SQLITE_MMAP_SIZE=8 * 1024 * 1024,
+    SQLITE_CACHE_SIZE=-2000,
+    SQLITE_BUSY_TIMEOUT_MS=5000,
+    SQLITE_READ_POOL_SIZE=4,
+    SQLITE_WRITE_TIMEOUT_SECONDS=10.0,
+)
+
+
+@pytest.fixture
+def engines(tmp_path):
+    url = f"sqlite:///{tmp_path / 'profile.db'}"
+    writer = create_sqlite_engine(url, WRITER, SETTINGS)
+    reader = create_sqlite_engine(url, READER, SETTINGS)
+    Base.metadata.create_all(writer)
+    yield writer, reader
+    writer.dispose()
+    reader.dispose()
+
+
+def _quiz(i):
+    return {"id": generate_ulid(), "question": f"q{i}", "explanation": "e", "answer": "a", "category": "Java"}
+
+
+def test_is_file_sqlite():
+    assert is_file_sqlite("sqlite:///./quiz_app.db")
+    assert not is_file_sqlite("sqlite://")
+    assert not is_file_sqlite("sqlite:///:memory:")
+    assert not is_file_sqlite("postgresql+psycopg2://u:p@localhost/db")
+
+
+def test_pragmas_are_applied_and_reader_is_read_only(engines):
+    writer, reader = engines
+    with writer.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+        assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -2000
+    assert writer.pool.size() == 1
+
+    with reader.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA query_only").scalar() == 1
+        with pytest.raises(exc.OperationalError):
+            conn.execute(insert(Quiz).values(_quiz(0)))
+
+
+def test_routing_session_sends_selects_to_reader(engines):
+    writer, reader = engines
+    factory = sessionmaker(bind=writer, class_=RoutingSession, info={"read_bind": reader})
+
+    with factory() as session:
+        assert session.get_bind(clause=select(Quiz.id)) is reader
+        assert session.get_bind(clause=insert(Quiz)) is writer
+        assert session.get_bind() is writer
+
+        session.add(Quiz(**_quiz(1)))
+        session.commit()  # flush는 쓰기 엔진으로
+        assert session.scalar(select(func.count()).select_from(Quiz)) == 1
+
+
+def test_reads_are_not_blocked_by_writes_and_writers_queue(engines):
+    writer, reader = engines
+    factory = sessionmaker(bind=writer, class_=RoutingSession, info={"read_bind": reader})
+    errors = []
+
+    # 쓰기 트랜잭션이 열려 있어도(WAL) 읽기는 바로 진행됨
+    with writer.connect() as conn:
+        conn.execute(insert(Quiz).values(_quiz(0)))
+        with reader.connect() as read_conn:
+            assert read_conn.execute(text("SELECT count(*) FROM quizzes")).scalar() == 0
+        conn.commit()
+
+    def write_many(worker):
+        try:
+            for i in range(20):
+                with factory() as session:
+                    session.execute(insert(Quiz).values(_quiz(worker * 100 + i)))
+                    session.commit()
+        except Exception as e:  # pragma: no cover - 실패 시 내용 확인용
+            errors.append(e)
+
+    def read_many():
+        try:
+            for _ in range(50):
+                with factory() as session:
+                    session.scalar(select(func.count()).select_from(Quiz))
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=write_many, args=(n,)) for n in range(6)]
+    threads += [threading.Thread(target=read_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM quizzes")).scalar() == 1 + 6 * 20
+
+
+def test_session_reads_its_own_writes_until_the_transaction_ends(engines):
+    writer, reader = engines
+    factory = sessionmaker(bind=writer, class_=RoutingSession, info={"read_bind": reader})
+
+    with factory() as session:
+        session.add(Quiz(**_quiz(1)))
+        session.flush()
+        # 커밋 전 행은 읽기 엔진에서 보이지 않으므로 쓴 뒤의 조회는 쓰기 엔진으로
+        assert session.get_bind(clause=select(Quiz.id)) is writer
+        assert session.scalar(select(func.count()).select_from(Quiz)) == 1
+
+        session.execute(insert(Quiz).values(_quiz(2)))
+        assert session.scalar(select(func.count()).select_from(Quiz)) == 2
+        session.commit()
+
+        assert session.get_bind(clause=select(Quiz.id)) is reader
+        assert session.scalar(select(func.count()).select_from(Quiz)) == 2
+
+
+def test_sync_and_async_writers_share_one_write_slot(tmp_path):
+    url = f"sqlite:///{tmp_path / 'slot.db'}"
+    slot = SharedWriteSlot(timeout_seconds=5)
+    writer = create_sqlite_engine(url, WRITER, SETTINGS, write_slot=slot)
+    Base.metadata.create_all(writer)
+    async_writer = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'slot.db'}", pool_size=1, max_overflow=0)
+    apply_sqlite_profile(async_writer.sync_engine, WRITER, SETTINGS, slot, is_async=True)
+    order = []
+
+    async def async_write():
+        async with async_writer.connect() as conn:
+            order.append("async")
+            await conn.execute(insert(Quiz).values(_quiz(2)))
+            await conn.commit()
+
+    async def scenario():
+        with writer.connect() as conn:
+            conn.execute(insert(Quiz).values(_quiz(1)))
+            task = asyncio.create_task(async_write())
+            # 동기 쓰기 연결을 쓰는 동안 비동기 쓰기는 기다리되 이벤트 루프는 막지 않음
+            await asyncio.sleep(0.05)
+            order.append("sync")
+            conn.commit()
+        await task
+        await async_writer.dispose()
+
+    started = time.monotonic()
+    asyncio.run(scenario())
+
+    with writer.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM quizzes")).scalar() == 2
+    assert order == ["sync", "async"]
+    assert time.monotonic() - started < 5
+    writer.dispose()